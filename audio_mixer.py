@@ -0,0 +1,526 @@
+"""拉取式软件混音引擎
+
+输出后端按自己的节奏向混音器索取固定大小的音频块，混音器用 NumPy 把所有
+活动声部叠加成一块。后端可以是 pygame（声卡）、WAV 文件或空输出，
+因此在没有声卡的机器上同样可以测量每块混音开销与触发延迟。
+
+用法示例:
+    python audio_mixer.py --voices 32 --blocks 2000
+    python audio_mixer.py --voices 0 --strum 6 --max-voices 16
+    python audio_mixer.py --voices 8 --wav mix_test.wav
+"""
+import argparse
+import threading
+import time
+import wave
+import numpy as np
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional
+
+class Voice:
+    """一个发声单元：子类实现 render()，淡出与结束由基类处理"""
+
+    def __init__(self, volume: float = 1.0):
+        self.volume = volume
+        self.finished = False
+        self.trigger_time = None
+        self.group = None
+        self.start_frame = 0
+        self.level = volume
+        self._fade_total = 0
+        self._fade_remaining = None
+
+    def render(self, frames: int) -> np.ndarray:
+        """生成最多 frames 帧音频（(n,) 或 (n, C)），返回少于 frames 帧表示声音结束"""
+        raise NotImplementedError
+
+    @property
+    def releasing(self) -> bool:
+        return self._fade_remaining is not None
+
+    def stop(self, fade_frames: int = 0):
+        """停止发声，fade_frames 大于0时线性淡出以避免爆音"""
+        if fade_frames <= 0:
+            self.finished = True
+        elif self._fade_remaining is None or fade_frames < self._fade_remaining:
+            self._fade_total = self._fade_remaining = fade_frames
+
+    def mix_into(self, out: np.ndarray):
+        """把下一块音频叠加到 out (frames, C)"""
+        frames = len(out)
+        block = self.render(frames)
+        count = len(block)
+        if block.ndim == 1:
+            block = block[:, np.newaxis]
+        elif block.shape[1] != out.shape[1]:
+            # 样本声道数与输出不一致时先混为单声道
+            block = block.mean(axis=1, keepdims=True)
+
+        if count:
+            # 当前电平（本块峰值），供声部抢占时比较
+            self.level = self.volume * float(np.abs(block[:count]).max())
+
+        if self._fade_remaining is not None:
+            count = min(count, self._fade_remaining)
+            start = self._fade_remaining / self._fade_total
+            gain = np.linspace(start, start - count / self._fade_total, count, endpoint=False, dtype=np.float32)
+            out[:count] += block[:count] * (gain[:, np.newaxis] * self.volume)
+            self._fade_remaining -= count
+            if self._fade_remaining <= 0:
+                self.finished = True
+        else:
+            out[:count] += block[:count] * self.volume
+
+        if count < frames:
+            self.finished = True
+
+class SampleVoice(Voice):
+    """播放一段样本：float32 数组，或 int16 的内存映射（按块转换）"""
+
+    def __init__(self, data: np.ndarray, volume: float = 1.0, loop: bool = False):
+        super().__init__(volume)
+        self.data = data
+        self.loop = loop
+        self.position = 0
+        self.scale = np.float32(1 / 32768) if data.dtype == np.int16 else None
+
+    def render(self, frames: int) -> np.ndarray:
+        end = self.position + frames
+        if self.loop and end > len(self.data):
+            indices = np.arange(self.position, end) % len(self.data)
+            self.position = end % len(self.data)
+            block = self.data[indices]
+        else:
+            block = self.data[self.position:end]
+            self.position = min(end, len(self.data))
+        return block * self.scale if self.scale is not None else block
+
+class OutputBackend:
+    """输出后端：open → 反复 write(块) → close
+
+    write() 在可以接收下一块之前阻塞，由此决定混音器的拉取节奏；
+    latency 为写入的块到真正发声之间的缓冲时长（秒）。
+    """
+
+    latency = 0.0
+
+    def open(self, sample_rate: int, channels: int, block_size: int):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_size = block_size
+        self.block_duration = block_size / sample_rate
+
+    def write(self, block: np.ndarray):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class NullBackend(OutputBackend):
+    """丢弃输出；realtime 时按实际时间节奏拉取，用于无声卡环境和基准测试"""
+
+    def __init__(self, realtime: bool = True):
+        self.realtime = realtime
+        self._next_time = None
+
+    def write(self, block: np.ndarray):
+        if not self.realtime:
+            return
+        now = time.perf_counter()
+        if self._next_time is None or now - self._next_time > self.block_duration:
+            # 首块或落后超过一块时重新对齐时钟
+            self._next_time = now
+        self._next_time += self.block_duration
+        time.sleep(max(0.0, self._next_time - now))
+
+class WavFileBackend(NullBackend):
+    """把混音结果写入16位WAV文件"""
+
+    def __init__(self, path: str, realtime: bool = True):
+        super().__init__(realtime)
+        self.path = path
+        self._file = None
+
+    def open(self, sample_rate: int, channels: int, block_size: int):
+        super().open(sample_rate, channels, block_size)
+        self._file = wave.open(self.path, 'wb')
+        self._file.setnchannels(channels)
+        self._file.setsampwidth(2)
+        self._file.setframerate(sample_rate)
+
+    def write(self, block: np.ndarray):
+        self._file.writeframes(block.astype('<i2').tobytes())
+        super().write(block)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class PygameBackend(OutputBackend):
+    """通过 pygame 声道队列输出：正在播放一块、排队一块，队列空出时再拉取下一块
+
+    pygame.mixer 是进程内共享的：第一个打开的后端负责初始化（已被其他代码初始化时沿用，格式须一致），
+    最后一个关闭的后端才退出由后端初始化的 mixer；每个后端独占一个声道。
+    """
+
+    _lock = threading.Lock()
+    _channels_in_use = set()
+    _initialized_mixer = False
+
+    def __init__(self):
+        self.channel = None
+        self._index = None
+
+    def open(self, sample_rate: int, channels: int, block_size: int):
+        import pygame
+
+        super().open(sample_rate, channels, block_size)
+        self._pygame = pygame
+        cls = PygameBackend
+        with cls._lock:
+            current = pygame.mixer.get_init()
+            if current is None:
+                pygame.mixer.init(frequency=sample_rate, size=-16, channels=channels, buffer=block_size)
+                cls._initialized_mixer = True
+            elif current != (sample_rate, -16, channels):
+                raise RuntimeError(f"pygame.mixer 已按其他格式初始化: {current}")
+            free = [i for i in range(pygame.mixer.get_num_channels()) if i not in cls._channels_in_use]
+            if not free:
+                raise RuntimeError("pygame.mixer 没有空闲声道")
+            self._index = free[0]
+            cls._channels_in_use.add(self._index)
+            self.channel = pygame.mixer.Channel(self._index)
+        # 排队的一块 + 正在播放的一块 + 声卡缓冲
+        self.latency = 2 * self.block_duration
+
+    def _check_mixer(self):
+        # pygame.mixer 被其他代码退出后再访问声道会导致进程崩溃，先检查
+        if self._pygame.mixer.get_init() is None:
+            raise RuntimeError("pygame.mixer 已被关闭")
+
+    def write(self, block: np.ndarray):
+        self._check_mixer()
+        while self.channel.get_queue() is not None:
+            time.sleep(self.block_duration / 4)
+            self._check_mixer()
+        sound = self._pygame.mixer.Sound(buffer=np.ascontiguousarray(block).tobytes())
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+
+    def close(self):
+        if self.channel is None:
+            return
+        cls = PygameBackend
+        with cls._lock:
+            if self._pygame.mixer.get_init() is not None:
+                self.channel.stop()
+            cls._channels_in_use.discard(self._index)
+            if not cls._channels_in_use and cls._initialized_mixer:
+                self._pygame.mixer.quit()
+                cls._initialized_mixer = False
+            self.channel = None
+
+def create_backend(audio_config: Dict[str, Any]) -> OutputBackend:
+    """按 audio.backend 创建输出后端"""
+    name = audio_config.get('backend', 'pygame')
+    if name == 'null':
+        return NullBackend()
+    if name == 'wav':
+        return WavFileBackend(audio_config.get('output_file', 'audio_output.wav'))
+    return PygameBackend()
+
+class VoicePool:
+    """固定大小的声部池：复音数上限 + 声部抢占 + 同组互斥（扼音）
+
+    - 同一 group（例如同一根弦）的新声部会让该组正在发声的声部淡出，像真吉他重新拨弦一样
+    - 槽位已满时抢占优先级最低的声部：优先级 = 当前电平 / (1 + 已发声时长 / steal_age)，
+      即越安静、越老的声部越先被抢占
+    - 被抢占或扼音的声部移入淡出列表，淡出列表同样有上限，超出时最早的直接结束
+    因此每块需要混合的声部数不超过 2 × max_voices，与弹奏速度无关。
+    """
+
+    def __init__(self, max_voices: int = 16, fade_frames: int = 441, steal_age: int = 22050):
+        self.slots: List[Optional[Voice]] = [None] * max_voices
+        self.releasing: List[Voice] = []
+        self.fade_frames = fade_frames
+        self.steal_age = steal_age
+        self.stolen = 0
+        self.choked = 0
+
+    @property
+    def max_voices(self) -> int:
+        return len(self.slots)
+
+    @property
+    def active_count(self) -> int:
+        return sum(voice is not None for voice in self.slots)
+
+    def add(self, voice: Voice, now: int):
+        """放入一个新声部（now 为当前混音位置，单位帧）"""
+        voice.start_frame = now
+        if voice.group is not None:
+            for index, active in enumerate(self.slots):
+                if active is not None and active.group == voice.group:
+                    self._release(index)
+                    self.choked += 1
+
+        index = next((i for i, active in enumerate(self.slots) if active is None), None)
+        if index is None:
+            index = min(range(len(self.slots)), key=lambda i: self._priority(self.slots[i], now))
+            self._release(index)
+            self.stolen += 1
+        self.slots[index] = voice
+
+    def _priority(self, voice: Voice, now: int) -> float:
+        return voice.level / (1.0 + (now - voice.start_frame) / self.steal_age)
+
+    def _release(self, index: int):
+        voice = self.slots[index]
+        self.slots[index] = None
+        voice.stop(self.fade_frames)
+        if not voice.finished:
+            if len(self.releasing) >= len(self.slots):
+                self.releasing.pop(0).finished = True
+            self.releasing.append(voice)
+
+    def stop_all(self, fade_frames: int):
+        for index, voice in enumerate(self.slots):
+            if voice is not None:
+                voice.stop(fade_frames)
+        for voice in self.releasing:
+            voice.stop(fade_frames)
+
+    def __iter__(self) -> Iterator[Voice]:
+        for voice in self.slots:
+            if voice is not None:
+                yield voice
+        yield from self.releasing
+
+    def collect(self):
+        """回收已结束的声部"""
+        for index, voice in enumerate(self.slots):
+            if voice is not None and voice.finished:
+                self.slots[index] = None
+        if self.releasing:
+            self.releasing = [voice for voice in self.releasing if not voice.finished]
+
+class Mixer:
+    """把活动声部按块叠加的混音器
+
+    play() 只把声部放入待加入列表（可从任意线程调用），混音线程在下一块开始时把它们放入声部池；
+    每块的混音耗时和每个声部从触发到输出的延迟记录在环形缓冲中。
+    """
+
+    def __init__(self, sample_rate: int = 44100, channels: int = 2, block_size: int = 1024,
+                 backend: OutputBackend = None, volume: float = 0.7, stats_size: int = 512,
+                 max_voices: int = 16, fade_frames: int = 441):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_size = block_size
+        self.backend = backend if backend is not None else NullBackend()
+        self.volume = volume
+
+        self.voices = VoicePool(max_voices, fade_frames, steal_age=sample_rate // 2)
+        self._pending: List[Voice] = []
+        self._stop_fade = None
+        self._frame = 0
+        self._lock = threading.Lock()
+        self._buffer = np.zeros((block_size, channels), dtype=np.float32)
+
+        self.mix_times = deque(maxlen=stats_size)
+        self.latencies = deque(maxlen=stats_size)
+        self.blocks_mixed = 0
+        self.late_blocks = 0
+        self.voice_errors = 0
+        self._logged_errors = set()
+
+        self._thread = None
+        self._running = False
+
+    @classmethod
+    def from_config(cls, audio_config: Dict[str, Any], backend: OutputBackend = None) -> 'Mixer':
+        """按 audio 配置创建混音器"""
+        sample_rate = audio_config.get('sample_rate', 44100)
+        return cls(sample_rate, audio_config.get('channels', 2), audio_config.get('buffer_size', 1024),
+                   backend if backend is not None else create_backend(audio_config),
+                   audio_config.get('volume', 0.7), max_voices=audio_config.get('max_voices', 16),
+                   fade_frames=int(audio_config.get('fade_ms', 10) * sample_rate / 1000))
+
+    @property
+    def block_duration(self) -> float:
+        return self.block_size / self.sample_rate
+
+    def play(self, voice: Voice, group: Any = None) -> Voice:
+        """加入一个声部；group 相同的声部互斥（新声部让旧声部淡出）"""
+        voice.group = group
+        voice.trigger_time = time.perf_counter()
+        with self._lock:
+            self._pending.append(voice)
+        return voice
+
+    def stop_all(self, fade_frames: int = None):
+        """停止所有声部（默认使用声部池的淡出时长）"""
+        with self._lock:
+            self._pending.clear()
+            self._stop_fade = self.voices.fade_frames if fade_frames is None else fade_frames
+
+    def mix_block(self) -> np.ndarray:
+        """混合下一块，返回 (block_size, channels) 的 int16"""
+        start = time.perf_counter()
+        with self._lock:
+            pending, self._pending = self._pending, []
+            stop_fade, self._stop_fade = self._stop_fade, None
+
+        # 声部池只在混音线程中修改
+        if stop_fade is not None:
+            self.voices.stop_all(stop_fade)
+        for voice in pending:
+            self.voices.add(voice, self._frame)
+
+        buffer = self._buffer
+        buffer.fill(0.0)
+        for voice in self.voices:
+            if voice.trigger_time is not None:
+                self.latencies.append(start - voice.trigger_time + self.backend.latency)
+                voice.trigger_time = None
+            if not voice.finished:
+                try:
+                    voice.mix_into(buffer)
+                except Exception as e:
+                    # 出错的声部直接丢弃，不影响其他声部和混音线程
+                    voice.finished = True
+                    self._log_error(f"声部渲染失败，已丢弃: {e!r}")
+                    self.voice_errors += 1
+        self.voices.collect()
+        self._frame += self.block_size
+
+        buffer *= self.volume
+        np.clip(buffer, -1.0, 1.0, out=buffer)
+        block = (buffer * 32767).astype(np.int16)
+
+        elapsed = time.perf_counter() - start
+        self.mix_times.append(elapsed)
+        self.blocks_mixed += 1
+        if elapsed > self.block_duration:
+            self.late_blocks += 1
+        return block
+
+    def render(self, blocks: int) -> np.ndarray:
+        """离线混合若干块并返回（不启动线程、不写入后端）"""
+        return np.concatenate([self.mix_block() for _ in range(blocks)])
+
+    def start(self):
+        """打开后端并启动混音线程"""
+        if self._thread is not None:
+            return
+        self.backend.open(self.sample_rate, self.channels, self.block_size)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="audio-mixer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            block = self.mix_block()
+            try:
+                self.backend.write(block)
+            except Exception as e:
+                # 输出设备出错（如 pygame.mixer 被其他地方关闭）时改用空输出，保持混音线程运行
+                self._log_error(f"音频输出失败，改用空输出: {e!r}")
+                try:
+                    self.backend.close()
+                except Exception:
+                    pass
+                self.backend = NullBackend()
+                self.backend.open(self.sample_rate, self.channels, self.block_size)
+
+    def _log_error(self, message: str):
+        """同一错误只打印一次"""
+        if message not in self._logged_errors:
+            self._logged_errors.add(message)
+            print(f"Warning: {message}")
+
+    def close(self):
+        """停止混音线程并关闭后端"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+            self.backend.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """混音开销与触发延迟统计（毫秒）"""
+        mix_times = np.asarray(self.mix_times) * 1000
+        latencies = np.asarray(self.latencies) * 1000
+        budget = self.block_duration * 1000
+        return {
+            'blocks': self.blocks_mixed,
+            'late_blocks': self.late_blocks,
+            'voice_errors': self.voice_errors,
+            'active_voices': self.voices.active_count,
+            'releasing_voices': len(self.voices.releasing),
+            'max_voices': self.voices.max_voices,
+            'stolen_voices': self.voices.stolen,
+            'choked_voices': self.voices.choked,
+            'block_ms': budget,
+            'mix_ms_mean': float(mix_times.mean()) if mix_times.size else 0.0,
+            'mix_ms_p95': float(np.percentile(mix_times, 95)) if mix_times.size else 0.0,
+            'mix_ms_max': float(mix_times.max()) if mix_times.size else 0.0,
+            'mix_load': float(mix_times.mean() / budget) if mix_times.size else 0.0,
+            'latency_ms_mean': float(latencies.mean()) if latencies.size else 0.0,
+            'latency_ms_p95': float(np.percentile(latencies, 95)) if latencies.size else 0.0
+        }
+
+def print_stats(stats: Dict[str, Any]):
+    """打印混音统计"""
+    print(f"块数: {stats['blocks']} | 超时块: {stats['late_blocks']} | "
+          f"活动声部: {stats['active_voices']}/{stats['max_voices']} | "
+          f"被抢占: {stats['stolen_voices']} | 扼音: {stats['choked_voices']}")
+    print(f"混音耗时: 平均 {stats['mix_ms_mean']:.3f}ms | p95 {stats['mix_ms_p95']:.3f}ms | "
+          f"最大 {stats['mix_ms_max']:.3f}ms（每块预算 {stats['block_ms']:.1f}ms，负载 {stats['mix_load']:.1%}）")
+    print(f"触发延迟: 平均 {stats['latency_ms_mean']:.2f}ms | p95 {stats['latency_ms_p95']:.2f}ms")
+
+def main():
+    """命令行入口：无声卡的混音基准测试"""
+    parser = argparse.ArgumentParser(description="软件混音引擎基准测试")
+    parser.add_argument('--voices', type=int, default=32, help="持续发声（循环）的声部数")
+    parser.add_argument('--strum', type=int, default=0, help="每块额外触发的单音数（模拟快速扫弦，按弦分组）")
+    parser.add_argument('--max-voices', type=int, default=16, help="复音数上限")
+    parser.add_argument('--blocks', type=int, default=2000, help="离线混合的块数")
+    parser.add_argument('--block-size', type=int, default=1024)
+    parser.add_argument('--sample-rate', type=int, default=44100)
+    parser.add_argument('--triggers', type=int, default=50, help="实时延迟测试的触发次数")
+    parser.add_argument('--wav', default=None, help="把离线混音结果写入WAV文件")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    sample = (rng.standard_normal(args.sample_rate) * 0.05).astype(np.float32)
+
+    # 离线：测量每块混音开销
+    backend = WavFileBackend(args.wav, realtime=False) if args.wav else NullBackend(realtime=False)
+    mixer = Mixer(args.sample_rate, 2, args.block_size, backend, max_voices=args.max_voices)
+    for _ in range(args.voices):
+        mixer.play(SampleVoice(sample, 1.0 / args.voices, loop=True))
+    backend.open(mixer.sample_rate, mixer.channels, mixer.block_size)
+    for block_index in range(args.blocks):
+        for note in range(args.strum):
+            mixer.play(SampleVoice(sample, 0.2), group=f"string{(block_index + note) % 6 + 1}")
+        backend.write(mixer.mix_block())
+    backend.close()
+    print(f"🔊 离线混音 {args.voices} 个持续声部 + 每块 {args.strum} 个单音 × {args.blocks} 块")
+    print_stats(mixer.get_stats())
+
+    # 实时：测量从 play() 到输出的延迟
+    mixer = Mixer(args.sample_rate, 2, args.block_size, NullBackend(realtime=True), max_voices=args.max_voices)
+    mixer.start()
+    for _ in range(args.triggers):
+        mixer.play(SampleVoice(sample[:args.block_size * 4]))
+        time.sleep(rng.uniform(0.0, 2 * mixer.block_duration))
+    mixer.close()
+    print(f"⏱️ 实时触发 {args.triggers} 次")
+    print_stats(mixer.get_stats())
+
+if __name__ == "__main__":
+    main()
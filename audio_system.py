@@ -1,200 +1,156 @@
-import pygame
-import numpy as np
-import os
-from typing import Dict, List, Optional
-import utils
-
-class AudioSystem:
-    """高级音频处理系统"""
-    
-    def __init__(self, config: Dict = None):
-        if config is None:
-            config = utils.load_config()['audio']
-            
-        self.config = config
-        self.samples = {}
-        self.channels = {}
-        self.effects = {}
-        self._volume = config.get('volume', 0.7)
-        
-        # 初始化pygame mixer
-        pygame.mixer.init(
-            frequency=config['sample_rate'],
-            size=-16,
-            channels=config['channels'],
-            buffer=config['buffer_size']
-        )
-        
-        self.load_samples()
-    
-    def load_samples(self):
-        """加载所有音频样本"""
-        base_path = "assets/guitar_samples"
-        
-        # 加载单音
-        single_notes_path = os.path.join(base_path, "single_notes")
-        # 兼容：加载预命名的 stringX_fretY.wav 文件（0-10品，6弦）
-        for s in range(1, 7):
-            for f in range(0, 11):
-                fname = f"string{s}_fret{f}.wav"
-                file_path = os.path.join(single_notes_path, fname)
-                key = f"string{s}_fret{f}"
-                if os.path.exists(file_path):
-                    try:
-                        self.samples[key] = pygame.mixer.Sound(file_path)
-                    except Exception:
-                        print(f"Warning: 无法加载样本 {file_path}")
-                else:
-                    # 缺失样本时不立刻创建，以免阻塞，使用警告
-                    print(f"Warning: Sample file {file_path} not found")
-        
-        # 加载和弦
-        chords_path = os.path.join(base_path, "chords")
-        for chord in ["C_major", "G_major", "D_major", "A_minor", "E_minor", "F_major"]:
-            file_path = os.path.join(chords_path, f"{chord}.wav")
-            if os.path.exists(file_path):
-                self.samples[chord] = pygame.mixer.Sound(file_path)
-            else:
-                print(f"Warning: Chord file {file_path} not found")
-        
-        # 加载特效
-        effects_path = os.path.join(base_path, "effects")
-        for effect in ["pick_noise", "string_slide", "harmonic"]:
-            file_path = os.path.join(effects_path, f"{effect}.wav")
-            if os.path.exists(file_path):
-                self.effects[effect] = pygame.mixer.Sound(file_path)
-
-    def play_string_fret(self, string_number: int, fret: int, volume: float = None):
-        """按照命名约定播放指定弦与品位的样本（例如 string1_fret0.wav）。"""
-        if volume is None:
-            volume = self.get_volume()
-
-        key = f"string{string_number}_fret{fret}"
-        if key in self.samples:
-            try:
-                snd = self.samples[key]
-                snd.set_volume(volume)
-                snd.play()
-            except Exception as e:
-                print(f"播放样本失败 {key}: {e}")
-        else:
-            print(f"样本未找到: {key}")
-    
-    def create_default_sample(self, frequency: float, duration: float) -> pygame.mixer.Sound:
-        """创建默认音频样本（正弦波）"""
-        sample_rate = self.config['sample_rate']
-        frames = int(duration * sample_rate)
-        
-        # 生成正弦波
-        t = np.linspace(0, duration, frames, False)
-        wave = np.sin(2 * np.pi * frequency * t)
-        
-        # 添加包络
-        envelope = np.ones(frames)
-        attack = int(0.1 * frames)
-        decay = int(0.2 * frames)
-        release = int(0.3 * frames)
-        
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[attack:attack+decay] = np.linspace(1, 0.7, decay)
-        envelope[-release:] = np.linspace(0.7, 0, release)
-        
-        wave = wave * envelope
-        
-        # 转换为pygame声音
-        wave = (wave * 32767).astype(np.int16)
-        return pygame.mixer.Sound(buffer=wave)
-    
-    def play_note(self, note: str, volume: float = None):
-        """播放单个音符"""
-        if volume is None:
-            try:
-                volume = pygame.mixer.music.get_volume()
-            except Exception:
-                volume = self.config.get('volume', 0.7)
-
-        if note in self.samples:
-            self.samples[note].set_volume(volume)
-            self.samples[note].play()
-    
-    def play_chord(self, chord: str, volume: float = None):
-        """播放和弦"""
-        def _get_default_volume():
-            try:
-                return pygame.mixer.music.get_volume()
-            except Exception:
-                return self.config.get('volume', 0.7)
-
-        if volume is None:
-            volume = _get_default_volume()
-
-        if chord in self.samples:
-            # 停止同名正在播放的通道
-            if chord in self.channels and self.channels[chord] is not None:
-                try:
-                    self.channels[chord].stop()
-                except Exception:
-                    pass
-
-            # play() 返回 Channel 对象
-            channel = self.samples[chord].play()
-            if channel is not None:
-                try:
-                    channel.set_volume(volume)
-                    self.channels[chord] = channel
-                except Exception:
-                    pass
-            else:
-                # 如果返回 None，则使用 sample 的 set_volume（部分平台）
-                try:
-                    self.samples[chord].set_volume(volume)
-                except Exception:
-                    pass
-    
-    def play_effect(self, effect: str, volume: float = 0.5):
-        """播放特效音"""
-        if effect in self.effects:
-            self.effects[effect].set_volume(volume)
-            self.effects[effect].play()
-    
-    def stop_all(self):
-        """停止所有音频"""
-        # 停止已记录的通道
-        for key, ch in list(self.channels.items()):
-            try:
-                if ch is not None:
-                    ch.stop()
-            except Exception:
-                pass
-        self.channels.clear()
-        try:
-            pygame.mixer.stop()
-        except Exception:
-            pass
-    
-    def set_volume(self, volume: float):
-        """设置主音量"""
-        try:
-            pygame.mixer.music.set_volume(volume)
-        except Exception:
-            pass
-        # 保存内部音量并更新正在播放的通道
-        self._volume = volume
-        for key, ch in list(self.channels.items()):
-            try:
-                if ch is not None:
-                    ch.set_volume(volume)
-            except Exception:
-                # 有些平台返回 None 或不支持 set_volume
-                try:
-                    if key in self.samples:
-                        self.samples[key].set_volume(volume)
-                except Exception:
-                    pass
-    
-    def get_volume(self) -> float:
-        """获取当前音量"""
-        try:
-            return pygame.mixer.music.get_volume()
-        except Exception:
-            return getattr(self, '_volume', self.config.get('volume', 0.7))
+import numpy as np
+import os
+from typing import Dict
+from audio_mixer import Mixer, NullBackend, SampleVoice
+from sample_cache import SampleCache
+from sample_manifest import MANIFEST_NAME, build_manifest, load_manifest
+from string_synth import StringSynth
+import utils
+
+class AudioSystem:
+    """高级音频处理系统（样本按需内存映射并缓存，由软件混音器按块混合输出）"""
+
+    def __init__(self, config: Dict = None, performance_config: Dict = None, guitar_config: Dict = None):
+        if config is None:
+            full_config = utils.load_config()
+            config = full_config['audio']
+            performance_config = full_config.get('performance')
+            guitar_config = full_config.get('guitar')
+
+        self.config = config
+        # 样本只登记路径，第一次播放时才加载（特效以 "effect/名称" 登记在同一缓存中）
+        self.samples = SampleCache.from_config(config['sample_rate'], performance_config)
+        parallel = (performance_config or {}).get('resources', {}).get('parallel_processing', True)
+        self.load_workers = min(8, os.cpu_count() or 1) if parallel else 1
+        self._volume = config.get('volume', 0.7)
+        # 单音合成：sample 只用样本，synth 只用合成，auto 有样本用样本、否则合成
+        synth_config = config.get('synth', {})
+        self.synth_mode = synth_config.get('mode', 'auto')
+        self.synth = StringSynth(guitar_config or {}, config['sample_rate'], synth_config)
+
+        # 初始化混音器与输出后端（声卡不可用时退回空输出）
+        self.mixer = Mixer.from_config(config)
+        try:
+            self.mixer.start()
+        except Exception as e:
+            print(f"Warning: 音频输出后端打开失败，使用空输出: {e}")
+            self.mixer = Mixer.from_config(config, NullBackend())
+            self.mixer.start()
+
+        self.load_samples()
+
+    def load_samples(self):
+        """按音源库的样本清单登记所有样本，并用线程池并发预加载（不逐个探测文件）"""
+        base_path = self.config.get('sample_dir', 'guitar_samples')
+        if not os.path.isdir(base_path):
+            print(f"Warning: 音源库目录不存在 {base_path}")
+            return
+        manifest = load_manifest(base_path)
+        if manifest is None:
+            # 没有清单时扫描一次目录在内存中生成（仍然不逐个探测样本名）
+            print(f"Warning: 未找到样本清单 {os.path.join(base_path, MANIFEST_NAME)}，已扫描目录生成；"
+                  f"可运行 python sample_manifest.py build {base_path} 写出清单")
+            manifest = build_manifest(base_path)
+
+        for key, entry in manifest['samples'].items():
+            header = (entry['channels'], entry['sample_rate'], entry['sample_width'], entry['offset'], entry['size'])
+            self.samples.register(key, os.path.join(base_path, entry['file']), header)
+
+        # 和弦与特效最常用，优先预加载，其余单音按缓存剩余容量加载
+        samples = manifest['samples']
+        keys = sorted(samples, key=lambda key: samples[key]['file'].startswith('single_notes/'))
+        for key, error in self.samples.preload(keys, self.load_workers):
+            print(f"Warning: 无法加载样本 {key}: {error}")
+
+    def play_string_fret(self, string_number: int, fret: int, volume: float = None, damping: float = None):
+        """播放指定弦与品位：有样本时按命名约定播放（例如 string1_fret0.wav），否则实时合成
+
+        volume 为力度（合成时同时影响音色亮度），damping 为制音程度（仅合成时有效）。
+        同一根弦上正在发声的音会被扼住（淡出），像真吉他重新拨弦一样。
+        """
+        key = f"string{string_number}_fret{fret}"
+        group = f"string{string_number}"
+        if key in self.samples and self.synth_mode != 'synth':
+            self._play_sample(key, 1.0 if volume is None else volume, group=group)
+        elif self.synth_mode != 'sample':
+            try:
+                self.mixer.play(self.synth.voice(string_number, fret, volume, damping), group=group)
+            except ValueError as e:
+                print(f"无法合成 {key}: {e}")
+        else:
+            print(f"样本未找到: {key}")
+
+    def _play_sample(self, key: str, volume: float, group: str = None):
+        """从缓存取出样本（首次取用时加载）并交给混音器"""
+        try:
+            self.mixer.play(SampleVoice(self.samples[key], volume), group=group)
+        except Exception as e:
+            print(f"播放样本失败 {key}: {e}")
+
+    def create_default_sample(self, frequency: float, duration: float) -> np.ndarray:
+        """创建默认音频样本（正弦波）"""
+        sample_rate = self.config['sample_rate']
+        frames = int(duration * sample_rate)
+
+        # 生成正弦波
+        t = np.linspace(0, duration, frames, False)
+        wave = np.sin(2 * np.pi * frequency * t)
+
+        # 添加包络
+        envelope = np.ones(frames)
+        attack = int(0.1 * frames)
+        decay = int(0.2 * frames)
+        release = int(0.3 * frames)
+
+        envelope[:attack] = np.linspace(0, 1, attack)
+        envelope[attack:attack+decay] = np.linspace(1, 0.7, decay)
+        envelope[-release:] = np.linspace(0.7, 0, release)
+
+        return (wave * envelope).astype(np.float32)
+
+    def play_note(self, note: str, volume: float = None):
+        """播放单个音符"""
+        if volume is None:
+            volume = 1.0
+
+        if note in self.samples:
+            self._play_sample(note, volume)
+
+    def play_chord(self, chord: str, volume: float = None):
+        """播放和弦（同名和弦正在发声时先淡出）
+
+        volume 为该声部的相对音量，主音量由混音器统一施加。
+        """
+        if volume is None:
+            volume = 1.0
+
+        if chord in self.samples:
+            self._play_sample(chord, volume, group=chord)
+
+    def play_effect(self, effect: str, volume: float = 0.5):
+        """播放特效音"""
+        if f"effect/{effect}" in self.samples:
+            self._play_sample(f"effect/{effect}", volume)
+
+    def stop_all(self):
+        """停止所有音频"""
+        self.mixer.stop_all()
+
+    def set_volume(self, volume: float):
+        """设置主音量（作用于混音输出，包括正在发声的声部）"""
+        self._volume = volume
+        self.mixer.volume = volume
+
+    def get_volume(self) -> float:
+        """获取当前音量"""
+        return self._volume
+
+    def get_stats(self) -> Dict:
+        """混音开销、触发延迟与样本缓存统计"""
+        stats = self.mixer.get_stats()
+        stats['sample_cache'] = self.samples.get_stats()
+        return stats
+
+    def close(self):
+        """停止混音线程并关闭输出后端"""
+        self.mixer.close()
@@ -0,0 +1,169 @@
+"""离线批量识别：对录制的视频逐帧运行手部追踪与手势分析，输出和弦/扫弦事件时间线
+
+用法示例:
+    python batch_recognition.py recordings/ --output-dir results/ --format csv --workers 8
+"""
+import argparse
+import csv
+import json
+import os
+import time
+import cv2
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from hand_tracker import HandTracker
+from gesture_analyzer1 import GestureAnalyzer
+from recognition_events import EventExtractor
+import utils
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm', '.m4v')
+
+def find_videos(inputs: List[str]) -> List[str]:
+    """收集输入路径中的所有视频文件（目录按文件名排序）"""
+    videos = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.lower().endswith(VIDEO_EXTENSIONS):
+                    videos.append(os.path.join(path, name))
+        elif os.path.isfile(path):
+            videos.append(path)
+        else:
+            print(f"Warning: 输入路径不存在 {path}")
+    return videos
+
+def probe_video(path: str) -> Tuple[int, float]:
+    """读取视频的帧数与帧率"""
+    cap = cv2.VideoCapture(path)
+    try:
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    finally:
+        cap.release()
+    return frame_count, fps
+
+def plan_chunks(path: str, frame_count: int, fps: float, chunk_frames: int,
+                warmup_frames: int) -> List[Dict[str, Any]]:
+    """把视频切分为若干帧区间，每个区间带有用于预热状态的前置帧"""
+    chunks = []
+    for start in range(0, frame_count, chunk_frames):
+        chunks.append({
+            'path': path,
+            'fps': fps,
+            'start': start,
+            'end': min(start + chunk_frames, frame_count),
+            'warmup_start': max(0, start - warmup_frames)
+        })
+    return chunks
+
+def process_chunk(task: Dict[str, Any], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """在工作进程中处理一个帧区间，返回该区间内的事件
+
+    从 warmup_start 开始解码，前置帧只用于建立追踪器与扫弦/和弦状态，不输出事件，
+    这样区间边界处的结果与整段顺序处理保持一致。
+    """
+    cv2.setNumThreads(1)
+    tracker = HandTracker(config['hand_tracking'], show_landmarks=False)
+    analyzer = GestureAnalyzer(config)
+    extractor = EventExtractor(analyzer, config)
+
+    cap = cv2.VideoCapture(task['path'])
+    cap.set(cv2.CAP_PROP_POS_FRAMES, task['warmup_start'])
+    fps = task['fps']
+    events = []
+
+    try:
+        for frame_index in range(task['warmup_start'], task['end']):
+            ret, frame = cap.read()
+            if not ret:
+                break
+
+            timestamp = frame_index / fps
+            hand_frame = tracker.track(frame, timestamp=timestamp)
+            analyzed_data = analyzer.analyze_frame(hand_frame, frame.shape)
+            events.extend(extractor.update(analyzed_data, frame_index, timestamp, frame.shape,
+                                           emit=frame_index >= task['start']))
+    finally:
+        cap.release()
+        tracker.release()
+        analyzer.diagnostics.close()
+
+    return events
+
+def write_events(events: List[Dict[str, Any]], output_path: str, output_format: str,
+                 video_info: Dict[str, Any]):
+    """写出事件时间线（CSV或JSON）"""
+    if output_format == 'json':
+        with open(output_path, 'w', encoding='utf-8') as file:
+            json.dump(dict(video_info, events=events), file, ensure_ascii=False, indent=2)
+    else:
+        with open(output_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=['time', 'frame', 'event', 'value', 'hand_type'])
+            writer.writeheader()
+            for event in events:
+                writer.writerow(dict(event, time=f"{event['time']:.3f}"))
+
+def run_batch(videos: List[str], output_dir: str, output_format: str = 'csv',
+              workers: int = None, chunk_seconds: float = 30.0, warmup_frames: int = 15,
+              config: Dict[str, Any] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """并行处理所有视频并写出结果，返回每个视频的事件列表"""
+    if config is None:
+        config = utils.load_config()
+    utils.ensure_directory(output_dir)
+
+    # 切分所有视频的帧区间，统一提交到进程池
+    video_info = {}
+    tasks = []
+    for path in videos:
+        frame_count, fps = probe_video(path)
+        if frame_count <= 0:
+            print(f"Warning: 无法读取视频 {path}")
+            continue
+        video_info[path] = {'video': os.path.basename(path), 'fps': fps, 'frames': frame_count}
+        tasks.extend(plan_chunks(path, frame_count, fps, max(1, int(chunk_seconds * fps)), warmup_frames))
+
+    print(f"🎬 共 {len(video_info)} 个视频，切分为 {len(tasks)} 个区间")
+    start_time = time.time()
+
+    results = {path: [] for path in video_info}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_chunk, task, config) for task in tasks]
+        for task, future in zip(tasks, futures):
+            results[task['path']].extend(future.result())
+
+    # 区间按顺序提交，事件已按帧序排列
+    for path, events in results.items():
+        name = os.path.splitext(os.path.basename(path))[0]
+        output_path = os.path.join(output_dir, f"{name}.{output_format}")
+        write_events(events, output_path, output_format, video_info[path])
+        print(f"✅ {video_info[path]['video']}: {len(events)} 个事件 → {output_path}")
+
+    elapsed = time.time() - start_time
+    total_frames = sum(info['frames'] for info in video_info.values())
+    if elapsed > 0:
+        print(f"⏱️ 处理 {total_frames} 帧，用时 {elapsed:.1f}s（{total_frames / elapsed:.1f} 帧/秒）")
+    return results
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="离线批量识别录制视频中的和弦与扫弦")
+    parser.add_argument('inputs', nargs='+', help="视频文件或包含视频的目录")
+    parser.add_argument('--output-dir', default='recognition_results', help="结果输出目录")
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv', help="输出格式")
+    parser.add_argument('--workers', type=int, default=None, help="工作进程数（默认CPU核数）")
+    parser.add_argument('--chunk-seconds', type=float, default=30.0, help="每个并行区间的时长（秒）")
+    parser.add_argument('--warmup-frames', type=int, default=15, help="区间开始前用于预热状态的帧数")
+    parser.add_argument('--config', default='config.yaml', help="配置文件路径")
+    args = parser.parse_args()
+
+    videos = find_videos(args.inputs)
+    if not videos:
+        print("❌ 没有找到视频文件")
+        return
+
+    run_batch(videos, args.output_dir, args.format, args.workers,
+              args.chunk_seconds, args.warmup_frames, utils.load_config(args.config))
+
+if __name__ == "__main__":
+    main()
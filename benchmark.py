@@ -0,0 +1,115 @@
+"""基于录制会话的分阶段延迟基准测试（可在无显示、无声卡、无摄像头的Linux上运行）
+
+用法示例:
+    python benchmark.py session.npz --repeat 5
+    python benchmark.py session.npz --use-frames --app main_app1 --json bench.json
+"""
+import os
+
+# 无声卡环境下让pygame使用空音频驱动
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import contextlib
+import importlib
+import json
+import time
+import cv2
+import numpy as np
+from typing import Any, Dict, List
+
+from replay_harness import Recording, ReplayDriver
+
+STAGES = ('tracking', 'analysis', 'audio_trigger', 'ui')
+
+def encode_ui_frame(results: Dict[str, Any]) -> bytes:
+    """界面阶段的主要开销：与 st.image(channels="BGR") 一样转换为RGB并编码"""
+    rgb = cv2.cvtColor(results['processed_frame'], cv2.COLOR_BGR2RGB)
+    ok, encoded = cv2.imencode('.jpg', rgb)
+    return encoded.tobytes() if ok else b''
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """计算延迟分位数（毫秒）"""
+    values = np.asarray(samples, dtype=np.float64) * 1000
+    if values.size == 0:
+        return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'mean': 0.0, 'max': 0.0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'p50': p50, 'p95': p95, 'p99': p99, 'mean': values.mean(), 'max': values.max()}
+
+def run_benchmark(app: Any, recording: Recording, use_frames: bool = False,
+                  repeat: int = 1, warmup: int = 10) -> Dict[str, Any]:
+    """回放录制会话，逐帧记录各阶段耗时"""
+    driver = ReplayDriver(app, recording, use_frames)
+    timings = {stage: [] for stage in STAGES}
+    timings['total'] = []
+
+    duration = float(recording.timestamps[-1]) + 1.0 if len(recording) else 1.0
+    measured_frames = 0
+    measured_time = 0.0
+
+    for round_index in range(repeat):
+        for index, frame, timestamp in driver.frames():
+            # 每轮回放的时间戳顺延，保证单调递增
+            packet = {'frame': frame, 'timestamp': timestamp + round_index * duration}
+
+            start = time.perf_counter()
+            packet = app.track_hands(packet)
+            tracked = time.perf_counter()
+            packet = app.analyze_hands(packet)
+            analyzed = time.perf_counter()
+            results = app.trigger_events(packet)
+            triggered = time.perf_counter()
+            encode_ui_frame(results)
+            rendered = time.perf_counter()
+
+            if round_index == 0 and index < warmup:
+                continue
+            timings['tracking'].append(tracked - start)
+            timings['analysis'].append(analyzed - tracked)
+            timings['audio_trigger'].append(triggered - analyzed)
+            timings['ui'].append(rendered - triggered)
+            timings['total'].append(rendered - start)
+            measured_frames += 1
+            measured_time += rendered - start
+
+    return {
+        'frames': measured_frames,
+        'fps': measured_frames / measured_time if measured_time > 0 else 0.0,
+        'mode': 'frames' if driver.use_frames else 'landmarks',
+        'stages': {stage: summarize(samples) for stage, samples in timings.items()}
+    }
+
+def print_report(report: Dict[str, Any]):
+    """打印基准测试结果"""
+    print(f"\n📊 回放模式: {report['mode']} | 帧数: {report['frames']} | 总吞吐: {report['fps']:.1f} FPS")
+    print(f"{'阶段':<16}{'p50':>10}{'p95':>10}{'p99':>10}{'mean':>10}{'max':>10}  (ms)")
+    for stage, stats in report['stages'].items():
+        print(f"{stage:<16}" + "".join(f"{stats[key]:>10.3f}" for key in ('p50', 'p95', 'p99', 'mean', 'max')))
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="分阶段延迟基准测试")
+    parser.add_argument('recording', help="replay_harness.py 录制的 .npz 文件")
+    parser.add_argument('--app', default='main_app', choices=['main_app', 'main_app1'], help="被测应用模块")
+    parser.add_argument('--use-frames', action='store_true', help="回放原始帧并运行真实的手部追踪")
+    parser.add_argument('--repeat', type=int, default=3, help="回放轮数")
+    parser.add_argument('--warmup', type=int, default=10, help="不计入统计的预热帧数")
+    parser.add_argument('--json', default=None, help="把结果另存为JSON")
+    parser.add_argument('--verbose', action='store_true', help="保留应用的控制台输出")
+    args = parser.parse_args()
+
+    recording = Recording(args.recording)
+    app_module = importlib.import_module(args.app)
+
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(open(os.devnull, 'w'))
+    with output:
+        app = app_module.AirGuitarApp()
+        report = run_benchmark(app, recording, args.use_frames, args.repeat, args.warmup)
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import cv2
+import threading
+import time
+import numpy as np
+from typing import Any, Optional, Tuple
+
+class CameraCapture:
+    """后台线程摄像头采集器（单帧槽位，只保留最新一帧）"""
+
+    def __init__(self, source: Any = 0, width: int = None, height: int = None,
+                 fps: int = None, max_failures: int = 30):
+        self.source = source
+        self.max_failures = max_failures
+        self.cap = cv2.VideoCapture(source)
+
+        if self.cap.isOpened():
+            # 尽量缩小驱动层缓冲，避免积压过期帧
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            if width:
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            if height:
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            if fps:
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+
+        # 最新帧槽位（新帧直接覆盖旧帧）
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Condition(self._lock)
+        self._frame: Optional[np.ndarray] = None
+        self._timestamp = 0.0
+        self._frame_id = 0
+        self._consumed_id = 0
+
+        # 发布新帧的最短间隔（秒），画质调节降级时限制采集帧率
+        self.frame_interval = 0.0
+        self._published_time = 0.0
+
+        # 统计信息
+        self.captured_frames = 0
+        self.dropped_frames = 0
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        # release() 时采集线程可能仍阻塞在 cap.read() 中，此时由采集线程退出时释放摄像头
+        self._release_requested = False
+        self._thread_exited = False
+
+    def is_opened(self) -> bool:
+        """摄像头是否成功打开"""
+        return self.cap.isOpened()
+
+    def is_running(self) -> bool:
+        """采集线程是否仍在运行"""
+        return self._running
+
+    def start(self) -> 'CameraCapture':
+        """启动后台采集线程"""
+        if self._running or not self.cap.isOpened():
+            return self
+
+        self._running = True
+        self._thread_exited = False
+        self._thread = threading.Thread(target=self._capture_loop, name="CameraCapture", daemon=True)
+        self._thread.start()
+        return self
+
+    def _capture_loop(self):
+        """采集线程主循环：持续读取并覆盖最新帧"""
+        failures = 0
+        while self._running:
+            ret, frame = self.cap.read()
+            timestamp = time.monotonic()
+
+            if not ret:
+                failures += 1
+                if failures >= self.max_failures:
+                    break
+                time.sleep(0.005)
+                continue
+            failures = 0
+            # 留10%余量，避免采集时间抖动使帧率降到目标的整数分之一
+            if timestamp - self._published_time < self.frame_interval * 0.9:
+                continue
+            self._published_time = timestamp
+
+            with self._frame_ready:
+                # 上一帧还没被取走就被覆盖，计为丢弃
+                if self._frame_id > self._consumed_id:
+                    self.dropped_frames += 1
+                self._frame = frame
+                self._timestamp = timestamp
+                self._frame_id += 1
+                self.captured_frames += 1
+                self._frame_ready.notify_all()
+
+        with self._frame_ready:
+            self._running = False
+            self._thread_exited = True
+            self._frame_ready.notify_all()
+            release = self._release_requested
+        if release:
+            self.cap.release()
+
+    def set_max_fps(self, fps: Optional[float]):
+        """限制发布新帧的帧率（None 为不限制），多余的帧在采集线程中直接丢弃"""
+        self.frame_interval = 1.0 / fps if fps else 0.0
+
+    def read(self, timeout: float = 0.0) -> Tuple[bool, Optional[np.ndarray], float]:
+        """获取最新帧，返回 (是否为新帧, 帧, 采集时间戳)
+
+        timeout 为等待新帧的最长时间（秒），为0时立即返回。
+        """
+        deadline = time.monotonic() + timeout
+        with self._frame_ready:
+            while self._frame_id == self._consumed_id and self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._frame_ready.wait(remaining)
+
+            if self._frame_id == self._consumed_id:
+                return False, None, 0.0
+
+            self._consumed_id = self._frame_id
+            return True, self._frame, self._timestamp
+
+    def get_frame_age(self) -> float:
+        """最新帧距今的时间（秒）"""
+        with self._lock:
+            if self._frame is None:
+                return float('inf')
+            return time.monotonic() - self._timestamp
+
+    def release(self):
+        """停止采集线程并释放摄像头
+
+        不在 cap.read() 进行中释放摄像头：采集线程仍在运行时由它退出循环后自行释放。
+        """
+        with self._frame_ready:
+            self._running = False
+            self._release_requested = True
+            self._frame_ready.notify_all()
+            release_here = self._thread is None or self._thread_exited
+        if release_here:
+            self.cap.release()
+        elif self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._thread = None
@@ -0,0 +1,116 @@
+import itertools
+import numpy as np
+from typing import Any, Dict, List, Sequence
+
+# 参与识别的手指顺序，与 GestureAnalyzer 的 finger_states 一致，第i根手指对应掩码第i位
+CHORD_FINGERS = ('index', 'middle', 'ring', 'pinky')
+POSITION_BANDS = ('high', 'middle', 'low')
+HANDEDNESS = ('Left', 'Right')
+
+UNKNOWN_CHORD = "unknown"
+
+# config.yaml 未提供和弦表时使用的默认映射（与新手版和弦指南一致）
+DEFAULT_CHORD_TABLE = [
+    {'chord': 'C_major', 'count': 2, 'position': 'high'},
+    {'chord': 'G_major', 'count': 2, 'position': 'low'},
+    {'chord': 'D_major', 'count': 3, 'position': 'high'},
+    {'chord': 'A_minor', 'count': 3, 'position': 'low'},
+    {'chord': 'E_minor', 'count': 4, 'position': 'high'},
+    {'chord': 'F_major', 'count': 4, 'position': 'low'},
+]
+
+class ChordClassifier:
+    """由声明式和弦表编译得到的查找表分类器
+
+    查找表以 (手指掩码, 位置档, 左右手) 为下标，启动时把每条规则展开写入，
+    识别时只做一次数组索引，与和弦数量无关。
+    规则可以用 fingers 指定确切的手指组合，或用 count 表示任意N根手指；
+    确切组合优先于按数量匹配，同类规则按表中顺序先到先得。
+    """
+
+    def __init__(self, chord_table: List[Dict[str, Any]] = None):
+        if chord_table is None:
+            chord_table = DEFAULT_CHORD_TABLE
+
+        self.chord_names: List[str] = []
+        # 最后一维的第3格用于未知的左右手
+        self.table = np.full((1 << len(CHORD_FINGERS), len(POSITION_BANDS), len(HANDEDNESS) + 1),
+                             -1, dtype=np.int16)
+        self._compile(chord_table)
+        # 末尾追加 unknown，使 -1 下标直接映射为 unknown
+        self._names = np.array(self.chord_names + [UNKNOWN_CHORD], dtype=object)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ChordClassifier':
+        """从 gesture_recognition.chord_table 构建"""
+        chord_table = config.get('gesture_recognition', {}).get('chord_table')
+        return cls(chord_table)
+
+    def _compile(self, chord_table: List[Dict[str, Any]]):
+        # 确切手指组合的规则先写入，按数量匹配的规则只填充空位
+        rules = sorted(chord_table, key=lambda rule: 'fingers' not in rule)
+        exact_cells = np.zeros(self.table.shape, dtype=bool)
+        for rule in rules:
+            chord = rule['chord']
+            if chord not in self.chord_names:
+                self.chord_names.append(chord)
+            code = self.chord_names.index(chord)
+
+            masks = self._rule_masks(rule)
+            bands = self._rule_indices(rule.get('position', 'any'), POSITION_BANDS, 'position')
+            hands = self._rule_indices(rule.get('hand', 'any'), HANDEDNESS, 'hand')
+            if rule.get('hand', 'any') == 'any':
+                hands.append(len(HANDEDNESS))
+
+            index = np.ix_(masks, bands, hands)
+            cells = self.table[index]
+            taken = cells >= 0
+            if (taken & ~exact_cells[index]).any() or ('fingers' in rule and taken.any()):
+                print(f"Warning: 和弦表规则 {chord} 与已有规则重叠，重叠部分保留先前的规则")
+            self.table[index] = np.where(taken, cells, code)
+            if 'fingers' in rule:
+                exact_cells[index] = True
+
+    @staticmethod
+    def _rule_masks(rule: Dict[str, Any]) -> List[int]:
+        if 'fingers' in rule:
+            unknown = set(rule['fingers']) - set(CHORD_FINGERS)
+            if unknown:
+                raise ValueError(f"和弦 {rule['chord']} 包含未知的手指: {sorted(unknown)}")
+            return [sum(1 << CHORD_FINGERS.index(finger) for finger in rule['fingers'])]
+        if 'count' in rule:
+            return [sum(1 << i for i in combo)
+                    for combo in itertools.combinations(range(len(CHORD_FINGERS)), int(rule['count']))]
+        raise ValueError(f"和弦 {rule['chord']} 需要指定 fingers 或 count")
+
+    @staticmethod
+    def _rule_indices(value: Any, names: Sequence[str], field: str) -> List[int]:
+        values = list(names) if value == 'any' else ([value] if isinstance(value, str) else list(value))
+        for item in values:
+            if item not in names:
+                raise ValueError(f"和弦表中 {field} 的取值无效: {item}")
+        return [names.index(item) for item in values]
+
+    @staticmethod
+    def finger_mask(finger_states: np.ndarray) -> np.ndarray:
+        """把 (..., 4) 的伸直状态转换为手指掩码"""
+        weights = 1 << np.arange(len(CHORD_FINGERS))
+        return np.asarray(finger_states, dtype=np.intp) @ weights
+
+    @staticmethod
+    def hand_index(hand_type: str) -> int:
+        """左右手标签对应的查找表下标"""
+        return HANDEDNESS.index(hand_type) if hand_type in HANDEDNESS else len(HANDEDNESS)
+
+    def lookup(self, mask: int, band: int, hand_type: str = None) -> str:
+        """单只手的O(1)查找"""
+        return self._names[self.table[mask, band, self.hand_index(hand_type)]]
+
+    def classify(self, finger_states: np.ndarray, bands: np.ndarray, hand_types: Sequence[str] = None) -> np.ndarray:
+        """批量识别，返回和弦名称数组（形状与 bands 相同）"""
+        masks = self.finger_mask(finger_states)
+        if hand_types is None:
+            hands = len(HANDEDNESS)
+        else:
+            hands = np.array([self.hand_index(hand) for hand in np.ravel(hand_types)], dtype=np.intp).reshape(np.shape(bands))
+        return self._names[self.table[masks, bands, hands]]
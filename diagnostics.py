@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
+
+class Diagnostics:
+    """结构化诊断事件：内存环形缓冲 + 日志级别过滤 + 后台限速输出
+
+    热路径上的 record() 只做级别判断和一次追加，不做任何格式化与IO；
+    控制台/文件输出由后台线程按采样间隔和每秒行数上限批量完成。
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        debug_config = (config or {}).get('debug', {})
+        output_config = debug_config.get('output', {})
+        diag_config = debug_config.get('diagnostics', {})
+
+        self.level = LOG_LEVELS.get(str(debug_config.get('log_level', 'INFO')).upper(), LOG_LEVELS['INFO'])
+        self.console_logging = output_config.get('console_logging', True)
+        self.log_file = output_config.get('log_file') if output_config.get('file_logging', False) else None
+
+        self.flush_interval = diag_config.get('flush_interval', 0.5)
+        self.sample_every = max(1, int(diag_config.get('sample_every', 1)))
+        self.max_lines_per_second = diag_config.get('max_lines_per_second', 20)
+
+        self._events = deque(maxlen=diag_config.get('buffer_size', 500))
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._flushed_seq = 0
+        self._event_counts: Dict[str, int] = {}
+
+        # 限速与统计
+        self._tokens = float(self.max_lines_per_second)
+        self._last_refill = time.monotonic()
+        self.written_lines = 0
+        self.suppressed_lines = 0
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def enabled(self, level: str) -> bool:
+        """该级别的事件是否会被记录"""
+        return LOG_LEVELS[level] >= self.level
+
+    def record(self, event: str, level: str = 'DEBUG', message: str = '', **fields):
+        """记录一条结构化事件（低于日志级别时直接丢弃）"""
+        level_value = LOG_LEVELS[level]
+        if level_value < self.level:
+            return
+
+        with self._lock:
+            self._seq += 1
+            self._events.append({
+                'seq': self._seq,
+                'time': time.time(),
+                'level': level,
+                'event': event,
+                'message': message,
+                'fields': fields
+            })
+
+        if self._thread is None and (self.console_logging or self.log_file):
+            self._start_flusher()
+
+    def recent(self, count: int = 20, event: str = None, min_level: str = 'DEBUG') -> List[Dict[str, Any]]:
+        """返回最近的事件（新事件在后），可按事件名和最低级别过滤"""
+        with self._lock:
+            events = list(self._events)
+        min_value = LOG_LEVELS[min_level]
+        if event is not None or min_value > LOG_LEVELS['DEBUG']:
+            events = [e for e in events
+                      if (event is None or e['event'] == event) and LOG_LEVELS[e['level']] >= min_value]
+        return events[-count:]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取诊断统计"""
+        with self._lock:
+            recorded = self._seq
+            buffered = len(self._events)
+        return {
+            'recorded': recorded,
+            'buffered': buffered,
+            'written_lines': self.written_lines,
+            'suppressed_lines': self.suppressed_lines
+        }
+
+    def _start_flusher(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._flush_loop, name="DiagnosticsFlusher", daemon=True)
+        self._thread.start()
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """输出自上次以来的新事件（按事件名采样，并限制每秒行数）"""
+        with self._lock:
+            pending = [e for e in self._events if e['seq'] > self._flushed_seq]
+            overwritten = self._seq - self._flushed_seq - len(pending)
+            self._flushed_seq = self._seq
+        if not pending and overwritten <= 0:
+            return
+
+        now = time.monotonic()
+        self._tokens = min(float(self.max_lines_per_second),
+                           self._tokens + (now - self._last_refill) * self.max_lines_per_second)
+        self._last_refill = now
+
+        lines = []
+        suppressed = max(0, overwritten)
+        for entry in pending:
+            # 警告和错误不参与采样与限速
+            if LOG_LEVELS[entry['level']] < LOG_LEVELS['WARNING']:
+                count = self._event_counts.get(entry['event'], 0)
+                self._event_counts[entry['event']] = count + 1
+                if count % self.sample_every or self._tokens < 1:
+                    suppressed += 1
+                    continue
+                self._tokens -= 1
+            lines.append(self.format_event(entry))
+
+        if suppressed:
+            lines.append(f"[DIAG] 已省略 {suppressed} 条诊断事件")
+        self.suppressed_lines += suppressed
+        self.written_lines += len(lines)
+        self._write(lines)
+
+    def _write(self, lines: List[str]):
+        if not lines:
+            return
+        text = "\n".join(lines)
+        if self.console_logging:
+            print(text)
+        if self.log_file:
+            try:
+                with open(self.log_file, 'a', encoding='utf-8') as file:
+                    file.write(text + "\n")
+            except OSError as e:
+                print(f"Warning: 无法写入日志文件 {self.log_file}: {e}")
+                self.log_file = None
+
+    @staticmethod
+    def format_event(entry: Dict[str, Any]) -> str:
+        """把事件格式化为单行文本"""
+        timestamp = time.strftime('%H:%M:%S', time.localtime(entry['time']))
+        fields = " ".join(f"{key}={value}" for key, value in entry['fields'].items())
+        message = f" {entry['message']}" if entry['message'] else ""
+        return f"[{timestamp}] [{entry['level']}] {entry['event']}{message} {fields}".rstrip()
+
+    def close(self):
+        """停止后台线程并输出剩余事件"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.flush()
@@ -0,0 +1,292 @@
+"""手势分析器离线评估与阈值网格搜索
+
+数据集为 .npz 文件：landmarks (N, 21, 3)、labels (N,)、handedness (N,)、aspect (N,)，
+可以用 build 子命令从 replay_harness.py 录制的会话生成。
+
+用法示例:
+    python evaluate_analyzer.py build dataset.npz session_c.npz C_major
+    python evaluate_analyzer.py eval dataset.npz --angle 30 --straightness 0.8 --high 0.5 --low 0.7
+    python evaluate_analyzer.py eval dataset.npz --method distance --extended 0.08
+    python evaluate_analyzer.py sweep dataset.npz --angle 15:45:2.5 --straightness 0.6:0.95:0.025
+    python evaluate_analyzer.py sweep dataset.npz --method distance --extended 0.04:0.16:0.005 --high 0.3:0.6:0.01
+
+手指伸直的判断方式（及被评估/搜索的阈值）默认取 gesture_recognition.finger_recognition.method：
+angle 为关节弯曲角阈值 + 伸直比例阈值，distance 为指尖到指根距离阈值。
+"""
+import argparse
+import csv
+import itertools
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Sequence, Tuple
+
+from chord_classifier import ChordClassifier, UNKNOWN_CHORD
+from finger_state import FingerStateEstimator
+from gesture_analyzer1 import GestureAnalyzer
+import utils
+
+def load_dataset(path: str) -> Dict[str, np.ndarray]:
+    """读取带标签的关键点数据集"""
+    with np.load(path, allow_pickle=False) as data:
+        return {
+            'landmarks': data['landmarks'].astype(np.float32),
+            'labels': data['labels'].astype(str),
+            'handedness': data['handedness'].astype(str) if 'handedness' in data
+                          else np.full(len(data['labels']), 'Right'),
+            'aspect': data['aspect'].astype(np.float32) if 'aspect' in data
+                      else np.ones(len(data['labels']), dtype=np.float32)
+        }
+
+def add_recording_to_dataset(dataset_path: str, recording_path: str, chord: str, every: int = 1) -> int:
+    """把录制会话中每帧的第一只手以 chord 为标签追加到数据集，返回新增样本数"""
+    from replay_harness import Recording
+
+    recording = Recording(recording_path)
+    height, width = recording.frame_shape[:2] if recording.frame_shape[0] else (480, 640)
+    landmarks, handedness = [], []
+    for index in range(0, len(recording), max(1, every)):
+        hand_frame = recording.hand_frame(index)
+        if len(hand_frame):
+            landmarks.append(hand_frame.landmarks[0])
+            handedness.append(hand_frame.handedness[0])
+    if not landmarks:
+        return 0
+
+    landmarks = np.stack(landmarks)
+    added = len(landmarks)
+    labels = np.full(added, chord)
+    handedness = np.asarray(handedness)
+    aspect = np.full(added, width / height, dtype=np.float32)
+    if os.path.exists(dataset_path):
+        existing = load_dataset(dataset_path)
+        landmarks = np.concatenate([existing['landmarks'], landmarks])
+        labels = np.concatenate([existing['labels'], labels])
+        handedness = np.concatenate([existing['handedness'], handedness])
+        aspect = np.concatenate([existing['aspect'], aspect])
+    np.savez_compressed(dataset_path, landmarks=landmarks, labels=labels.astype(str),
+                        handedness=handedness.astype(str), aspect=aspect)
+    return added
+
+def evaluate(analyzer: GestureAnalyzer, dataset: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """用分析器当前的阈值批量识别数据集，返回准确率、混淆矩阵与吞吐量"""
+    start = time.perf_counter()
+    features = analyzer.compute_features(dataset['landmarks'], dataset['aspect'][:, np.newaxis])
+    predictions = analyzer.chord_classifier.classify(features['finger_states'], features['position'],
+                                                     dataset['handedness']).astype(str)
+    elapsed = time.perf_counter() - start
+
+    labels = dataset['labels']
+    names = sorted(set(labels.tolist()) | set(predictions.tolist()))
+    index = {name: i for i, name in enumerate(names)}
+    confusion = np.zeros((len(names), len(names)), dtype=np.int64)
+    np.add.at(confusion, ([index[l] for l in labels], [index[p] for p in predictions]), 1)
+
+    return {
+        'samples': len(labels),
+        'accuracy': float((predictions == labels).mean()) if len(labels) else 0.0,
+        'names': names,
+        'confusion': confusion,
+        'frames_per_second': len(labels) / elapsed if elapsed > 0 else float('inf')
+    }
+
+def print_evaluation(result: Dict[str, Any]):
+    """打印评估结果"""
+    print(f"样本数: {result['samples']} | 准确率: {result['accuracy']:.2%} | "
+          f"吞吐: {result['frames_per_second']:.0f} 帧/秒")
+    names = result['names']
+    width = max(len(name) for name in names) + 2
+    print("混淆矩阵（行为标签，列为识别结果）:")
+    print(" " * width + "".join(f"{name:>{width}}" for name in names))
+    for name, row in zip(names, result['confusion']):
+        print(f"{name:<{width}}" + "".join(f"{value:>{width}}" for value in row))
+
+def _sweep_chunk(masks: np.ndarray, centers: np.ndarray, hands: np.ndarray, label_codes: np.ndarray,
+                 chord_table: List[Dict[str, Any]], high_values: np.ndarray, low_values: np.ndarray) -> np.ndarray:
+    """在工作进程中计算一组手指掩码下所有位置阈值组合的准确率，返回 (E, H, L)"""
+    classifier = ChordClassifier(chord_table)
+    unknown_code = len(classifier.chord_names)
+    table = np.where(classifier.table < 0, unknown_code, classifier.table)
+
+    # (H, L, N) 位置档：0=高，1=中，2=低
+    bands = ((centers >= high_values[:, np.newaxis, np.newaxis]).astype(np.int8)
+             + (centers >= low_values[np.newaxis, :, np.newaxis]))
+
+    accuracy = np.full((len(masks), len(high_values), len(low_values)), np.nan)
+    valid = high_values[:, np.newaxis] < low_values[np.newaxis, :]
+    for e, mask in enumerate(masks):
+        predictions = table[mask, bands, hands]
+        accuracy[e][valid] = (predictions == label_codes).mean(axis=-1)[valid]
+    return accuracy
+
+class FingerMasks:
+    """按一组手指阈值计算 (E, N) 手指掩码；与阈值无关的特征只计算一次
+
+    method 为 distance 时每组阈值为 (伸直距离,)，为 angle 时为 (弯曲角阈值, 伸直比例阈值)，
+    与 GestureAnalyzer.compute_features 的判断一致。
+    """
+
+    def __init__(self, dataset: Dict[str, np.ndarray], method: str, min_finger_length: float = 0.05):
+        self.method = method
+        self.weights = 1 << np.arange(4)
+        if method == 'angle':
+            info = FingerStateEstimator().compute(dataset['landmarks'], dataset['aspect'][:, np.newaxis])
+            # 食指到小指（与 finger_states 一致，不含拇指）
+            self.bend = info['joint_angles'][:, 1:, 1:].mean(axis=-1)
+            self.straightness = info['straightness'][:, 1:]
+            self.long_enough = info['finger_length'][:, 1:] >= min_finger_length
+        else:
+            points = dataset['landmarks'][..., :2]
+            delta = points[:, [8, 12, 16, 20]] - points[:, [5, 9, 13, 17]]
+            self.distances = np.hypot(delta[..., 0], delta[..., 1])
+
+    def __call__(self, grid: np.ndarray) -> np.ndarray:
+        """grid 形状 (E, P)，返回 (E, N) 手指掩码"""
+        if self.method == 'angle':
+            angle = grid[:, 0, np.newaxis, np.newaxis]
+            straightness = grid[:, 1, np.newaxis, np.newaxis]
+            extended = (self.bend < angle) & (self.straightness >= straightness) & self.long_enough
+        else:
+            extended = self.distances > grid[:, 0, np.newaxis, np.newaxis]
+        return extended @ self.weights
+
+def sweep(dataset: Dict[str, np.ndarray], chord_table: List[Dict[str, Any]], finger_grid: Sequence[Sequence[float]],
+          high_values: Sequence[float], low_values: Sequence[float], workers: int = None,
+          method: str = 'distance', min_finger_length: float = 0.05) -> List[Tuple[float, ...]]:
+    """并行网格搜索 (手指阈值..., 高位阈值, 低位阈值)，返回按准确率降序排列的 (准确率, 手指阈值..., 高位, 低位)
+
+    finger_grid 的每一项为一组手指阈值，含义见 FingerMasks。
+    """
+    finger_grid = np.asarray(finger_grid, dtype=np.float32).reshape(len(finger_grid), -1)
+    high_values = np.asarray(high_values, dtype=np.float32)
+    low_values = np.asarray(low_values, dtype=np.float32)
+
+    # 与阈值无关的特征只计算一次
+    finger_masks = FingerMasks(dataset, method, min_finger_length)
+    points = dataset['landmarks'][..., :2]
+    centers = (points[..., 1].min(axis=1) + points[..., 1].max(axis=1)) / 2
+    hands = np.array([ChordClassifier.hand_index(hand) for hand in dataset['handedness']], dtype=np.intp)
+
+    classifier = ChordClassifier(chord_table)
+    codes = {name: i for i, name in enumerate(classifier.chord_names + [UNKNOWN_CHORD])}
+    label_codes = np.array([codes.get(label, -1) for label in dataset['labels']])
+
+    # 每个任务处理若干组手指阈值，兼顾负载均衡与进程间传输量
+    chunks = np.array_split(finger_grid, min(len(finger_grid), (workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_sweep_chunk, finger_masks(chunk), centers, hands, label_codes, chord_table,
+                                   high_values, low_values) for chunk in chunks if len(chunk)]
+        accuracy = np.concatenate([future.result() for future in futures])
+
+    results = []
+    for e, h, l in zip(*np.nonzero(~np.isnan(accuracy))):
+        results.append((float(accuracy[e, h, l]),) + tuple(round(float(v), 4) for v in finger_grid[e])
+                       + (round(float(high_values[h]), 4), round(float(low_values[l]), 4)))
+    results.sort(key=lambda item: item[0], reverse=True)
+    return results
+
+def parse_range(text: str) -> np.ndarray:
+    """解析 "start:stop:step"（包含stop）或单个数值"""
+    parts = [float(part) for part in text.split(':')]
+    if len(parts) == 1:
+        return np.array(parts)
+    start, stop, step = parts
+    return np.arange(start, stop + step / 2, step)
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="手势分析器离线评估与阈值搜索")
+    parser.add_argument('--config', default='config.yaml', help="配置文件路径")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="从录制会话生成带标签的数据集")
+    build_parser.add_argument('dataset', help="数据集 .npz 文件（存在时追加）")
+    build_parser.add_argument('recording', help="replay_harness.py 录制的 .npz 文件")
+    build_parser.add_argument('chord', help="该会话对应的和弦标签")
+    build_parser.add_argument('--every', type=int, default=1, help="每隔多少帧取一个样本")
+
+    eval_parser = subparsers.add_parser('eval', help="评估一组阈值")
+    eval_parser.add_argument('dataset', help="数据集 .npz 文件")
+    eval_parser.add_argument('--method', choices=['angle', 'distance'], default=None,
+                             help="手指伸直判断方式（默认取配置）")
+    eval_parser.add_argument('--extended', type=float, default=GestureAnalyzer.extended_threshold,
+                             help="distance：指尖到指根距离阈值")
+    eval_parser.add_argument('--angle', type=float, default=None, help="angle：弯曲角阈值（度，默认取配置）")
+    eval_parser.add_argument('--straightness', type=float, default=None, help="angle：伸直比例阈值（默认取配置）")
+    eval_parser.add_argument('--high', type=float, default=GestureAnalyzer.position_thresholds[0])
+    eval_parser.add_argument('--low', type=float, default=GestureAnalyzer.position_thresholds[1])
+
+    sweep_parser = subparsers.add_parser('sweep', help="并行网格搜索阈值组合")
+    sweep_parser.add_argument('dataset', help="数据集 .npz 文件")
+    sweep_parser.add_argument('--method', choices=['angle', 'distance'], default=None,
+                              help="手指伸直判断方式（默认取配置）")
+    sweep_parser.add_argument('--extended', default='0.04:0.16:0.005', help="distance：伸直距离阈值范围 start:stop:step")
+    sweep_parser.add_argument('--angle', default='15:45:2.5', help="angle：弯曲角阈值范围（度）")
+    sweep_parser.add_argument('--straightness', default='0.6:0.95:0.025', help="angle：伸直比例阈值范围")
+    sweep_parser.add_argument('--high', default='0.3:0.6:0.01', help="高位阈值范围")
+    sweep_parser.add_argument('--low', default='0.55:0.9:0.01', help="低位阈值范围")
+    sweep_parser.add_argument('--workers', type=int, default=None, help="工作进程数（默认CPU核数）")
+    sweep_parser.add_argument('--top', type=int, default=10, help="显示前N个结果")
+    sweep_parser.add_argument('--csv', default=None, help="把全部结果写入CSV")
+    args = parser.parse_args()
+
+    config = utils.load_config(args.config)
+    if args.command == 'build':
+        count = add_recording_to_dataset(args.dataset, args.recording, args.chord, args.every)
+        print(f"✅ 已添加 {count} 个 {args.chord} 样本 → {args.dataset}")
+        return
+
+    dataset = load_dataset(args.dataset)
+    finger_config = config.get('gesture_recognition', {}).get('finger_recognition', {})
+    method = args.method or finger_config.get('method', 'distance')
+    if args.command == 'eval':
+        analyzer = GestureAnalyzer(config)
+        analyzer.finger_method = method
+        analyzer.extended_threshold = args.extended
+        if args.angle is not None:
+            analyzer.finger_estimator.angle_threshold = args.angle
+        if args.straightness is not None:
+            analyzer.finger_estimator.extended_threshold = args.straightness
+        analyzer.position_thresholds = (args.high, args.low)
+        if method == 'angle':
+            print(f"手指判断: angle | 弯曲角 < {analyzer.finger_estimator.angle_threshold}° | "
+                  f"伸直比例 ≥ {analyzer.finger_estimator.extended_threshold}")
+        else:
+            print(f"手指判断: distance | 指尖到指根距离 > {analyzer.extended_threshold}")
+        print_evaluation(evaluate(analyzer, dataset))
+        return
+
+    chord_table = config.get('gesture_recognition', {}).get('chord_table')
+    if method == 'angle':
+        finger_names = ['angle_threshold', 'straightness_threshold']
+        finger_grid = list(itertools.product(parse_range(args.angle), parse_range(args.straightness)))
+    else:
+        finger_names = ['extended_threshold']
+        finger_grid = [(value,) for value in parse_range(args.extended)]
+    high_values, low_values = parse_range(args.high), parse_range(args.low)
+    total = len(finger_grid) * len(high_values) * len(low_values)
+    print(f"🔍 {len(dataset['labels'])} 个样本 × {total} 组阈值（手指判断: {method}）")
+
+    start_time = time.time()
+    results = sweep(dataset, chord_table, finger_grid, high_values, low_values, args.workers,
+                    method, finger_config.get('min_finger_length', 0.05))
+    print(f"⏱️ 用时 {time.time() - start_time:.1f}s，有效组合 {len(results)} 个")
+
+    if method == 'angle':
+        print(f"{'准确率':>8}{'弯曲角':>9}{'伸直比例':>10}{'高位':>8}{'低位':>8}")
+        for accuracy, angle, straightness, high, low in results[:args.top]:
+            print(f"{accuracy:>9.2%}{angle:>12.1f}{straightness:>12.3f}{high:>10.3f}{low:>10.3f}")
+    else:
+        print(f"{'准确率':>8}{'伸直阈值':>10}{'高位':>8}{'低位':>8}")
+        for accuracy, extended, high, low in results[:args.top]:
+            print(f"{accuracy:>9.2%}{extended:>12.3f}{high:>10.3f}{low:>10.3f}")
+
+    if args.csv:
+        with open(args.csv, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['accuracy'] + finger_names + ['high_position', 'low_position'])
+            writer.writerows(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import numpy as np
+from typing import Any, Dict
+
+# 五根手指从手腕开始的关键点链：腕 → 掌指(MCP) → 近端(PIP) → 远端(DIP) → 指尖
+# 拇指对应 腕 → CMC → MCP → IP → 指尖
+FINGER_CHAINS = np.array([
+    [0, 1, 2, 3, 4],
+    [0, 5, 6, 7, 8],
+    [0, 9, 10, 11, 12],
+    [0, 13, 14, 15, 16],
+    [0, 17, 18, 19, 20],
+], dtype=np.intp)
+
+MIDDLE_MCP_INDEX = 9
+
+class FingerStateEstimator:
+    """基于关节角度的手指状态计算（五根手指、所有手一次向量化完成）
+
+    每根手指计算 MCP/PIP/DIP 三个关节的弯曲角（0°为完全伸直），
+    以 PIP、DIP 的平均弯曲角判断伸直（angle_threshold），
+    同时要求指尖到指根的直线距离与手指各节长度之和的比值不低于 extended_threshold，
+    手指投影长度（按手掌大小归一化）小于 min_finger_length 时视为不可靠，判为弯曲。
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        finger_config = (config or {}).get('gesture_recognition', {}).get('finger_recognition', {})
+        self.angle_threshold = finger_config.get('angle_threshold', 30)
+        self.extended_threshold = finger_config.get('extended_threshold', 0.8)
+        self.min_finger_length = finger_config.get('min_finger_length', 0.05)
+
+    def compute(self, landmarks: np.ndarray, aspect: float = 1.0) -> Dict[str, np.ndarray]:
+        """计算 (..., 21, 3) 关键点的手指状态，返回数组保留前置维度
+
+        joint_angles  (..., 5, 3)  MCP/PIP/DIP 弯曲角（度）
+        curl          (..., 5)     弯曲程度 0~1（PIP与DIP弯曲角之和 / 180°）
+        straightness  (..., 5)     指尖到指根直线距离 / 各节长度之和
+        finger_length (..., 5)     手指长度 / 手掌大小
+        extended      (..., 5)     是否伸直
+        """
+        points = np.array(landmarks, dtype=np.float32)
+        # 归一化坐标的 x 与 z 以画面宽度为单位，换算到与 y 相同的比例
+        points[..., 0] *= aspect
+        points[..., 2] *= aspect
+
+        chains = points[..., FINGER_CHAINS, :]              # (..., 5, 5, 3)
+        segments = np.diff(chains, axis=-2)                  # (..., 5, 4, 3)
+        lengths = np.linalg.norm(segments, axis=-1)          # (..., 5, 4)
+        safe_lengths = np.maximum(lengths, 1e-6)
+
+        # 相邻两节的夹角即关节弯曲角
+        cosines = (segments[..., :-1, :] * segments[..., 1:, :]).sum(axis=-1) / (
+            safe_lengths[..., :-1] * safe_lengths[..., 1:])
+        joint_angles = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+
+        palm_size = np.maximum(np.linalg.norm(points[..., MIDDLE_MCP_INDEX, :] - points[..., 0, :], axis=-1), 1e-6)
+        finger_span = lengths[..., 1:].sum(axis=-1)
+        finger_length = finger_span / palm_size[..., np.newaxis]
+        straightness = (np.linalg.norm(chains[..., 4, :] - chains[..., 1, :], axis=-1)
+                        / np.maximum(finger_span, 1e-6))
+
+        bend = joint_angles[..., 1:].mean(axis=-1)
+        curl = np.clip(joint_angles[..., 1:].sum(axis=-1) / 180.0, 0.0, 1.0)
+        extended = ((bend < self.angle_threshold)
+                    & (straightness >= self.extended_threshold)
+                    & (finger_length >= self.min_finger_length))
+
+        return {
+            'joint_angles': joint_angles,
+            'curl': curl,
+            'straightness': straightness,
+            'finger_length': finger_length,
+            'extended': extended
+        }
@@ -1,85 +1,85 @@
-# fix_all_errors.py - 一键修复脚本
-import os
-
-# 修复 gesture_analyzer.py
-gesture_analyzer_content = '''
-import numpy as np
-import logging
-from collections import Counter
-
-logger = logging.getLogger("GestureAnalyzer")
-
-class GestureAnalyzer:
-    """手势分析器类"""
-    
-    def __init__(self, smoothness=5):
-        self.smoothness = smoothness
-        self.gesture_history = []
-        self.current_gesture = "未知"
-        logger.info("✅ 手势分析器初始化完成")
-    
-    def analyze_hand_landmarks(self, hand_info):
-        """分析手部关键点识别手势"""
-        if hand_info is None:
-            return "未检测到手部"
-        return "测试手势"
-    
-    def _basic_gesture_recognition(self, hand_info):
-        return "测试手势"
-
-class GuitarChordDetector:
-    """吉他和弦检测器"""
-    
-    def __init__(self):
-        self.chord_history = []
-        logger.info("✅ 吉他和弦检测器初始化完成")
-    
-    def detect_chord(self, left_hand_gesture, right_hand_gesture):
-        return "C大调"
-'''
-
-# 修复 utils.py
-utils_content = '''
-import yaml
-import logging
-
-class Config:
-    def __init__(self, config_path="config.yaml"):
-        self.data = {
-            'app': {'title': 'Air Guitar 3D', 'icon': '🎸'},
-            'camera': {'id': 0, 'width': 640, 'height': 480},
-            'hand_detection': {'max_hands': 2, 'detection_confidence': 0.7}
-        }
-    
-    def get(self, key, default=None):
-        return default
-    
-    @property
-    def APP_TITLE(self): return 'Air Guitar 3D'
-    @property
-    def APP_ICON(self): return '🎸'
-    @property
-    def CAMERA_ID(self): return 0
-    @property
-    def FRAME_WIDTH(self): return 640
-    @property
-    def FRAME_HEIGHT(self): return 480
-    @property
-    def MAX_HANDS(self): return 2
-    @property
-    def HAND_DETECTION_CONFIDENCE(self): return 0.7
-
-config = Config()
-
-def setup_logging():
-    logging.basicConfig(level=logging.INFO)
-'''
-
-# 写入修复文件
-with open('gesture_analyzer.py', 'w', encoding='utf-8') as f:
-    f.write(gesture_analyzer_content)
-
-with open('utils.py', 'w', encoding='utf-8') as f:
-    f.write(utils_content)
-
-print("✅ 所有文件已修复完成！")
+# fix_all_errors.py - 一键修复脚本
+import os
+
+# 修复 gesture_analyzer.py
+gesture_analyzer_content = '''
+import numpy as np
+import logging
+from collections import Counter
+
+logger = logging.getLogger("GestureAnalyzer")
+
+class GestureAnalyzer:
+    """手势分析器类"""
+    
+    def __init__(self, smoothness=5):
+        self.smoothness = smoothness
+        self.gesture_history = []
+        self.current_gesture = "未知"
+        logger.info("✅ 手势分析器初始化完成")
+    
+    def analyze_hand_landmarks(self, hand_info):
+        """分析手部关键点识别手势"""
+        if hand_info is None:
+            return "未检测到手部"
+        return "测试手势"
+    
+    def _basic_gesture_recognition(self, hand_info):
+        return "测试手势"
+
+class GuitarChordDetector:
+    """吉他和弦检测器"""
+    
+    def __init__(self):
+        self.chord_history = []
+        logger.info("✅ 吉他和弦检测器初始化完成")
+    
+    def detect_chord(self, left_hand_gesture, right_hand_gesture):
+        return "C大调"
+'''
+
+# 修复 utils.py
+utils_content = '''
+import yaml
+import logging
+
+class Config:
+    def __init__(self, config_path="config.yaml"):
+        self.data = {
+            'app': {'title': 'Air Guitar 3D', 'icon': '🎸'},
+            'camera': {'id': 0, 'width': 640, 'height': 480},
+            'hand_detection': {'max_hands': 2, 'detection_confidence': 0.7}
+        }
+    
+    def get(self, key, default=None):
+        return default
+    
+    @property
+    def APP_TITLE(self): return 'Air Guitar 3D'
+    @property
+    def APP_ICON(self): return '🎸'
+    @property
+    def CAMERA_ID(self): return 0
+    @property
+    def FRAME_WIDTH(self): return 640
+    @property
+    def FRAME_HEIGHT(self): return 480
+    @property
+    def MAX_HANDS(self): return 2
+    @property
+    def HAND_DETECTION_CONFIDENCE(self): return 0.7
+
+config = Config()
+
+def setup_logging():
+    logging.basicConfig(level=logging.INFO)
+'''
+
+# 写入修复文件
+with open('gesture_analyzer.py', 'w', encoding='utf-8') as f:
+    f.write(gesture_analyzer_content)
+
+with open('utils.py', 'w', encoding='utf-8') as f:
+    f.write(utils_content)
+
+print("✅ 所有文件已修复完成！")
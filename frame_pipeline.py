@@ -0,0 +1,279 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 背压策略
+POLICY_BLOCK = 'block'        # 队列满时阻塞上游，直到有空位
+POLICY_DROP = 'drop'          # 队列满时丢弃新到的数据
+POLICY_COALESCE = 'coalesce'  # 队列满时丢弃最旧的数据，保留最新的
+
+BACKPRESSURE_POLICIES = (POLICY_BLOCK, POLICY_DROP, POLICY_COALESCE)
+
+# 同一阶段的处理错误至多每隔该时间打印一次（秒）
+ERROR_LOG_INTERVAL = 5.0
+
+class StageQueue:
+    """带背压策略的有界队列"""
+
+    def __init__(self, maxsize: int = 2, policy: str = POLICY_BLOCK):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"未知的背压策略: {policy}")
+
+        self.maxsize = max(1, int(maxsize))
+        self.policy = policy
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+
+        self.dropped = 0
+
+    def put(self, item: Any, timeout: float = None) -> bool:
+        """按背压策略放入数据，返回数据是否入队"""
+        with self._lock:
+            if self._closed:
+                return False
+
+            if len(self._items) >= self.maxsize:
+                if self.policy == POLICY_DROP:
+                    self.dropped += 1
+                    return False
+                elif self.policy == POLICY_COALESCE:
+                    while len(self._items) >= self.maxsize:
+                        self._items.popleft()
+                        self.dropped += 1
+                else:
+                    deadline = None if timeout is None else time.monotonic() + timeout
+                    while len(self._items) >= self.maxsize and not self._closed:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.dropped += 1
+                            return False
+                        self._not_full.wait(remaining)
+                    if self._closed:
+                        return False
+
+            self._items.append(item)
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout: float = None) -> Optional[Any]:
+        """取出最早的数据，超时或队列关闭时返回None"""
+        with self._lock:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._items and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._not_empty.wait(remaining)
+
+            if not self._items:
+                return None
+
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def depth(self) -> int:
+        """当前队列深度"""
+        with self._lock:
+            return len(self._items)
+
+    def close(self):
+        """关闭队列并唤醒所有等待者"""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+class PipelineStage:
+    """流水线阶段：独占一个工作线程，从输入队列取数据处理后交给下游"""
+
+    def __init__(self, name: str, handler: Callable[[Any], Any],
+                 queue_size: int = 2, policy: str = POLICY_BLOCK):
+        self.name = name
+        self.handler = handler
+        self.input_queue = StageQueue(queue_size, policy)
+        self.output_queue: Optional[StageQueue] = None
+        # 处理失败时回调 (阶段名, 错误信息)，由流水线转交给界面循环
+        self.on_error: Optional[Callable[[str, str], None]] = None
+
+        # 统计信息
+        self.processed = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self._error_logged_at = None
+        self._suppressed_errors = 0
+        self.last_service_time = 0.0
+        self.avg_service_time = 0.0
+        self.max_service_time = 0.0
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self):
+        """启动工作线程"""
+        self._running = True
+        self._thread = threading.Thread(target=self._worker_loop, name=f"Stage-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _worker_loop(self):
+        """工作线程主循环"""
+        while self._running:
+            item = self.input_queue.get(timeout=0.1)
+            if item is None:
+                continue
+
+            start = time.perf_counter()
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                self._record_error(e)
+                continue
+            self._record_service_time(time.perf_counter() - start)
+
+            # 返回None表示该数据在此阶段被过滤
+            if result is not None and self.output_queue is not None:
+                self.output_queue.put(result)
+
+    def _record_error(self, error: Exception):
+        """记录处理错误并通知流水线；控制台输出按 ERROR_LOG_INTERVAL 限频"""
+        self.errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        if self.on_error is not None:
+            self.on_error(self.name, self.last_error)
+
+        now = time.monotonic()
+        if self._error_logged_at is not None and now - self._error_logged_at < ERROR_LOG_INTERVAL:
+            self._suppressed_errors += 1
+            return
+        suppressed = f"（期间另有 {self._suppressed_errors} 次失败未输出）" if self._suppressed_errors else ""
+        print(f"❌ 流水线阶段 {self.name} 处理失败: {self.last_error}{suppressed}")
+        self._error_logged_at = now
+        self._suppressed_errors = 0
+
+    def _record_service_time(self, elapsed: float):
+        """记录服务时间（指数滑动平均）"""
+        self.processed += 1
+        self.last_service_time = elapsed
+        self.max_service_time = max(self.max_service_time, elapsed)
+        if self.processed == 1:
+            self.avg_service_time = elapsed
+        else:
+            self.avg_service_time = 0.9 * self.avg_service_time + 0.1 * elapsed
+
+    def stop(self):
+        """停止工作线程"""
+        self._running = False
+        self.input_queue.close()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取阶段统计信息"""
+        return {
+            'queue_depth': self.input_queue.depth(),
+            'queue_size': self.input_queue.maxsize,
+            'policy': self.input_queue.policy,
+            'processed': self.processed,
+            'dropped': self.input_queue.dropped,
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'last_service_ms': self.last_service_time * 1000,
+            'avg_service_ms': self.avg_service_time * 1000,
+            'max_service_ms': self.max_service_time * 1000
+        }
+
+class FramePipeline:
+    """多阶段帧处理流水线，各阶段之间通过有界队列连接"""
+
+    def __init__(self, output_size: int = 1, output_policy: str = POLICY_COALESCE):
+        self.stages: List[PipelineStage] = []
+        self.output_queue = StageQueue(output_size, output_policy)
+        self.is_running = False
+        self._error: Optional[Tuple[str, str]] = None
+        self._error_lock = threading.Lock()
+
+    def add_stage(self, name: str, handler: Callable[[Any], Any],
+                  queue_size: int = 2, policy: str = POLICY_BLOCK) -> PipelineStage:
+        """追加一个处理阶段"""
+        if self.is_running:
+            raise RuntimeError("流水线运行中不能添加阶段")
+
+        stage = PipelineStage(name, handler, queue_size, policy)
+        if self.stages:
+            self.stages[-1].output_queue = stage.input_queue
+        stage.output_queue = self.output_queue
+        stage.on_error = self._report_error
+        self.stages.append(stage)
+        return stage
+
+    @classmethod
+    def from_config(cls, handlers: Dict[str, Callable[[Any], Any]],
+                    config: Dict[str, Any] = None) -> 'FramePipeline':
+        """根据 performance.pipeline 配置按顺序构建流水线"""
+        config = config or {}
+        stage_configs = config.get('stages', {})
+        output_config = config.get('output', {})
+
+        pipeline = cls(output_config.get('queue_size', 1),
+                       output_config.get('policy', POLICY_COALESCE))
+        for name, handler in handlers.items():
+            stage_config = stage_configs.get(name, {})
+            pipeline.add_stage(name, handler,
+                               stage_config.get('queue_size', 2),
+                               stage_config.get('policy', POLICY_BLOCK))
+        return pipeline
+
+    def start(self) -> 'FramePipeline':
+        """启动所有阶段"""
+        if not self.is_running:
+            for stage in self.stages:
+                stage.start()
+            self.is_running = True
+        return self
+
+    def submit(self, item: Any, timeout: float = None) -> bool:
+        """向第一个阶段提交数据"""
+        if not self.stages:
+            return self.output_queue.put(item, timeout)
+        return self.stages[0].input_queue.put(item, timeout)
+
+    def get_result(self, timeout: float = 0.0) -> Optional[Any]:
+        """获取最后一个阶段的输出"""
+        return self.output_queue.get(timeout)
+
+    def _report_error(self, stage_name: str, message: str):
+        with self._error_lock:
+            self._error = (stage_name, message)
+
+    def take_error(self) -> Optional[Tuple[str, str]]:
+        """取出最近一次阶段处理错误 (阶段名, 错误信息)，自上次取出后没有新错误时返回None"""
+        with self._error_lock:
+            error, self._error = self._error, None
+            return error
+
+    def stop(self):
+        """停止所有阶段"""
+        for stage in self.stages:
+            stage.stop()
+        self.output_queue.close()
+        self.is_running = False
+
+    def bottleneck_time(self) -> float:
+        """最慢阶段最近一次的服务时间（秒）：各阶段并行运行，流水线的吞吐由它决定"""
+        return max((stage.last_service_time for stage in self.stages), default=0.0)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """获取各阶段的队列深度与服务时间"""
+        stats = {stage.name: stage.get_stats() for stage in self.stages}
+        stats['output'] = {
+            'queue_depth': self.output_queue.depth(),
+            'queue_size': self.output_queue.maxsize,
+            'policy': self.output_queue.policy,
+            'dropped': self.output_queue.dropped
+        }
+        return stats
@@ -1,184 +1,274 @@
-import numpy as np
-from typing import List, Dict, Tuple, Any
-import utils
-
-class GestureAnalyzer:
-    """手势分析与和弦识别"""
-    
-    def __init__(self, config: Dict[str, Any] = None):
-        if config is None:
-            config = utils.load_config()
-            
-        self.guitar_config = config['guitar']
-        self.chords_config = config['chords']
-        
-    def analyze_hand_position(self, hand_data: Dict, image_shape: Tuple[int, int]) -> Dict[str, Any]:
-        """分析手部位置并映射到吉他指板"""
-        if not hand_data:
-            return {'detected': False}
-            
-        landmarks = hand_data['landmarks']
-        finger_tips = self.get_finger_tips(landmarks)
-        
-        # 计算手部边界框
-        x_coords = [lm[0] for lm in landmarks]
-        y_coords = [lm[1] for lm in landmarks]
-        
-        hand_bbox = {
-            'x_min': min(x_coords),
-            'x_max': max(x_coords),
-            'y_min': min(y_coords),
-            'y_max': max(y_coords),
-            'width': max(x_coords) - min(x_coords),
-            'height': max(y_coords) - min(y_coords)
-        }
-        
-        # 计算手部特征
-        hand_features = self.calculate_hand_features(finger_tips, landmarks)
-        
-        # 识别和弦
-        chord = self.recognize_chord_by_count_and_position(hand_features, hand_bbox)
-        
-        return {
-            'detected': True,
-            'hand_type': hand_data['type'],
-            'finger_tips': finger_tips,
-            'bounding_box': hand_bbox,
-            'hand_features': hand_features,
-            'gesture': chord
-        }
-    
-    def get_finger_tips(self, landmarks: List[Tuple[float, float, float]]) -> Dict[str, Tuple[float, float]]:
-        """获取手指尖端坐标"""
-        return {
-            'thumb': (landmarks[4][0], landmarks[4][1]),
-            'index': (landmarks[8][0], landmarks[8][1]),
-            'middle': (landmarks[12][0], landmarks[12][1]),
-            'ring': (landmarks[16][0], landmarks[16][1]),
-            'pinky': (landmarks[20][0], landmarks[20][1])
-        }
-    
-    def calculate_hand_features(self, finger_tips: Dict, landmarks: List) -> Dict[str, Any]:
-        """计算手部特征"""
-        features = {}
-        
-        # 计算每个手指的伸直状态（排除拇指）
-        finger_states = {}
-        for finger in ['index', 'middle', 'ring', 'pinky']:
-            finger_states[finger] = self.is_finger_extended_simple(finger, landmarks)
-        
-        features['finger_states'] = finger_states
-        
-        # 计算伸直手指数量（排除拇指）
-        extended_count = sum(1 for state in finger_states.values() if state)
-        features['extended_count'] = extended_count
-        
-        # 计算伸直手指的组合
-        extended_fingers = [finger for finger, state in finger_states.items() if state]
-        features['extended_fingers'] = extended_fingers
-        
-        # 调试信息
-        print(f"手指状态: {finger_states}")
-        print(f"伸直手指: {extended_fingers} (共{extended_count}个)")
-        
-        return features
-    
-    def is_finger_extended_simple(self, finger: str, landmarks: List) -> bool:
-        """简化的手指伸直检测"""
-        # 手指关键点索引
-        finger_indices = {
-            'index': [5, 6, 7, 8],
-            'middle': [9, 10, 11, 12],
-            'ring': [13, 14, 15, 16],
-            'pinky': [17, 18, 19, 20]
-        }
-        
-        if finger not in finger_indices:
-            return False
-        
-        indices = finger_indices[finger]
-        
-        # 获取指尖和指根坐标
-        tip = landmarks[indices[-1]]  # 指尖
-        base = landmarks[indices[0]]  # 指根
-        
-        # 计算指尖到指根的距离
-        distance = ((tip[0] - base[0])**2 + (tip[1] - base[1])**2) ** 0.5
-        
-        # 调整阈值 - 降低阈值以提高识别灵敏度
-        return distance > 0.08  # 从0.1降低到0.08
-    
-    def recognize_chord_by_count_and_position(self, features: Dict, bbox: Dict) -> str:
-        """基于手指数量和位置识别和弦"""
-        extended_count = features['extended_count']
-        hand_position = self.get_hand_position(bbox)
-        
-        print(f"调试信息: 伸直手指数={extended_count}, 位置={hand_position}")
-        
-        # 基于伸直手指数量和位置的识别
-        # C大调：两指伸直，手部在较高位置
-        if extended_count == 2 and hand_position == 'high':
-            print("✅ 识别为 C大调: 两指伸直 + 手部抬高")
-            return 'C_major'
-        
-        # G大调：两指伸直，手部在较低位置
-        elif extended_count == 2 and hand_position == 'low':
-            print("✅ 识别为 G大调: 两指伸直 + 手部放低")
-            return 'G_major'
-        
-        # D大调：三指伸直，手部在较高位置
-        elif extended_count == 3 and hand_position == 'high':
-            print("✅ 识别为 D大调: 三指伸直 + 手部抬高")
-            return 'D_major'
-        
-        # A小调：三指伸直，手部在较低位置
-        elif extended_count == 3 and hand_position == 'low':
-            print("✅ 识别为 A小调: 三指伸直 + 手部放低")
-            return 'A_minor'
-        
-        # E小调：四指伸直，手部在较高位置
-        elif extended_count == 4 and hand_position == 'high':
-            print("✅ 识别为 E小调: 四指伸直 + 手部抬高")
-            return 'E_minor'
-        
-        # F大调：四指伸直，手部在较低位置
-        elif extended_count == 4 and hand_position == 'low':
-            print("✅ 识别为 F大调: 四指伸直 + 手部放低")
-            return 'F_major'
-        
-        print(f"❌ 未识别: 伸直{extended_count}指, 位置{hand_position}")
-        return "unknown"
-    
-    def get_hand_position(self, bbox: Dict) -> str:
-        """获取手部位置（高/中/低）"""
-        vertical_center = (bbox['y_min'] + bbox['y_max']) / 2
-        
-        print(f"手部垂直位置: {vertical_center}")
-        
-        # 调整位置阈值，让"高"位置更容易识别
-        if vertical_center < 0.5:  # 从0.4调整到0.5
-            return 'high'
-        elif vertical_center < 0.7:
-            return 'middle'
-        else:
-            return 'low'
-    
-    def calculate_strumming_direction(self, prev_hand_data: Dict, current_hand_data: Dict) -> str:
-        """计算扫弦方向"""
-        if not prev_hand_data or not current_hand_data:
-            return "none"
-        
-        if not prev_hand_data.get('detected', False) or not current_hand_data.get('detected', False):
-            return "none"
-            
-        prev_y = prev_hand_data['bounding_box']['y_min']
-        current_y = current_hand_data['bounding_box']['y_min']
-        
-        movement = current_y - prev_y
-        
-        if movement > 0.05:
-            return "downstroke"
-        elif movement < -0.05:
-            return "upstroke"
-        else:
-            return "none"
+import numpy as np
+from typing import List, Dict, Tuple, Any
+from hand_frame import HandFrame, FINGER_NAMES, FINGER_TIP_INDICES
+from diagnostics import Diagnostics
+from chord_classifier import ChordClassifier, POSITION_BANDS
+from pose_matcher import PoseMatcher
+from gesture_model import GestureModel
+from finger_state import FingerStateEstimator
+import utils
+
+# 参与和弦识别的手指（排除拇指）及其指根/指尖索引
+FEATURE_FINGERS = ['index', 'middle', 'ring', 'pinky']
+FEATURE_BASE_INDICES = [5, 9, 13, 17]
+FEATURE_TIP_INDICES = [8, 12, 16, 20]
+
+def image_aspect(image_shape: Tuple[int, ...]) -> float:
+    """画面宽高比（未知时为1）"""
+    return image_shape[1] / image_shape[0] if len(image_shape) > 1 and image_shape[0] else 1.0
+
+class GestureAnalyzer:
+    """手势分析与和弦识别"""
+    
+    # 指尖到指根距离超过该值视为伸直（从0.1降低到0.08以提高灵敏度）
+    extended_threshold = 0.08
+    # 手部垂直中心的高/中/低分界（"高"从0.4调整到0.5，让其更容易识别）
+    position_thresholds = (0.5, 0.7)
+    
+    def __init__(self, config: Dict[str, Any] = None, diagnostics: Diagnostics = None):
+        if config is None:
+            config = utils.load_config()
+            
+        self.guitar_config = config['guitar']
+        self.chords_config = config['chords']
+        self.diagnostics = diagnostics if diagnostics is not None else Diagnostics(config)
+        self.chord_classifier = ChordClassifier.from_config(config)
+        self.pose_matcher = PoseMatcher.from_config(config)
+        self.gesture_model = GestureModel.from_config(config)
+        self.finger_estimator = FingerStateEstimator(config)
+        # 手指伸直判断方式：angle 使用关节角度，distance 使用指尖到指根的距离
+        self.finger_method = config.get('gesture_recognition', {}).get('finger_recognition', {}).get('method', 'distance')
+        # 每种手（Left/Right）上一次识别到的和弦，和弦变化时才按 INFO 记录
+        self._last_chords: Dict[str, str] = {}
+        
+    def analyze_frame(self, hand_frame: HandFrame, image_shape: Tuple[int, int]) -> List[Dict[str, Any]]:
+        """分析一帧中的所有手（所有手的特征一次批量计算）"""
+        if len(hand_frame) == 0:
+            return []
+        
+        features = self.compute_features(hand_frame.landmarks, image_aspect(image_shape))
+        self.match_poses(features, hand_frame.landmarks, hand_frame.handedness, image_shape)
+        results = []
+        for i in range(len(hand_frame)):
+            analysis = self.build_analysis(features, i, hand_frame.handedness[i])
+            analysis['score'] = float(hand_frame.scores[i])
+            results.append(analysis)
+        return results
+    
+    def analyze_hand_position(self, hand_data: Dict, image_shape: Tuple[int, int]) -> Dict[str, Any]:
+        """分析手部位置并映射到吉他指板"""
+        if not hand_data:
+            return {'detected': False}
+        
+        landmarks = np.asarray(hand_data['landmarks'], dtype=np.float32)
+        return self.analyze_landmarks(landmarks, hand_data['type'], image_shape)
+    
+    def analyze_landmarks(self, landmarks: np.ndarray, hand_type: str, image_shape: Tuple[int, int]) -> Dict[str, Any]:
+        """分析单只手的关键点数组（形状 (21, 3)）"""
+        features = self.compute_features(landmarks[np.newaxis], image_aspect(image_shape))
+        self.match_poses(features, landmarks[np.newaxis], [hand_type], image_shape)
+        return self.build_analysis(features, 0, hand_type)
+    
+    def compute_features(self, landmarks: np.ndarray, aspect: float = 1.0) -> Dict[str, np.ndarray]:
+        """批量计算手部特征
+        
+        landmarks 形状为 (..., 21, 3)：可以是一帧的所有手 (H, 21, 3)，
+        也可以是一段窗口 (T, H, 21, 3)。返回的数组保留相同的前置维度。
+        aspect 为画面宽高比，用于关节角度计算。
+        """
+        points = np.asarray(landmarks, dtype=np.float32)[..., :2]
+        
+        # 边界框 [x_min, y_min, x_max, y_max]
+        mins = points.min(axis=-2)
+        maxs = points.max(axis=-2)
+        bbox = np.concatenate([mins, maxs], axis=-1)
+        
+        # 指尖到指根的距离（排除拇指）
+        delta = points[..., FEATURE_TIP_INDICES, :] - points[..., FEATURE_BASE_INDICES, :]
+        distances = np.hypot(delta[..., 0], delta[..., 1])
+        # 五根手指的关节角度与弯曲程度（拇指状态只来自关节角度），
+        # 只在 angle 方式或学习分类器需要弯曲程度时计算
+        finger_info = None
+        if self.finger_method == 'angle' or self.gesture_model is not None:
+            finger_info = self.finger_estimator.compute(landmarks, aspect)
+        if self.finger_method == 'angle':
+            finger_states = finger_info['extended'][..., 1:]
+        else:
+            finger_states = distances > self.extended_threshold
+        
+        vertical_center = (mins[..., 1] + maxs[..., 1]) / 2
+        
+        features = {
+            'bbox': bbox,
+            'wrist': points[..., 0, :],
+            'finger_tips': points[..., FINGER_TIP_INDICES, :],
+            'finger_distances': distances,
+            'finger_states': finger_states,
+            'extended_count': finger_states.sum(axis=-1),
+            'finger_mask': ChordClassifier.finger_mask(finger_states),
+            'vertical_center': vertical_center,
+            'position': np.searchsorted(self.position_thresholds, vertical_center, side='right')
+        }
+        if finger_info is not None:
+            features['thumb_extended'] = finger_info['extended'][..., 0]
+            features['curl'] = finger_info['curl']
+            features['joint_angles'] = finger_info['joint_angles']
+        return features
+    
+    def match_poses(self, features: Dict[str, np.ndarray], landmarks: np.ndarray,
+                    handedness: List[str], image_shape: Tuple[int, int]):
+        """启用学习分类器或姿态模板匹配时，把识别到的和弦与置信度加入批量特征
+        
+        两者都启用时以分类器为准，分类器置信度不足的手再用模板匹配。
+        """
+        if self.gesture_model is None and self.pose_matcher is None:
+            return
+        aspect = image_aspect(image_shape)
+        chords = confidences = None
+        if self.gesture_model is not None:
+            chords, confidences = self.gesture_model.predict(landmarks, handedness, aspect, features.get('curl'))
+        if self.pose_matcher is not None and (chords is None or (chords == "unknown").any()):
+            matched, match_confidences = self.pose_matcher.match(landmarks, handedness, aspect)
+            if chords is None:
+                chords, confidences = matched, match_confidences
+            else:
+                fallback = chords == "unknown"
+                chords = np.where(fallback, matched, chords)
+                confidences = np.where(fallback, match_confidences, confidences)
+        features['matched_chord'] = chords
+        features['match_confidence'] = confidences
+    
+    def build_analysis(self, features: Dict[str, np.ndarray], index: int, hand_type: str) -> Dict[str, Any]:
+        """把批量特征中第 index 只手转换为分析结果字典"""
+        x_min, y_min, x_max, y_max = features['bbox'][index].tolist()
+        hand_bbox = {
+            'x_min': x_min,
+            'x_max': x_max,
+            'y_min': y_min,
+            'y_max': y_max,
+            'width': x_max - x_min,
+            'height': y_max - y_min
+        }
+        
+        finger_tips = {finger: tuple(tip) for finger, tip in zip(FINGER_NAMES, features['finger_tips'][index].tolist())}
+        
+        states = features['finger_states'][index].tolist()
+        finger_states = dict(zip(FEATURE_FINGERS, states))
+        hand_features = {
+            'finger_states': finger_states,
+            'extended_count': int(features['extended_count'][index]),
+            'extended_fingers': [finger for finger, state in finger_states.items() if state]
+        }
+        # 拇指状态与弯曲程度只在计算了关节角度时提供
+        if 'curl' in features:
+            hand_features['finger_states'] = dict(thumb=bool(features['thumb_extended'][index]), **finger_states)
+            hand_features['curl'] = dict(zip(FINGER_NAMES, features['curl'][index].round(3).tolist()))
+        if self.diagnostics.enabled('DEBUG'):
+            self.diagnostics.record('hand_features', 'DEBUG', hand_type=hand_type,
+                                    extended_fingers=hand_features['extended_fingers'],
+                                    vertical_center=round(float(features['vertical_center'][index]), 3))
+        
+        # 优先使用学习分类器 / 姿态模板匹配结果，都识别不出时查表识别和弦
+        band = int(features['position'][index])
+        chord = "unknown"
+        if 'matched_chord' in features:
+            chord = features['matched_chord'][index]
+        matched = chord != "unknown"
+        if not matched:
+            chord = self.chord_classifier.lookup(int(features['finger_mask'][index]), band, hand_type)
+        changed = self._last_chords.get(hand_type) != chord
+        self._last_chords[hand_type] = chord
+        level = 'INFO' if changed and chord != "unknown" else 'DEBUG'
+        if self.diagnostics.enabled(level):
+            self.diagnostics.record('chord_recognition', level, hand_type=hand_type,
+                                    extended_count=hand_features['extended_count'],
+                                    position=POSITION_BANDS[band], chord=chord)
+        
+        analysis = {
+            'detected': True,
+            'hand_type': hand_type,
+            'wrist': tuple(features['wrist'][index].tolist()),
+            'finger_tips': finger_tips,
+            'bounding_box': hand_bbox,
+            'hand_features': hand_features,
+            'gesture': chord
+        }
+        # 置信度只属于分类器 / 模板匹配给出的和弦，查表得到的和弦不带置信度
+        if matched:
+            analysis['confidence'] = float(features['match_confidence'][index])
+        return analysis
+    
+    def get_finger_tips(self, landmarks: np.ndarray) -> Dict[str, Tuple[float, float]]:
+        """获取手指尖端坐标"""
+        tips = landmarks[FINGER_TIP_INDICES, :2].tolist()
+        return {finger: tuple(tip) for finger, tip in zip(FINGER_NAMES, tips)}
+    
+    def calculate_hand_features(self, finger_tips: Dict, landmarks: np.ndarray) -> Dict[str, Any]:
+        """计算单只手的手部特征"""
+        features = self.compute_features(landmarks[np.newaxis])
+        finger_states = dict(zip(FEATURE_FINGERS, features['finger_states'][0].tolist()))
+        extended_fingers = [finger for finger, state in finger_states.items() if state]
+        
+        self.diagnostics.record('hand_features', 'DEBUG', finger_states=finger_states,
+                                extended_fingers=extended_fingers)
+        
+        return {
+            'finger_states': finger_states,
+            'extended_count': len(extended_fingers),
+            'extended_fingers': extended_fingers
+        }
+    
+    def is_finger_extended_simple(self, finger: str, landmarks: np.ndarray) -> bool:
+        """简化的手指伸直检测"""
+        # 手指关键点索引
+        finger_indices = {
+            'index': [5, 6, 7, 8],
+            'middle': [9, 10, 11, 12],
+            'ring': [13, 14, 15, 16],
+            'pinky': [17, 18, 19, 20]
+        }
+        
+        if finger not in finger_indices:
+            return False
+        
+        indices = finger_indices[finger]
+        
+        # 指尖到指根的距离
+        delta = landmarks[indices[-1], :2] - landmarks[indices[0], :2]
+        distance = float(np.hypot(delta[0], delta[1]))
+        
+        # 调整阈值 - 降低阈值以提高识别灵敏度
+        return distance > self.extended_threshold
+    
+    def recognize_chord_by_count_and_position(self, features: Dict, bbox: Dict, hand_type: str = None) -> str:
+        """基于伸直手指组合和位置识别和弦（查 config.yaml 中的和弦表）"""
+        hand_position = self.get_hand_position(bbox)
+        finger_states = features['finger_states']
+        mask = sum(1 << i for i, finger in enumerate(FEATURE_FINGERS) if finger_states.get(finger, False))
+        return self.chord_classifier.lookup(mask, POSITION_BANDS.index(hand_position), hand_type)
+    
+    def get_hand_position(self, bbox: Dict) -> str:
+        """获取手部位置（高/中/低）"""
+        vertical_center = (bbox['y_min'] + bbox['y_max']) / 2
+        
+        return POSITION_BANDS[int(np.searchsorted(self.position_thresholds, vertical_center, side='right'))]
+    
+    def calculate_strumming_direction(self, prev_hand_data: Dict, current_hand_data: Dict) -> str:
+        """计算扫弦方向"""
+        if not prev_hand_data or not current_hand_data:
+            return "none"
+        
+        if not prev_hand_data.get('detected', False) or not current_hand_data.get('detected', False):
+            return "none"
+            
+        prev_y = prev_hand_data['bounding_box']['y_min']
+        current_y = current_hand_data['bounding_box']['y_min']
+        
+        movement = current_y - prev_y
+        
+        if movement > 0.05:
+            return "downstroke"
+        elif movement < -0.05:
+            return "upstroke"
+        else:
+            return "none"
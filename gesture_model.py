@@ -0,0 +1,221 @@
+"""只依赖 NumPy 的小型手势分类模型（多层感知机，无隐藏层时即逻辑回归）
+
+模型保存为单个 .npz 文件，推理不需要任何深度学习框架。
+
+用法示例:
+    python gesture_model.py train dataset.npz models/gesture_model.npz --hidden 32
+    python gesture_model.py train dataset.npz models/gesture_logreg.npz --hidden 0
+    python gesture_model.py eval models/gesture_model.npz dataset.npz
+"""
+import argparse
+import os
+import time
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+
+from finger_state import FingerStateEstimator
+from pose_matcher import normalize_landmarks
+
+UNKNOWN_CHORD = "unknown"
+
+_finger_estimator = FingerStateEstimator()
+
+def extract_features(landmarks: np.ndarray, handedness: Sequence[str] = None, aspect: Any = 1.0,
+                     mirror_left: bool = True, curl: np.ndarray = None) -> np.ndarray:
+    """把 (N, 21, 3) 关键点转换为模型输入 (N, 49)
+
+    归一化姿态向量 (42) + 五指弯曲程度 (5) + 手部垂直中心 + 是否左手；
+    和弦还取决于手在画面中的高低与左右手，这两项不能被归一化掉。
+    aspect 可以是标量，也可以是形状 (N, 1) 的每个样本的画面宽高比；
+    curl 为已计算好的弯曲程度（分析器中与手指状态一起算出）。
+    """
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    is_left = np.zeros(landmarks.shape[0], dtype=bool)
+    if handedness is not None:
+        is_left = np.array([hand == 'Left' for hand in handedness], dtype=bool)
+    pose = normalize_landmarks(landmarks, aspect, is_left if mirror_left else None)
+    if curl is None:
+        curl = _finger_estimator.compute(landmarks, aspect)['curl']
+    y = landmarks[..., 1]
+    vertical_center = (y.min(axis=-1) + y.max(axis=-1)) / 2
+    return np.concatenate([pose, curl, vertical_center[:, np.newaxis], is_left[:, np.newaxis]],
+                          axis=-1).astype(np.float32)
+
+class GestureModel:
+    """前向推理：标准化 → 若干 ReLU 隐藏层 → softmax"""
+
+    def __init__(self, classes: Sequence[str], weights: List[Tuple[np.ndarray, np.ndarray]],
+                 mean: np.ndarray, std: np.ndarray, mirror_left: bool = True):
+        self.classes = np.array(list(classes) + [UNKNOWN_CHORD], dtype=object)
+        self.weights = [(np.asarray(w, dtype=np.float32), np.asarray(b, dtype=np.float32)) for w, b in weights]
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.std = np.asarray(std, dtype=np.float32)
+        self.mirror_left = mirror_left
+        self.min_confidence = 0.0
+
+    @classmethod
+    def load(cls, path: str) -> 'GestureModel':
+        """读取 .npz 模型文件"""
+        with np.load(path, allow_pickle=False) as data:
+            weights = [(data[f'W{i}'], data[f'b{i}']) for i in range(int(data['num_layers']))]
+            return cls(data['classes'].tolist(), weights, data['mean'], data['std'], bool(data['mirror_left']))
+
+    def save(self, path: str):
+        """写出 .npz 模型文件"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        arrays = {f'W{i}': w for i, (w, _) in enumerate(self.weights)}
+        arrays.update({f'b{i}': b for i, (_, b) in enumerate(self.weights)})
+        np.savez_compressed(path, classes=np.asarray(self.classes[:-1], dtype=str), mean=self.mean, std=self.std,
+                            num_layers=len(self.weights), mirror_left=self.mirror_left, **arrays)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'GestureModel':
+        """按 gesture_recognition.classifier 加载模型，未启用或文件不存在时返回None"""
+        classifier_config = config.get('gesture_recognition', {}).get('classifier', {})
+        if not classifier_config.get('enable', False):
+            return None
+
+        path = classifier_config.get('model_file', 'models/gesture_model.npz')
+        if not os.path.exists(path):
+            print(f"Warning: 手势模型文件不存在 {path}，学习分类器未启用")
+            return None
+
+        model = cls.load(path)
+        model.min_confidence = classifier_config.get('min_confidence', 0.6)
+        print(f"✅ 已加载手势模型（{len(model.weights) - 1} 个隐藏层，{len(model.classes) - 1} 个和弦）")
+        return model
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """(N, D) 特征 → (N, C) 和弦概率"""
+        hidden = (features - self.mean) / self.std
+        for w, b in self.weights[:-1]:
+            hidden = np.maximum(hidden @ w + b, 0.0)
+        w, b = self.weights[-1]
+        logits = hidden @ w + b
+        logits -= logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def predict(self, landmarks: np.ndarray, handedness: Sequence[str] = None, aspect: Any = 1.0,
+                curl: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """识别 (N, 21, 3) 的多只手，返回 (和弦名称, 置信度)；置信度低于 min_confidence 时为 unknown"""
+        proba = self.predict_proba(extract_features(landmarks, handedness, aspect, self.mirror_left, curl))
+        best = proba.argmax(axis=-1)
+        confidences = proba[np.arange(len(best)), best]
+        best = np.where(confidences >= self.min_confidence, best, -1)
+        return self.classes[best], confidences
+
+def train_model(features: np.ndarray, labels: Sequence[str], hidden: Sequence[int] = (32,),
+                epochs: int = 200, learning_rate: float = 0.01, l2: float = 1e-4, batch_size: int = 256,
+                seed: int = 0, mirror_left: bool = True) -> GestureModel:
+    """用 Adam 小批量训练（交叉熵损失 + L2正则），hidden 为空时即多类逻辑回归"""
+    rng = np.random.default_rng(seed)
+    classes, targets = np.unique(np.asarray(labels), return_inverse=True)
+    mean = features.mean(axis=0)
+    std = features.std(axis=0) + 1e-6
+    x = (features - mean) / std
+
+    sizes = [x.shape[1]] + list(hidden) + [len(classes)]
+    params = []
+    for fan_in, fan_out in zip(sizes[:-1], sizes[1:]):
+        params.append(rng.normal(0, np.sqrt(2.0 / fan_in), (fan_in, fan_out)).astype(np.float32))
+        params.append(np.zeros(fan_out, dtype=np.float32))
+    moments = [np.zeros_like(p) for p in params]
+    velocities = [np.zeros_like(p) for p in params]
+    beta1, beta2, step = 0.9, 0.999, 0
+
+    for _ in range(epochs):
+        order = rng.permutation(len(x))
+        for start in range(0, len(x), batch_size):
+            batch = order[start:start + batch_size]
+            activations = [x[batch]]
+            for layer in range(len(sizes) - 2):
+                activations.append(np.maximum(activations[-1] @ params[2 * layer] + params[2 * layer + 1], 0.0))
+            logits = activations[-1] @ params[-2] + params[-1]
+            logits -= logits.max(axis=1, keepdims=True)
+            proba = np.exp(logits)
+            proba /= proba.sum(axis=1, keepdims=True)
+
+            # 反向传播
+            grad = proba
+            grad[np.arange(len(batch)), targets[batch]] -= 1
+            grad /= len(batch)
+            grads = [None] * len(params)
+            for layer in reversed(range(len(sizes) - 1)):
+                w = params[2 * layer]
+                grads[2 * layer] = activations[layer].T @ grad + l2 * w
+                grads[2 * layer + 1] = grad.sum(axis=0)
+                if layer > 0:
+                    grad = (grad @ w.T) * (activations[layer] > 0)
+
+            step += 1
+            for i, g in enumerate(grads):
+                moments[i] = beta1 * moments[i] + (1 - beta1) * g
+                velocities[i] = beta2 * velocities[i] + (1 - beta2) * g * g
+                m_hat = moments[i] / (1 - beta1 ** step)
+                v_hat = velocities[i] / (1 - beta2 ** step)
+                params[i] -= learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+    weights = [(params[2 * i], params[2 * i + 1]) for i in range(len(sizes) - 1)]
+    return GestureModel(classes.tolist(), weights, mean, std, mirror_left)
+
+def dataset_features(dataset: Dict[str, np.ndarray], mirror_left: bool = True) -> np.ndarray:
+    """数据集（evaluate_analyzer 格式）的模型输入特征"""
+    return extract_features(dataset['landmarks'], dataset['handedness'], dataset['aspect'][:, np.newaxis],
+                            mirror_left)
+
+def main():
+    """命令行入口"""
+    from evaluate_analyzer import load_dataset
+
+    parser = argparse.ArgumentParser(description="NumPy 手势分类模型")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    train_parser = subparsers.add_parser('train', help="训练模型")
+    train_parser.add_argument('dataset', help="evaluate_analyzer.py build 生成的数据集")
+    train_parser.add_argument('output', help="输出模型 .npz 文件")
+    train_parser.add_argument('--hidden', default='32', help="隐藏层大小，逗号分隔；0表示逻辑回归")
+    train_parser.add_argument('--epochs', type=int, default=200)
+    train_parser.add_argument('--lr', type=float, default=0.01)
+    train_parser.add_argument('--l2', type=float, default=1e-4)
+    train_parser.add_argument('--validation', type=float, default=0.2, help="留作验证的样本比例")
+
+    eval_parser = subparsers.add_parser('eval', help="评估模型")
+    eval_parser.add_argument('model', help="模型 .npz 文件")
+    eval_parser.add_argument('dataset', help="数据集 .npz 文件")
+    args = parser.parse_args()
+
+    if args.command == 'train':
+        dataset = load_dataset(args.dataset)
+        features = dataset_features(dataset)
+        labels = dataset['labels']
+        order = np.random.default_rng(0).permutation(len(labels))
+        split = int(len(labels) * (1 - args.validation))
+        train_index, valid_index = order[:split], order[split:]
+
+        hidden = [int(size) for size in args.hidden.split(',') if int(size) > 0]
+        start_time = time.time()
+        model = train_model(features[train_index], labels[train_index], hidden, args.epochs, args.lr, args.l2)
+        print(f"⏱️ 训练 {len(train_index)} 个样本，用时 {time.time() - start_time:.1f}s")
+
+        for name, index in (('训练集', train_index), ('验证集', valid_index)):
+            if len(index):
+                predictions = model.classes[model.predict_proba(features[index]).argmax(axis=-1)]
+                print(f"{name}准确率: {(predictions == labels[index]).mean():.2%}")
+        model.save(args.output)
+        print(f"✅ 模型已保存 → {args.output}")
+    else:
+        model = GestureModel.load(args.model)
+        dataset = load_dataset(args.dataset)
+        features = dataset_features(dataset, model.mirror_left)
+        start = time.perf_counter()
+        proba = model.predict_proba(features)
+        elapsed = time.perf_counter() - start
+        predictions = model.classes[proba.argmax(axis=-1)]
+        print(f"样本数: {len(predictions)} | 准确率: {(predictions == dataset['labels']).mean():.2%} | "
+              f"推理: {elapsed / max(1, len(predictions)) * 1e6:.2f} µs/手")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import numpy as np
+from typing import Any, Dict, Hashable, List, Sequence
+
+from chord_classifier import CHORD_FINGERS
+
+class RollingStats:
+    """定长窗口内向量的滚动均值与方差（每次更新O(1)，与窗口长度无关）"""
+
+    def __init__(self, window: int, dim: int):
+        self.window = max(1, window)
+        self.buffer = np.zeros((self.window, dim), dtype=np.float64)
+        self.total = np.zeros(dim, dtype=np.float64)
+        self.total_sq = np.zeros(dim, dtype=np.float64)
+        self.index = 0
+        self.count = 0
+
+    def push(self, value: Sequence[float]):
+        """加入新样本，窗口已满时同时移出最旧的样本"""
+        value = np.asarray(value, dtype=np.float64)
+        if self.count == self.window:
+            old = self.buffer[self.index]
+            self.total -= old
+            self.total_sq -= old * old
+        else:
+            self.count += 1
+        self.buffer[self.index] = value
+        self.total += value
+        self.total_sq += value * value
+        self.index = (self.index + 1) % self.window
+
+    def mean(self) -> np.ndarray:
+        return self.total / max(1, self.count)
+
+    def variance(self) -> np.ndarray:
+        if self.count == 0:
+            return np.zeros_like(self.total)
+        mean = self.total / self.count
+        # 浮点累加误差可能产生极小的负值
+        return np.maximum(self.total_sq / self.count - mean * mean, 0.0)
+
+    def reset(self):
+        self.total[:] = 0
+        self.total_sq[:] = 0
+        self.index = 0
+        self.count = 0
+
+class HandStability:
+    """单只手的和弦稳定性判断
+
+    候选和弦连续出现 min_frames 帧，且窗口内手部位置与手指状态的方差都低于阈值，
+    才确认为稳定和弦；确认之前保持上一个稳定和弦，单帧抖动不会引起切换。
+    """
+
+    def __init__(self, min_frames: int, position_variance: float, finger_variance: float):
+        self.min_frames = max(1, min_frames)
+        self.position_variance = position_variance
+        self.finger_variance = finger_variance
+        self.position_stats = RollingStats(self.min_frames, 2)
+        self.finger_stats = RollingStats(self.min_frames, len(CHORD_FINGERS))
+        self.candidate = None
+        self.streak = 0
+        self.stable_chord = "unknown"
+
+    def update(self, chord: str, position: Sequence[float], finger_states: Sequence[float]) -> str:
+        """加入一帧观测，返回当前的稳定和弦"""
+        self.position_stats.push(position)
+        self.finger_stats.push(finger_states)
+
+        if chord == self.candidate:
+            self.streak += 1
+        else:
+            self.candidate = chord
+            self.streak = 1
+
+        if chord != self.stable_chord and self.is_steady():
+            self.stable_chord = chord
+        return self.stable_chord
+
+    def is_steady(self) -> bool:
+        """候选和弦是否已满足稳定条件"""
+        return (self.streak >= self.min_frames
+                and float(self.position_stats.variance().sum()) <= self.position_variance
+                and float(self.finger_stats.variance().mean()) <= self.finger_variance)
+
+class StabilityEngine:
+    """按手维护稳定性状态，用确认后的稳定和弦替换逐帧识别结果"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        stability_config = (config or {}).get('gesture_recognition', {}).get('stability', {})
+        self.enable = stability_config.get('enable', True)
+        self.min_frames = stability_config.get('min_frames', 5)
+        self.position_variance = stability_config.get('position_variance', 0.1)
+        self.finger_variance = stability_config.get('finger_variance', 0.15)
+        self.hands: Dict[Hashable, HandStability] = {}
+
+    def update(self, key: Hashable, analysis: Dict[str, Any]) -> str:
+        """更新一只手的状态，返回它的稳定和弦"""
+        hand = self.hands.get(key)
+        if hand is None:
+            hand = self.hands[key] = HandStability(self.min_frames, self.position_variance, self.finger_variance)
+
+        bbox = analysis['bounding_box']
+        position = ((bbox['x_min'] + bbox['x_max']) / 2, (bbox['y_min'] + bbox['y_max']) / 2)
+        finger_states = analysis['hand_features']['finger_states']
+        return hand.update(analysis['gesture'], position, [finger_states[f] for f in CHORD_FINGERS])
+
+    def apply(self, analyzed_data: List[Dict[str, Any]], keys: Sequence[Hashable] = None) -> List[Dict[str, Any]]:
+        """原地处理一帧的分析结果：原始结果存入 raw_gesture，gesture 改为稳定和弦
+
+        keys 为每只手的标识（默认按列表下标）。短暂漏检的手保留状态，
+        不再出现的手由调用方通过 prune() 清除。
+        """
+        if not self.enable:
+            return analyzed_data
+
+        if keys is None:
+            keys = range(len(analyzed_data))
+        for key, analysis in zip(keys, analyzed_data):
+            if not analysis.get('detected', False):
+                continue
+            analysis['raw_gesture'] = analysis['gesture']
+            analysis['gesture'] = self.update(key, analysis)
+            analysis['stable'] = analysis['gesture'] == analysis['raw_gesture']
+
+        return analyzed_data
+
+    def prune(self, keys: Sequence[Hashable]):
+        """清除给定手的状态（通常为 HandIdentityTracker.expired_ids）"""
+        for key in keys:
+            self.hands.pop(key, None)
+
+    def reset(self):
+        self.hands.clear()
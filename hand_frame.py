@@ -0,0 +1,104 @@
+import cv2
+import numpy as np
+from typing import Any, List, Optional, Sequence, Tuple
+
+NUM_LANDMARKS = 21
+
+# 指尖关键点索引（拇指、食指、中指、无名指、小指）
+FINGER_TIP_INDICES = np.array([4, 8, 12, 16, 20], dtype=np.intp)
+FINGER_NAMES = ('thumb', 'index', 'middle', 'ring', 'pinky')
+
+# 手部骨架连线（与 mediapipe.solutions.hands.HAND_CONNECTIONS 相同）
+HAND_CONNECTIONS = np.array([
+    (0, 1), (0, 5), (0, 17), (1, 2), (2, 3), (3, 4), (5, 6), (5, 9), (6, 7), (7, 8), (9, 10),
+    (9, 13), (10, 11), (11, 12), (13, 14), (13, 17), (14, 15), (15, 16), (17, 18), (18, 19), (19, 20)
+], dtype=np.intp)
+
+class HandFrame:
+    """单帧手部检测结果，关键点保存在形状为 (hands, 21, 3) 的连续 float32 数组中"""
+
+    __slots__ = ('landmarks', 'handedness', 'scores', 'timestamp')
+
+    def __init__(self, landmarks: Optional[np.ndarray] = None, handedness: Sequence[str] = (),
+                 scores: Optional[np.ndarray] = None, timestamp: float = 0.0):
+        if landmarks is None:
+            landmarks = np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+        self.landmarks = np.ascontiguousarray(landmarks, dtype=np.float32)
+        self.handedness = tuple(handedness)
+        if scores is None:
+            scores = np.ones(len(self.landmarks), dtype=np.float32)
+        self.scores = np.asarray(scores, dtype=np.float32)
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_mediapipe(cls, results: Any, timestamp: float = 0.0) -> 'HandFrame':
+        """从MediaPipe Hands结果构建，不保留protobuf对象"""
+        if not results.multi_hand_landmarks:
+            return cls(timestamp=timestamp)
+
+        num_hands = len(results.multi_hand_landmarks)
+        landmarks = np.empty((num_hands, NUM_LANDMARKS, 3), dtype=np.float32)
+        handedness = []
+        scores = np.empty(num_hands, dtype=np.float32)
+
+        for i, (hand_landmarks, hand_class) in enumerate(zip(results.multi_hand_landmarks,
+                                                             results.multi_handedness)):
+            landmarks[i] = np.fromiter(
+                (value for lm in hand_landmarks.landmark for value in (lm.x, lm.y, lm.z)),
+                dtype=np.float32, count=NUM_LANDMARKS * 3
+            ).reshape(NUM_LANDMARKS, 3)
+            classification = hand_class.classification[0]
+            handedness.append(classification.label)
+            scores[i] = classification.score
+
+        return cls(landmarks, handedness, scores, timestamp)
+
+    def __len__(self) -> int:
+        return self.landmarks.shape[0]
+
+    @property
+    def num_hands(self) -> int:
+        """检测到的手数量"""
+        return self.landmarks.shape[0]
+
+    def bounding_boxes(self) -> np.ndarray:
+        """各手的边界框，形状 (hands, 4)，依次为 x_min, y_min, x_max, y_max"""
+        xy = self.landmarks[:, :, :2]
+        return np.concatenate([xy.min(axis=1), xy.max(axis=1)], axis=1)
+
+    def finger_tips(self) -> np.ndarray:
+        """各手的指尖坐标，形状 (hands, 5, 2)"""
+        return self.landmarks[:, FINGER_TIP_INDICES, :2]
+
+    def select(self, indices: Sequence[int]) -> 'HandFrame':
+        """按索引挑选部分手，返回新的 HandFrame"""
+        indices = np.asarray(indices, dtype=np.intp)
+        return HandFrame(self.landmarks[indices],
+                         [self.handedness[i] for i in indices],
+                         self.scores[indices],
+                         self.timestamp)
+
+    def to_hand_data(self) -> List[dict]:
+        """转换为旧版的逐手字典格式（关键点为 (21, 3) 数组视图）"""
+        return [{'landmarks': self.landmarks[i], 'type': self.handedness[i], 'score': float(self.scores[i])}
+                for i in range(len(self))]
+
+def draw_hand_frame(image: np.ndarray, hand_frame: HandFrame,
+                    point_color: Tuple[int, int, int] = (0, 0, 255),
+                    line_color: Tuple[int, int, int] = (255, 255, 255)) -> np.ndarray:
+    """在图像上绘制所有手的关键点与骨架连线（两次批量绘制调用）"""
+    if len(hand_frame) == 0:
+        return image
+
+    height, width = image.shape[:2]
+    scale = max(1, min(width, height) // 240)
+    points = (hand_frame.landmarks[:, :, :2] * (width, height)).astype(np.int32)
+
+    # 所有骨架连线一次绘制
+    lines = points[:, HAND_CONNECTIONS].reshape(-1, 2, 2)
+    cv2.polylines(image, list(lines), False, line_color, scale, cv2.LINE_AA)
+    # 关键点用零长度粗线段绘制为圆点
+    dots = np.repeat(points.reshape(-1, 1, 2), 2, axis=1)
+    cv2.polylines(image, list(dots), False, point_color, scale * 4, cv2.LINE_AA)
+
+    return image
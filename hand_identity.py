@@ -0,0 +1,114 @@
+import itertools
+import numpy as np
+from typing import Any, Dict, List
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    linear_sum_assignment = None
+
+class HandTrack:
+    """一只手的跨帧身份状态（位置按恒速模型预测）"""
+
+    __slots__ = ('hand_id', 'position', 'velocity', 'handedness', 'last_seen')
+
+    def __init__(self, hand_id: int, position: np.ndarray, handedness: str, timestamp: float):
+        self.hand_id = hand_id
+        self.position = position
+        self.velocity = np.zeros(2)
+        self.handedness = handedness
+        self.last_seen = timestamp
+
+    def predict(self, timestamp: float) -> np.ndarray:
+        return self.position + self.velocity * (timestamp - self.last_seen)
+
+    def update(self, position: np.ndarray, handedness: str, timestamp: float, smoothing: float):
+        dt = timestamp - self.last_seen
+        if dt > 0:
+            velocity = (position - self.position) / dt
+            self.velocity = smoothing * self.velocity + (1 - smoothing) * velocity
+        self.position = position
+        self.handedness = handedness
+        self.last_seen = timestamp
+
+class HandIdentityTracker:
+    """为每帧检测到的手分配稳定的ID
+
+    代价为预测位置与检测位置（手部中心）的距离，左右手标签不一致时加罚分，
+    用最优分配（安装了scipy时用匈牙利算法，否则枚举排列）求解；
+    超过 max_distance 的配对视为新出现的手，超过 max_age 秒未出现的手被移除；
+    每次 assign() 移除的ID记录在 expired_ids 中，供按ID维护状态的模块同步清除。
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        identity_config = (config or {}).get('gesture_recognition', {}).get('hand_identity', {})
+        self.max_distance = identity_config.get('max_distance', 0.25)
+        self.handedness_penalty = identity_config.get('handedness_penalty', 0.2)
+        self.max_age = identity_config.get('max_age', 0.5)
+        self.smoothing = identity_config.get('smoothing', 0.5)
+        self.tracks: Dict[int, HandTrack] = {}
+        self.next_id = 0
+        self.expired_ids: List[int] = []
+
+    def assign(self, analyzed_data: List[Dict[str, Any]], timestamp: float) -> List[int]:
+        """为一帧的分析结果分配ID（同时写入 analysis['hand_id']），返回ID列表"""
+        # 移除过期的手
+        self.expired_ids = [hid for hid, track in self.tracks.items() if timestamp - track.last_seen > self.max_age]
+        for hand_id in self.expired_ids:
+            del self.tracks[hand_id]
+
+        detections = [(i, analysis) for i, analysis in enumerate(analyzed_data) if analysis.get('detected', False)]
+        ids = [None] * len(analyzed_data)
+        if not detections:
+            return ids
+
+        positions = np.array([self._center(analysis) for _, analysis in detections])
+        tracks = list(self.tracks.values())
+        matches = {}
+        if tracks:
+            predicted = np.array([track.predict(timestamp) for track in tracks])
+            cost = np.linalg.norm(positions[:, np.newaxis, :] - predicted[np.newaxis, :, :], axis=-1)
+            handedness = np.array([analysis.get('hand_type') for _, analysis in detections], dtype=object)
+            track_handedness = np.array([track.handedness for track in tracks], dtype=object)
+            cost = cost + self.handedness_penalty * (handedness[:, np.newaxis] != track_handedness[np.newaxis, :])
+            for row, col in self._solve(cost):
+                if cost[row, col] <= self.max_distance:
+                    matches[row] = tracks[col]
+
+        for row, (index, analysis) in enumerate(detections):
+            track = matches.get(row)
+            if track is None:
+                track = HandTrack(self.next_id, positions[row], analysis.get('hand_type'), timestamp)
+                self.tracks[track.hand_id] = track
+                self.next_id += 1
+            else:
+                track.update(positions[row], analysis.get('hand_type'), timestamp, self.smoothing)
+            analysis['hand_id'] = track.hand_id
+            ids[index] = track.hand_id
+        return ids
+
+    @staticmethod
+    def _center(analysis: Dict[str, Any]) -> np.ndarray:
+        bbox = analysis['bounding_box']
+        return np.array([(bbox['x_min'] + bbox['x_max']) / 2, (bbox['y_min'] + bbox['y_max']) / 2])
+
+    @staticmethod
+    def _solve(cost: np.ndarray) -> List[tuple]:
+        """求总代价最小的一一配对"""
+        if linear_sum_assignment is not None:
+            rows, cols = linear_sum_assignment(cost)
+            return list(zip(rows.tolist(), cols.tolist()))
+
+        # 同时出现的手很少，直接枚举较小一侧到较大一侧的所有排列
+        num_rows, num_cols = cost.shape
+        if num_rows <= num_cols:
+            best = min(itertools.permutations(range(num_cols), num_rows),
+                       key=lambda cols: cost[range(num_rows), cols].sum())
+            return list(zip(range(num_rows), best))
+        best = min(itertools.permutations(range(num_rows), num_cols),
+                   key=lambda rows: cost[rows, range(num_cols)].sum())
+        return list(zip(best, range(num_cols)))
+
+    def reset(self):
+        self.expired_ids = list(self.tracks)
+        self.tracks.clear()
@@ -1,112 +1,234 @@
-import cv2
-import mediapipe as mp
-import numpy as np
-from typing import List, Tuple, Dict, Any
-import utils
-
-class HandTracker:
-    """手部关键点检测器"""
-    
-    def __init__(self, config: Dict[str, Any] = None):
-        if config is None:
-            config = utils.load_config()['hand_tracking']
-            
-        self.config = config
-        self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
-        
-        self.hands = self.mp_hands.Hands(
-            model_complexity=config['model_complexity'],
-            min_detection_confidence=config['min_detection_confidence'],
-            min_tracking_confidence=config['min_tracking_confidence'],
-            max_num_hands=config['max_num_hands']
-        )
-        
-    def process_frame(self, image: np.ndarray) -> Tuple[np.ndarray, List[Dict]]:
-        """处理帧并检测手部关键点"""
-        results = self.hands.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-        hand_data = []
-        
-        if results.multi_hand_landmarks:
-            for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
-                # 提取关键点坐标
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.append((landmark.x, landmark.y, landmark.z))
-                
-                # 获取手型（左手/右手）
-                hand_type = handedness.classification[0].label
-                
-                hand_data.append({
-                    'landmarks': landmarks,
-                    'type': hand_type,
-                    'world_landmarks': hand_landmarks.landmark
-                })
-                
-                # 绘制关键点
-                self.mp_drawing.draw_landmarks(
-                    image,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
-                )
-        
-        return image, hand_data
-    
-    def get_finger_positions(self, hand_data: Dict) -> Dict[str, Tuple[float, float]]:
-        """获取手指尖端位置"""
-        if not hand_data:
-            return {}
-            
-        landmarks = hand_data['landmarks']
-        finger_tips = {
-            'thumb': landmarks[4],
-            'index': landmarks[8],
-            'middle': landmarks[12],
-            'ring': landmarks[16],
-            'pinky': landmarks[20]
-        }
-        
-        return finger_tips
-    
-    def is_finger_extended(self, landmarks: List[Tuple[float, float, float]], finger_tip: int, 
-                          finger_joints: List[int]) -> bool:
-        """判断手指是否伸直"""
-        tip = landmarks[finger_tip]
-        joints = [landmarks[joint] for joint in finger_joints]
-        
-        # 计算手指方向向量
-        finger_vector = np.array([tip[0] - joints[0][0], tip[1] - joints[0][1]])
-        finger_length = np.linalg.norm(finger_vector)
-        
-        if finger_length < 0.05:  # 阈值，可根据需要调整
-            return False
-            
-        return True
-    
-    def get_hand_gesture(self, hand_data: Dict) -> str:
-        """识别手势"""
-        if not hand_data:
-            return "none"
-            
-        landmarks = hand_data['landmarks']
-        finger_tips = self.get_finger_positions(hand_data)
-        
-        # 简单的拳头检测
-        thumb_tip = np.array(finger_tips['thumb'][:2])
-        index_tip = np.array(finger_tips['index'][:2])
-        middle_tip = np.array(finger_tips['middle'][:2])
-        
-        dist_thumb_index = np.linalg.norm(thumb_tip - index_tip)
-        dist_thumb_middle = np.linalg.norm(thumb_tip - middle_tip)
-        
-        if dist_thumb_index < 0.05 and dist_thumb_middle < 0.05:
-            return "fist"
-        else:
-            return "open"
-    
-    def release(self):
-        """释放资源"""
-        self.hands.close()
+import cv2
+import mediapipe as mp
+import numpy as np
+import time
+from typing import List, Tuple, Dict, Any
+from hand_frame import HandFrame, draw_hand_frame
+import utils
+
+class HandTracker:
+    """手部关键点检测器"""
+    
+    def __init__(self, config: Dict[str, Any] = None, show_landmarks: bool = True):
+        if config is None:
+            config = utils.load_config()['hand_tracking']
+            
+        self.config = config
+        self.mp_hands = mp.solutions.hands
+        
+        self.model_complexity = config['model_complexity']
+        self.hands = self._create_hands(self.model_complexity)
+        
+        # ROI追踪模式：只在上一帧手部附近的裁剪区域内做推理
+        roi_config = config.get('roi', {})
+        self.roi_enabled = roi_config.get('enable', False)
+        self.roi_padding = roi_config.get('padding', 0.3)
+        self.roi_inference_size = roi_config.get('inference_size', 320)
+        self.roi_redetect_interval = roi_config.get('redetect_interval', 30)
+        self.roi = None  # 当前裁剪区域 (x0, y0, x1, y1)，像素坐标
+        self.frames_since_full_detection = 0
+        # 裁剪区域使用独立的实例：追踪模式会沿用上一帧的关键点，
+        # 全帧与裁剪图的坐标系不同，不能共享同一个追踪状态
+        self.roi_hands = self._create_hands(self.model_complexity) if self.roi_enabled else None
+        
+        # 是否在 process_frame 中绘制关键点（对应 debug.options.show_landmarks）
+        self.show_landmarks = show_landmarks
+        
+        # 预分配的颜色转换/缩放缓冲区，避免每帧分配新数组
+        self._rgb_buffer = None
+        self._roi_buffer = None
+        self._roi_rgb_buffer = None
+        
+    def _create_hands(self, model_complexity: int):
+        """创建MediaPipe Hands实例"""
+        return self.mp_hands.Hands(
+            static_image_mode=self.config.get('static_image_mode', False),
+            model_complexity=model_complexity,
+            min_detection_confidence=self.config['min_detection_confidence'],
+            min_tracking_confidence=self.config['min_tracking_confidence'],
+            max_num_hands=self.config['max_num_hands']
+        )
+    
+    def set_model_complexity(self, model_complexity: int):
+        """切换模型复杂度（重建MediaPipe实例）"""
+        if model_complexity == self.model_complexity:
+            return
+        self.hands.close()
+        self.model_complexity = model_complexity
+        self.hands = self._create_hands(model_complexity)
+        if self.roi_hands is not None:
+            self.roi_hands.close()
+            self.roi_hands = self._create_hands(model_complexity)
+        self.roi = None
+    
+    def process_frame(self, image: np.ndarray, timestamp: float = None) -> Tuple[np.ndarray, HandFrame]:
+        """处理帧并检测手部关键点，按需绘制关键点"""
+        hand_frame = self.track(image, timestamp=timestamp)
+        if self.show_landmarks:
+            self.draw_landmarks(image, hand_frame)
+        return image, hand_frame
+    
+    def track(self, image: np.ndarray, is_rgb: bool = False, timestamp: float = None) -> HandFrame:
+        """快速路径：只检测关键点，不绘制也不修改输入图像"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        
+        if not self.roi_enabled:
+            return self._run_hands(self.hands, image, is_rgb, '_rgb_buffer', timestamp)
+        
+        height, width = image.shape[:2]
+        hand_frame = None
+        
+        # 定期做一次全帧检测，以便发现新进入画面的手
+        if self.roi is not None and self.frames_since_full_detection < self.roi_redetect_interval:
+            hand_frame = self._detect_in_roi(image, self.roi, is_rgb, timestamp)
+            self.frames_since_full_detection += 1
+            if len(hand_frame) == 0:
+                hand_frame = None
+        
+        if hand_frame is None:
+            hand_frame = self._run_hands(self.hands, image, is_rgb, '_rgb_buffer', timestamp)
+            self.frames_since_full_detection = 0
+        
+        self.roi = self._update_roi(hand_frame, width, height)
+        return hand_frame
+    
+    def draw_landmarks(self, image: np.ndarray, hand_frame: HandFrame,
+                       point_color: Tuple[int, int, int] = (0, 0, 255),
+                       line_color: Tuple[int, int, int] = (255, 255, 255)) -> np.ndarray:
+        """在图像上绘制所有手的关键点与骨架连线"""
+        return draw_hand_frame(image, hand_frame, point_color, line_color)
+    
+    def _to_rgb(self, image: np.ndarray, buffer_name: str) -> np.ndarray:
+        """BGR转RGB，写入复用的预分配缓冲区"""
+        buffer = getattr(self, buffer_name)
+        if buffer is None or buffer.shape != image.shape:
+            buffer = np.empty_like(image)
+            setattr(self, buffer_name, buffer)
+        
+        buffer.flags.writeable = True
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=buffer)
+        # 标记为只读，MediaPipe可按引用传递而无需再复制
+        buffer.flags.writeable = False
+        return buffer
+    
+    def _run_hands(self, hands, image: np.ndarray, is_rgb: bool, buffer_name: str,
+                   timestamp: float) -> HandFrame:
+        """用指定的MediaPipe实例推理并转换为 HandFrame"""
+        results = hands.process(image if is_rgb else self._to_rgb(image, buffer_name))
+        return HandFrame.from_mediapipe(results, timestamp)
+    
+    def _detect_in_roi(self, image: np.ndarray, roi: Tuple[int, int, int, int],
+                       is_rgb: bool, timestamp: float) -> HandFrame:
+        """在裁剪区域内推理，并把关键点映射回全帧归一化坐标"""
+        height, width = image.shape[:2]
+        x0, y0, x1, y1 = roi
+        crop = image[y0:y1, x0:x1]
+        crop_width = x1 - x0
+        crop_height = y1 - y0
+        
+        # 缩放到固定推理尺寸
+        size = self.roi_inference_size
+        if max(crop_width, crop_height) > size:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LINEAR
+        if self._roi_buffer is None or self._roi_buffer.shape != (size, size, image.shape[2]):
+            self._roi_buffer = np.empty((size, size, image.shape[2]), dtype=image.dtype)
+        cv2.resize(crop, (size, size), dst=self._roi_buffer, interpolation=interpolation)
+        hand_frame = self._run_hands(self.roi_hands, self._roi_buffer, is_rgb, '_roi_rgb_buffer', timestamp)
+        
+        # 关键点坐标映射回全帧（z与x使用相同的尺度）
+        landmarks = hand_frame.landmarks
+        landmarks[:, :, 0] = (x0 + landmarks[:, :, 0] * crop_width) / width
+        landmarks[:, :, 1] = (y0 + landmarks[:, :, 1] * crop_height) / height
+        landmarks[:, :, 2] *= crop_width / width
+        
+        return hand_frame
+    
+    def _update_roi(self, hand_frame: HandFrame, width: int, height: int):
+        """根据本帧关键点计算下一帧的裁剪区域，手部仍在当前区域内时保持不变"""
+        if len(hand_frame) == 0:
+            return None
+        
+        boxes = hand_frame.bounding_boxes()
+        x_min, y_min = boxes[:, :2].min(axis=0) * (width, height)
+        x_max, y_max = boxes[:, 2:].max(axis=0) * (width, height)
+        
+        # 手部仍位于当前区域的内圈时沿用原区域，保持推理输入稳定
+        if self.roi is not None:
+            rx0, ry0, rx1, ry1 = self.roi
+            margin = (rx1 - rx0) * self.roi_padding / (1 + 2 * self.roi_padding) / 2
+            hand_size = max(x_max - x_min, y_max - y_min)
+            if (x_min >= rx0 + margin and x_max <= rx1 - margin and
+                    y_min >= ry0 + margin and y_max <= ry1 - margin and
+                    hand_size > (rx1 - rx0) / (2 * (1 + 2 * self.roi_padding))):
+                return self.roi
+        
+        # 以手部边界框为中心扩展出正方形区域
+        side = max(x_max - x_min, y_max - y_min) * (1 + 2 * self.roi_padding)
+        side = min(max(side, self.roi_inference_size / 2), min(width, height))
+        center_x = (x_min + x_max) / 2
+        center_y = (y_min + y_max) / 2
+        
+        x0 = int(np.clip(center_x - side / 2, 0, width - side))
+        y0 = int(np.clip(center_y - side / 2, 0, height - side))
+        return (x0, y0, x0 + int(side), y0 + int(side))
+    
+    def get_finger_positions(self, hand_data: Dict) -> Dict[str, Tuple[float, float]]:
+        """获取手指尖端位置"""
+        if not hand_data:
+            return {}
+            
+        landmarks = hand_data['landmarks']
+        finger_tips = {
+            'thumb': landmarks[4],
+            'index': landmarks[8],
+            'middle': landmarks[12],
+            'ring': landmarks[16],
+            'pinky': landmarks[20]
+        }
+        
+        return finger_tips
+    
+    def is_finger_extended(self, landmarks: List[Tuple[float, float, float]], finger_tip: int, 
+                          finger_joints: List[int]) -> bool:
+        """判断手指是否伸直"""
+        tip = landmarks[finger_tip]
+        joints = [landmarks[joint] for joint in finger_joints]
+        
+        # 计算手指方向向量
+        finger_vector = np.array([tip[0] - joints[0][0], tip[1] - joints[0][1]])
+        finger_length = np.linalg.norm(finger_vector)
+        
+        if finger_length < 0.05:  # 阈值，可根据需要调整
+            return False
+            
+        return True
+    
+    def get_hand_gesture(self, hand_data: Dict) -> str:
+        """识别手势"""
+        if not hand_data:
+            return "none"
+            
+        landmarks = hand_data['landmarks']
+        finger_tips = self.get_finger_positions(hand_data)
+        
+        # 简单的拳头检测
+        thumb_tip = np.array(finger_tips['thumb'][:2])
+        index_tip = np.array(finger_tips['index'][:2])
+        middle_tip = np.array(finger_tips['middle'][:2])
+        
+        dist_thumb_index = np.linalg.norm(thumb_tip - index_tip)
+        dist_thumb_middle = np.linalg.norm(thumb_tip - middle_tip)
+        
+        if dist_thumb_index < 0.05 and dist_thumb_middle < 0.05:
+            return "fist"
+        else:
+            return "open"
+    
+    def release(self):
+        """释放资源"""
+        self.hands.close()
+        if self.roi_hands is not None:
+            self.roi_hands.close()
@@ -0,0 +1,141 @@
+import time
+import numpy as np
+from typing import Any, Dict, Tuple
+from hand_frame import HandFrame
+
+class KeyframeTracker:
+    """关键帧推理调度器：只在关键帧运行MediaPipe，其余帧按匀速模型预测关键点"""
+
+    def __init__(self, tracker: Any, config: Dict[str, Any] = None):
+        config = config or {}
+        self.tracker = tracker
+
+        self.interval = max(1, config.get('interval', 2))
+        self.auto_tune = config.get('auto_tune', True)
+        self.max_interval = max(self.interval, config.get('max_interval', 4))
+        self.motion_threshold = config.get('motion_threshold', 0.08)
+        self.error_threshold = config.get('error_threshold', 0.02)
+        self.velocity_gain = config.get('velocity_gain', 0.6)
+
+        # 每个关键点的匀速模型状态（α-β滤波，位置直接取测量值）
+        self._positions = None      # (hands, 21, 3)
+        self._velocities = None     # (hands, 21, 3)，单位：归一化坐标/秒
+        self._handedness = ()
+        self._scores = None
+        self._keyframe_time = 0.0
+        self._frames_since_keyframe = 0
+
+        # 统计信息
+        self.keyframes = 0
+        self.predicted_frames = 0
+        self.last_error = 0.0
+
+    @property
+    def show_landmarks(self) -> bool:
+        """是否绘制关键点（与底层追踪器共用同一开关）"""
+        return self.tracker.show_landmarks
+
+    @show_landmarks.setter
+    def show_landmarks(self, value: bool):
+        self.tracker.show_landmarks = value
+
+    def process_frame(self, image: np.ndarray, timestamp: float = None) -> Tuple[np.ndarray, HandFrame]:
+        """与 HandTracker.process_frame 接口一致"""
+        hand_frame = self.track(image, timestamp=timestamp)
+        if self.show_landmarks:
+            self.tracker.draw_landmarks(image, hand_frame)
+        return image, hand_frame
+
+    def track(self, image: np.ndarray, is_rgb: bool = False, timestamp: float = None) -> HandFrame:
+        """关键帧做真实检测，非关键帧返回预测的关键点"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        if self._needs_keyframe(timestamp):
+            hand_frame = self.tracker.track(image, is_rgb=is_rgb, timestamp=timestamp)
+            self._update(hand_frame, timestamp)
+            return hand_frame
+
+        self._frames_since_keyframe += 1
+        self.predicted_frames += 1
+        return HandFrame(self._predict(timestamp), self._handedness, self._scores, timestamp)
+
+    def _needs_keyframe(self, timestamp: float) -> bool:
+        """判断本帧是否需要运行检测"""
+        if self._positions is None:
+            return True
+        if len(self._positions) == 0:
+            # 没有手时也按间隔检测，避免空闲时满负荷推理
+            return self._frames_since_keyframe + 1 >= self.interval
+        if self._frames_since_keyframe + 1 >= self.interval:
+            return True
+
+        # 预测位移过大时强制检测
+        elapsed = timestamp - self._keyframe_time
+        hand_velocity = self._velocities[:, :, :2].mean(axis=1)
+        displacement = np.linalg.norm(hand_velocity, axis=1).max() * elapsed
+        return displacement > self.motion_threshold
+
+    def _predict(self, timestamp: float) -> np.ndarray:
+        """匀速模型外推关键点"""
+        elapsed = timestamp - self._keyframe_time
+        return self._positions + self._velocities * elapsed
+
+    def _update(self, hand_frame: HandFrame, timestamp: float):
+        """用关键帧测量值更新模型，并根据预测误差调整关键帧间隔"""
+        self.keyframes += 1
+        self._frames_since_keyframe = 0
+        measured = hand_frame.landmarks
+
+        same_hands = (self._positions is not None and
+                      self._positions.shape == measured.shape and
+                      self._handedness == hand_frame.handedness)
+        elapsed = timestamp - self._keyframe_time
+
+        if same_hands and elapsed > 0:
+            predicted = self._predict(timestamp)
+            residual = measured - predicted
+            self.last_error = float(np.linalg.norm(residual[:, :, :2], axis=2).mean())
+            self._velocities = self._velocities + self.velocity_gain * residual / elapsed
+            self._tune_interval()
+        else:
+            # 手数或左右手变化时重置速度
+            self._velocities = np.zeros_like(measured)
+            self.last_error = 0.0
+
+        self._positions = measured.copy()
+        self._handedness = hand_frame.handedness
+        self._scores = hand_frame.scores.copy()
+        self._keyframe_time = timestamp
+
+    def _tune_interval(self):
+        """预测误差大时缩短间隔，误差小时逐步放宽"""
+        if not self.auto_tune:
+            return
+        if self.last_error > self.error_threshold:
+            self.interval = max(1, self.interval // 2)
+        elif self.last_error < self.error_threshold / 2:
+            self.interval = min(self.max_interval, self.interval + 1)
+
+    def draw_landmarks(self, image: np.ndarray, hand_frame: HandFrame) -> np.ndarray:
+        """绘制关键点（转交给底层追踪器）"""
+        return self.tracker.draw_landmarks(image, hand_frame)
+
+    def set_model_complexity(self, model_complexity: int):
+        """切换底层追踪器的模型复杂度"""
+        self.tracker.set_model_complexity(model_complexity)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取调度统计信息"""
+        total = self.keyframes + self.predicted_frames
+        return {
+            'interval': self.interval,
+            'keyframes': self.keyframes,
+            'predicted_frames': self.predicted_frames,
+            'inference_ratio': self.keyframes / total if total else 1.0,
+            'last_error': self.last_error
+        }
+
+    def release(self):
+        """释放底层追踪器"""
+        self.tracker.release()
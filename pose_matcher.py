@@ -0,0 +1,218 @@
+"""基于归一化关键点的最近邻和弦模板匹配
+
+姿态向量与手的位置无关，而和弦表只靠手的高低区分 C/G、D/Am、Em/F，
+因此匹配时在姿态向量后附加手部垂直中心与是否左手（按权重缩放），
+与 gesture_model.extract_features 的做法一致。
+
+用法示例:
+    python pose_matcher.py add models/chord_templates.npz session_c.npz C_major --every 5
+    python pose_matcher.py info models/chord_templates.npz
+"""
+import argparse
+import os
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+
+from hand_frame import NUM_LANDMARKS
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+WRIST_INDEX = 0
+MIDDLE_MCP_INDEX = 9
+UNKNOWN_CHORD = "unknown"
+
+def normalize_landmarks(landmarks: np.ndarray, aspect: float = 1.0, mirror: np.ndarray = None) -> np.ndarray:
+    """把 (..., 21, 3) 的关键点归一化为 (..., 42) 的姿态向量
+
+    以手腕为原点，手腕→中指根方向旋转为竖直向上，并按该距离（手掌大小）缩放，
+    使姿态与手在画面中的位置、大小和倾斜角度无关。
+    aspect 为画面宽高比，用于把归一化坐标恢复为等比例；mirror 为需要左右镜像的手。
+    """
+    points = np.array(landmarks, dtype=np.float32)[..., :2]
+    points[..., 0] *= aspect
+    if mirror is not None:
+        points[np.asarray(mirror, dtype=bool), :, 0] *= -1
+
+    points -= points[..., WRIST_INDEX:WRIST_INDEX + 1, :]
+    axis = points[..., MIDDLE_MCP_INDEX, :]
+    palm_size = np.maximum(np.linalg.norm(axis, axis=-1), 1e-6)
+    up = axis / palm_size[..., np.newaxis]
+
+    # 在 (垂直于手掌轴, 沿手掌轴) 坐标系下表示各点，手掌轴映射为 (0, -1)
+    x = points[..., 0] * -up[..., np.newaxis, 1] + points[..., 1] * up[..., np.newaxis, 0]
+    y = -(points[..., 0] * up[..., np.newaxis, 0] + points[..., 1] * up[..., np.newaxis, 1])
+    normalized = np.stack([x, y], axis=-1) / palm_size[..., np.newaxis, np.newaxis]
+    return normalized.reshape(normalized.shape[:-2] + (NUM_LANDMARKS * 2,))
+
+def hand_context(landmarks: np.ndarray, handedness: Sequence[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, 21, 3) 关键点的手部垂直中心与是否左手，返回 (centers (N,), is_left (N,))"""
+    y = np.asarray(landmarks, dtype=np.float32)[..., 1]
+    centers = (y.min(axis=-1) + y.max(axis=-1)) / 2
+    is_left = np.zeros(len(centers), dtype=np.float32)
+    if handedness is not None:
+        is_left = np.array([hand == 'Left' for hand in handedness], dtype=np.float32)
+    return centers, is_left
+
+class PoseMatcher:
+    """和弦模板库的最近邻匹配
+
+    检索向量 = 姿态向量 (42) + position_weight × 垂直中心 + handedness_weight × 是否左手；
+    姿态相同、高低不同的和弦（如 C/G）因此按手的位置区分。
+    模板在加载时建立索引：安装了 scipy 时使用KD树，否则使用预先计算好
+    模板范数的 NumPy 暴力搜索（几百个模板时同样在亚毫秒级）。
+    """
+
+    def __init__(self, templates: np.ndarray, labels: Sequence[str], centers: np.ndarray, is_left: np.ndarray,
+                 max_distance: float = 0.6, mirror_left: bool = True, position_weight: float = 3.0,
+                 handedness_weight: float = 0.0):
+        self.labels = np.array(list(labels) + [UNKNOWN_CHORD], dtype=object)
+        self.max_distance = max_distance
+        self.mirror_left = mirror_left
+        self.position_weight = position_weight
+        self.handedness_weight = handedness_weight
+        self.templates = self._search_vectors(np.asarray(templates, dtype=np.float32).reshape(-1, NUM_LANDMARKS * 2),
+                                              np.asarray(centers, dtype=np.float32),
+                                              np.asarray(is_left, dtype=np.float32))
+
+        self.tree = cKDTree(self.templates) if cKDTree is not None and len(self.templates) else None
+        self.template_norms = (self.templates ** 2).sum(axis=1)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'PoseMatcher':
+        """按 gesture_recognition.pose_matcher 加载模板库，未启用或文件不存在时返回None"""
+        matcher_config = config.get('gesture_recognition', {}).get('pose_matcher', {})
+        if not matcher_config.get('enable', False):
+            return None
+
+        path = matcher_config.get('template_file', 'models/chord_templates.npz')
+        if not os.path.exists(path):
+            print(f"Warning: 和弦模板文件不存在 {path}，姿态匹配未启用")
+            return None
+
+        templates, labels, centers, is_left = load_templates(path)
+        if centers is None:
+            print(f"Warning: 和弦模板文件 {path} 缺少手部位置信息，请用 pose_matcher.py add 重新生成，姿态匹配未启用")
+            return None
+        print(f"✅ 已加载 {len(labels)} 个和弦模板（{'KD树' if cKDTree is not None else '暴力搜索'}）")
+        mirror_left = matcher_config.get('mirror_left', True)
+        # 左手镜像后与右手共用模板时默认不区分左右手
+        return cls(templates, labels, centers, is_left, matcher_config.get('max_distance', 0.6), mirror_left,
+                   matcher_config.get('position_weight', 3.0),
+                   matcher_config.get('handedness_weight', 0.0 if mirror_left else 1.0))
+
+    def _search_vectors(self, poses: np.ndarray, centers: np.ndarray, is_left: np.ndarray) -> np.ndarray:
+        """姿态向量附加按权重缩放的垂直中心与是否左手，(N, 44)"""
+        return np.concatenate([poses, self.position_weight * centers[:, np.newaxis],
+                               self.handedness_weight * is_left[:, np.newaxis]], axis=1).astype(np.float32)
+
+    def query(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """对 (N, 44) 的检索向量求最近模板，返回 (模板下标, 距离)"""
+        if len(self.templates) == 0:
+            return np.full(len(vectors), -1), np.full(len(vectors), np.inf)
+        if self.tree is not None:
+            distances, indices = self.tree.query(vectors, k=1)
+            return indices, distances
+
+        # |q - t|^2 = |q|^2 + |t|^2 - 2 q·t
+        squared = (vectors ** 2).sum(axis=1)[:, np.newaxis] + self.template_norms - 2 * vectors @ self.templates.T
+        indices = squared.argmin(axis=1)
+        distances = np.sqrt(np.maximum(squared[np.arange(len(vectors)), indices], 0.0))
+        return indices, distances
+
+    def match(self, landmarks: np.ndarray, handedness: Sequence[str] = None,
+              aspect: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """匹配 (N, 21, 3) 的多只手，返回 (和弦名称, 置信度)
+
+        距离超过 max_distance 时结果为 unknown；置信度为 1 - 距离/max_distance。
+        """
+        mirror = None
+        if self.mirror_left and handedness is not None:
+            mirror = np.array([hand == 'Left' for hand in handedness], dtype=bool)
+        poses = normalize_landmarks(landmarks, aspect, mirror).reshape(-1, NUM_LANDMARKS * 2)
+        vectors = self._search_vectors(poses, *hand_context(landmarks, handedness))
+
+        indices, distances = self.query(vectors)
+        confidences = np.clip(1.0 - distances / self.max_distance, 0.0, 1.0)
+        indices = np.where(distances <= self.max_distance, indices, -1)
+        return self.labels[indices], confidences
+
+def load_templates(path: str) -> Tuple[np.ndarray, List[str], np.ndarray, np.ndarray]:
+    """读取模板库文件，返回 (姿态向量, 和弦名称, 垂直中心, 是否左手)；旧格式文件没有后两项，返回None"""
+    with np.load(path, allow_pickle=False) as data:
+        centers = data['centers'] if 'centers' in data else None
+        is_left = data['is_left'] if 'is_left' in data else None
+        return data['templates'], data['labels'].tolist(), centers, is_left
+
+def save_templates(path: str, templates: np.ndarray, labels: Sequence[str], centers: np.ndarray,
+                   is_left: np.ndarray):
+    """写出模板库文件"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(path, templates=np.asarray(templates, dtype=np.float32),
+                        labels=np.asarray(labels, dtype=str), centers=np.asarray(centers, dtype=np.float32),
+                        is_left=np.asarray(is_left, dtype=np.float32))
+
+def add_templates_from_recording(template_path: str, recording_path: str, chord: str,
+                                 every: int = 5, mirror_left: bool = True) -> int:
+    """从 replay_harness 录制的会话中每隔 every 帧取一只手作为 chord 的模板，返回新增数量"""
+    from replay_harness import Recording
+
+    recording = Recording(recording_path)
+    height, width = recording.frame_shape[:2] if recording.frame_shape[0] else (480, 640)
+    new_templates, new_centers, new_is_left = [], [], []
+    for index in range(0, len(recording), max(1, every)):
+        hand_frame = recording.hand_frame(index)
+        if len(hand_frame) == 0:
+            continue
+        mirror = [hand_frame.handedness[0] == 'Left'] if mirror_left else None
+        new_templates.append(normalize_landmarks(hand_frame.landmarks[:1], width / height, mirror)[0])
+        centers, is_left = hand_context(hand_frame.landmarks[:1], hand_frame.handedness[:1])
+        new_centers.append(centers[0])
+        new_is_left.append(is_left[0])
+
+    templates, labels, centers, is_left = (np.empty((0, NUM_LANDMARKS * 2), dtype=np.float32), [],
+                                           np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32))
+    if os.path.exists(template_path):
+        templates, labels, centers, is_left = load_templates(template_path)
+        if centers is None:
+            raise ValueError(f"模板库 {template_path} 是不含手部位置的旧格式，请删除后重新生成")
+    if new_templates:
+        templates = np.vstack([templates] + new_templates)
+        labels = labels + [chord] * len(new_templates)
+        centers = np.concatenate([centers, new_centers])
+        is_left = np.concatenate([is_left, new_is_left])
+        save_templates(template_path, templates, labels, centers, is_left)
+    return len(new_templates)
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="和弦姿态模板库")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('add', help="从录制会话中添加模板")
+    add_parser.add_argument('templates', help="模板库 .npz 文件（不存在时新建）")
+    add_parser.add_argument('recording', help="replay_harness.py 录制的 .npz 文件")
+    add_parser.add_argument('chord', help="该会话对应的和弦名称")
+    add_parser.add_argument('--every', type=int, default=5, help="每隔多少帧取一个模板")
+
+    info_parser = subparsers.add_parser('info', help="查看模板库")
+    info_parser.add_argument('templates', help="模板库 .npz 文件")
+    args = parser.parse_args()
+
+    if args.command == 'add':
+        count = add_templates_from_recording(args.templates, args.recording, args.chord, args.every)
+        print(f"✅ 已添加 {count} 个 {args.chord} 模板 → {args.templates}")
+    else:
+        templates, labels, centers, _ = load_templates(args.templates)
+        names, counts = np.unique(labels, return_counts=True)
+        print(f"模板数: {len(labels)} | 维度: {templates.shape[1]}"
+              f"{'' if centers is not None else ' | 旧格式（缺少手部位置，需重新生成）'}")
+        for name, count in zip(names, counts):
+            print(f"  {name}: {count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import time
+from typing import Any, Callable, Dict, List, Optional
+import utils
+
+class QualityGovernor:
+    """闭环画质调节器：根据端到端帧耗时逐级降低/恢复画质"""
+
+    def __init__(self, config: Dict[str, Any] = None,
+                 on_change: Optional[Callable[[Dict[str, Any]], None]] = None):
+        if config is None:
+            config = utils.load_config()
+
+        performance = config.get('performance', {})
+        frame_rate = performance.get('frame_rate', {})
+        fallback = performance.get('fallback', {})
+        governor = performance.get('governor', {})
+
+        self.target_fps = frame_rate.get('target_fps', 30)
+        self.min_fps = frame_rate.get('min_fps', 15)
+        self.max_fps = frame_rate.get('max_fps', 60)
+        self.fallback_fps = fallback.get('fallback_fps', self.min_fps)
+
+        self.overload_ratio = governor.get('overload_ratio', 1.0)
+        self.recover_ratio = governor.get('recover_ratio', 0.6)
+        self.window = governor.get('window', 2.0)
+        self.cooldown = governor.get('cooldown', 3.0)
+        self.smoothing = governor.get('smoothing', 0.1)
+        # 启用流水线时界面重绘与各处理阶段并行，否则与处理串行
+        self.pipelined = performance.get('pipeline', {}).get('enable', False)
+        self.on_change = on_change
+
+        # 画质等级：0为最高画质，依次降低界面刷新率、关闭关键点绘制、降低模型复杂度、降低分辨率
+        base = {
+            'resolution': None,
+            'model_complexity': config.get('hand_tracking', {}).get('model_complexity', 1),
+            'show_landmarks': config.get('debug', {}).get('options', {}).get('show_landmarks', True),
+            'ui_refresh_interval': 1,
+            'target_fps': self.target_fps
+        }
+        self.levels = self._build_levels(base, fallback)
+        self.level = 0
+
+        # 测量状态
+        self.avg_frame_time = 0.0
+        self.avg_ui_time = 0.0
+        self._samples = 0
+        self._ui_samples = 0
+        self._overload_since = None
+        self._headroom_since = None
+        self._low_fps_since = None
+        self._last_change = 0.0
+        self._ui_counter = 0
+        self.history: List[Dict[str, Any]] = []
+
+    def _build_levels(self, base: Dict[str, Any], fallback: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """构建画质阶梯，跳过不会产生变化的等级"""
+        levels = [dict(base)]
+
+        def add_level(**changes):
+            level = dict(levels[-1], **changes)
+            if level != levels[-1]:
+                levels.append(level)
+
+        add_level(ui_refresh_interval=2)
+        add_level(show_landmarks=False)
+        add_level(model_complexity=0)
+        if fallback.get('enable_fallback', True):
+            add_level(resolution=tuple(fallback.get('fallback_resolution', [640, 480])),
+                      target_fps=self.fallback_fps)
+            add_level(ui_refresh_interval=3)
+        return levels
+
+    def get_settings(self) -> Dict[str, Any]:
+        """当前等级的画质设置"""
+        return self.levels[self.level]
+
+    def get_frame_budget(self) -> float:
+        """当前等级下每帧的时间预算（秒）"""
+        return 1.0 / self.get_settings()['target_fps']
+
+    def should_refresh_ui(self) -> bool:
+        """按当前界面刷新间隔决定本帧是否重绘界面"""
+        self._ui_counter += 1
+        if self._ui_counter >= self.get_settings()['ui_refresh_interval']:
+            self._ui_counter = 0
+            return True
+        return False
+
+    def record_ui_time(self, ui_time: float):
+        """记录一次界面重绘的耗时"""
+        self._ui_samples += 1
+        if self._ui_samples == 1:
+            self.avg_ui_time = ui_time
+        else:
+            self.avg_ui_time += self.smoothing * (ui_time - self.avg_ui_time)
+
+    def update(self, frame_time: float, fps: float = None, now: float = None) -> bool:
+        """记录一帧的处理开销（不含界面重绘），必要时调整画质等级，返回是否发生调整
+
+        frame_time 为决定吞吐的每帧开销：同步处理时为整帧处理时间，流水线时为最慢阶段的服务时间。
+        界面重绘的平均耗时（record_ui_time）按当前刷新间隔摊到每一帧，
+        跳过重绘的帧与重绘的帧因此按同一口径计入；流水线时界面与处理并行，取两者中较大的一个。
+        """
+        if now is None:
+            now = time.monotonic()
+        ui_time = self.avg_ui_time / self.get_settings()['ui_refresh_interval']
+        frame_time = max(frame_time, ui_time) if self.pipelined else frame_time + ui_time
+
+        self._samples += 1
+        if self._samples == 1:
+            self.avg_frame_time = frame_time
+        else:
+            self.avg_frame_time += self.smoothing * (frame_time - self.avg_frame_time)
+
+        if now - self._last_change < self.cooldown:
+            return False
+
+        budget = self.get_frame_budget()
+        overloaded = self.avg_frame_time > budget * self.overload_ratio
+        has_headroom = self.avg_frame_time < budget * self.recover_ratio
+
+        # 帧率持续低于下限时降级（与过载判断一样需持续一个观察窗口）；
+        # 当前等级的目标帧率本身不高于下限时（如降级到 fallback_fps）帧率在下限附近波动属正常，不适用此规则
+        low_fps = fps is not None and 0 < fps < self.min_fps and self.get_settings()['target_fps'] > self.min_fps
+        self._low_fps_since = (self._low_fps_since or now) if low_fps else None
+        if (self._low_fps_since is not None and now - self._low_fps_since >= self.window
+                and self.level < len(self.levels) - 1):
+            return self._set_level(self.level + 1, now, f"FPS {fps:.1f} 低于下限 {self.min_fps}")
+
+        self._overload_since = (self._overload_since or now) if overloaded else None
+        self._headroom_since = (self._headroom_since or now) if has_headroom else None
+
+        if self._overload_since is not None and now - self._overload_since >= self.window:
+            if self.level < len(self.levels) - 1:
+                return self._set_level(self.level + 1, now,
+                                       f"帧耗时 {self.avg_frame_time * 1000:.1f}ms 超出预算 {budget * 1000:.1f}ms")
+        elif self._headroom_since is not None and now - self._headroom_since >= self.window:
+            if self.level > 0:
+                # 升级前检查上一级的预算是否仍有余量
+                upper_budget = 1.0 / self.levels[self.level - 1]['target_fps']
+                if self.avg_frame_time < upper_budget * self.recover_ratio:
+                    return self._set_level(self.level - 1, now,
+                                           f"帧耗时 {self.avg_frame_time * 1000:.1f}ms 有余量")
+        return False
+
+    def _set_level(self, level: int, now: float, reason: str) -> bool:
+        """切换画质等级并通知应用"""
+        old_level = self.level
+        self.level = level
+        self._last_change = now
+        self._overload_since = None
+        self._headroom_since = None
+        self._low_fps_since = None
+
+        settings = self.get_settings()
+        direction = "⬇️ 降低" if level > old_level else "⬆️ 恢复"
+        print(f"⚙️ 画质{direction}: 等级 {old_level} → {level} ({reason}) | 设置: {settings}")
+        self.history.append({'time': now, 'from': old_level, 'to': level, 'reason': reason})
+        if len(self.history) > 50:
+            self.history.pop(0)
+
+        if self.on_change is not None:
+            self.on_change(settings)
+        return True
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List, Sequence
+
+from gesture_stability import StabilityEngine
+from hand_identity import HandIdentityTracker
+from strum_detector import StrumDetector
+
+class EventExtractor:
+    """从逐帧分析结果中提取和弦切换与扫弦事件（与 AirGuitarApp 的触发逻辑一致）"""
+
+    def __init__(self, gesture_analyzer: Any, config: Dict[str, Any] = None):
+        self.gesture_analyzer = gesture_analyzer
+        self.hand_identity = HandIdentityTracker(config)
+        self.stability = StabilityEngine(config)
+        self.strum_detector = StrumDetector(config)
+        self.current_chord = "none"
+
+    def update(self, analyzed_data: List[Dict[str, Any]], frame_index: int, timestamp: float,
+               image_shape: Sequence[int] = (480, 640), emit: bool = True) -> List[Dict[str, Any]]:
+        """处理一帧的分析结果，返回本帧产生的事件；emit为False时只更新状态"""
+        events = []
+        hand_ids = self.hand_identity.assign(analyzed_data, timestamp)
+        self.stability.apply(analyzed_data, hand_ids)
+        # 只清除身份追踪判定为已消失的手，短暂漏检的手保留稳定性与扫弦状态
+        expired_ids = self.hand_identity.expired_ids
+        self.stability.prune(expired_ids)
+
+        current_chord = "none"
+        hand_type = None
+        for analysis in analyzed_data:
+            if analysis['detected'] and analysis['gesture'] != "unknown":
+                current_chord = analysis['gesture']
+                hand_type = analysis.get('hand_type')
+
+        # 和弦切换
+        if current_chord != self.current_chord and current_chord != "none":
+            events.append({
+                'time': timestamp,
+                'frame': frame_index,
+                'event': 'chord',
+                'value': current_chord,
+                'hand_type': hand_type
+            })
+
+        # 扫弦（按手的ID分别检测，事件时间取扫弦起始时刻）
+        for analysis in analyzed_data:
+            if 'hand_id' not in analysis:
+                continue
+            strum = self.strum_detector.update(analysis['hand_id'], analysis, timestamp, image_shape)
+            if strum is not None:
+                events.append({
+                    'time': strum['onset'],
+                    'frame': frame_index,
+                    'event': 'strum',
+                    'value': strum['direction'],
+                    'hand_type': analysis.get('hand_type')
+                })
+        self.strum_detector.prune(expired_ids)
+
+        self.current_chord = current_chord
+        return events if emit else []
@@ -0,0 +1,445 @@
+"""多路识别服务：多个视频源的帧按会话路由到固定的工作进程，工作进程为每个会话持有一个 HandTracker
+
+用法示例:
+    python recognition_server.py session1.mp4 session2.mp4 --workers 4
+    python recognition_server.py --listen 9000 --workers 8
+"""
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import queue
+import socket
+import struct
+import threading
+import time
+import cv2
+import numpy as np
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional
+
+from hand_tracker import HandTracker
+from gesture_analyzer1 import GestureAnalyzer
+from recognition_events import EventExtractor
+import utils
+
+def _worker_main(worker_id: int, config: Dict[str, Any], shm_name: str, num_slots: int,
+                 slot_bytes: int, task_queue: Any, result_queue: Any):
+    """工作进程：从共享内存槽位读取帧，运行追踪与分析，按会话维护事件状态"""
+    cv2.setNumThreads(1)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray((num_slots, slot_bytes), dtype=np.uint8, buffer=shm.buf)
+
+    # 会话固定在同一工作进程上，每个会话使用自己的 HandTracker，保留MediaPipe的跨帧跟踪
+    trackers: Dict[str, HandTracker] = {}
+    analyzer = GestureAnalyzer(config)
+    extractors: Dict[str, EventExtractor] = {}
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            if task[0] == 'close':
+                extractors.pop(task[1], None)
+                tracker = trackers.pop(task[1], None)
+                if tracker is not None:
+                    tracker.release()
+                continue
+
+            _, session_id, slot, shape, frame_index, timestamp = task
+            frame = slots[slot, :int(np.prod(shape))].reshape(shape)
+            start = time.perf_counter()
+            tracker = trackers.get(session_id)
+            if tracker is None:
+                tracker = trackers[session_id] = HandTracker(config['hand_tracking'], show_landmarks=False)
+            hand_frame = tracker.track(frame, timestamp=timestamp)
+            analyzed_data = analyzer.analyze_frame(hand_frame, shape)
+
+            extractor = extractors.get(session_id)
+            if extractor is None:
+                extractor = extractors[session_id] = EventExtractor(analyzer, config)
+            events = extractor.update(analyzed_data, frame_index, timestamp, shape)
+
+            result_queue.put((worker_id, slot, {
+                'session_id': session_id,
+                'frame': frame_index,
+                'time': timestamp,
+                'chord': extractor.current_chord,
+                'hands': [{
+                    'hand_id': analysis.get('hand_id'),
+                    'hand_type': analysis['hand_type'],
+                    'gesture': analysis['gesture'],
+                    'score': analysis['score'],
+                    'bounding_box': analysis['bounding_box']
+                } for analysis in analyzed_data],
+                'events': events,
+                'service_ms': (time.perf_counter() - start) * 1000
+            }))
+    finally:
+        for tracker in trackers.values():
+            tracker.release()
+        analyzer.diagnostics.close()
+        del slots
+        shm.close()
+
+class RecognitionSession:
+    """一路视频流的识别会话，结果按帧顺序放入 results 队列或交给回调"""
+
+    def __init__(self, session_id: str, worker_id: int,
+                 callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.session_id = session_id
+        self.worker_id = worker_id
+        self.callback = callback
+        self.results: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.events: List[Dict[str, Any]] = []
+
+    def deliver(self, result: Dict[str, Any]):
+        """接收工作进程返回的一帧结果"""
+        self.completed += 1
+        self.events.extend(result['events'])
+        if self.callback is not None:
+            self.callback(result)
+        else:
+            self.results.put(result)
+
+class RecognitionServer:
+    """多路识别服务"""
+
+    def __init__(self, config: Dict[str, Any] = None, num_workers: int = None):
+        if config is None:
+            config = utils.load_config()
+
+        server_config = config.get('server', {})
+        self.config = config
+        self.num_workers = num_workers or server_config.get('workers') or mp.cpu_count()
+        self.slots_per_worker = server_config.get('slots_per_worker', 4)
+        max_width, max_height = server_config.get('max_frame_size', [1920, 1080])
+        self.slot_bytes = max_width * max_height * 3
+
+        self.sessions: Dict[str, RecognitionSession] = {}
+        self._session_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._free_slots: List[deque] = []
+        self._workers = []
+        self._task_queues = []
+        self._result_queue = None
+        self._shm = None
+        self._collector = None
+        self._feeders: List[threading.Thread] = []
+        self._submitting = 0
+        self._collecting = False
+        self.is_running = False
+
+    def start(self) -> 'RecognitionServer':
+        """启动工作进程与结果收集线程"""
+        if self.is_running:
+            return self
+
+        context = mp.get_context('spawn')
+        total_slots = self.num_workers * self.slots_per_worker
+        self._shm = shared_memory.SharedMemory(create=True, size=total_slots * self.slot_bytes)
+        self._result_queue = context.Queue()
+
+        for worker_id in range(self.num_workers):
+            # 每个工作进程使用共享内存中连续的一段槽位
+            task_queue = context.Queue()
+            worker = context.Process(
+                target=_worker_main,
+                args=(worker_id, self.config, self._shm.name, total_slots, self.slot_bytes,
+                      task_queue, self._result_queue),
+                name=f"RecognitionWorker-{worker_id}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+            self._task_queues.append(task_queue)
+            first_slot = worker_id * self.slots_per_worker
+            self._free_slots.append(deque(range(first_slot, first_slot + self.slots_per_worker)))
+
+        self._slots = np.ndarray((total_slots, self.slot_bytes), dtype=np.uint8, buffer=self._shm.buf)
+        self.is_running = True
+        self._collecting = True
+        self._collector = threading.Thread(target=self._collect_results, name="ResultCollector", daemon=True)
+        self._collector.start()
+        print(f"✅ 识别服务已启动: {self.num_workers} 个工作进程")
+        return self
+
+    def open_session(self, session_id: str = None,
+                     callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> RecognitionSession:
+        """创建会话，并固定分配给当前会话数最少的工作进程"""
+        with self._lock:
+            if session_id is None:
+                session_id = f"session-{next(self._session_ids)}"
+            load = [0] * self.num_workers
+            for session in self.sessions.values():
+                load[session.worker_id] += 1
+            worker_id = int(np.argmin(load))
+            session = RecognitionSession(session_id, worker_id, callback)
+            self.sessions[session_id] = session
+        return session
+
+    def close_session(self, session_id: str):
+        """关闭会话并通知工作进程清理其状态"""
+        with self._lock:
+            session = self.sessions.pop(session_id, None)
+        if session is not None and self.is_running:
+            self._task_queues[session.worker_id].put(('close', session_id))
+
+    def submit(self, session_id: str, frame: np.ndarray, frame_index: int,
+               timestamp: float, block: bool = False) -> bool:
+        """提交一帧；工作进程槽位已满时按 block 决定等待或丢弃该帧，服务未运行时返回False"""
+        session = self.sessions.get(session_id)
+        if session is None or frame.nbytes > self.slot_bytes:
+            return False
+
+        worker_id = session.worker_id
+        with self._lock:
+            if not self.is_running:
+                return False
+            free_slots = self._free_slots[worker_id]
+            while not free_slots:
+                if not block or not self.is_running:
+                    session.dropped += 1
+                    return False
+                self._slot_freed.wait(0.1)
+            slot = free_slots.popleft()
+            # stop() 会等待正在写入槽位的提交完成后才释放共享内存
+            self._submitting += 1
+
+        try:
+            self._slots[slot, :frame.nbytes] = frame.reshape(-1)
+            session.submitted += 1
+            self._task_queues[worker_id].put(('frame', session_id, slot, frame.shape, frame_index, timestamp))
+        finally:
+            with self._lock:
+                self._submitting -= 1
+                self._slot_freed.notify_all()
+        return True
+
+    def _collect_results(self):
+        """收集线程：释放槽位并把结果分发到对应会话"""
+        while self._collecting:
+            try:
+                worker_id, slot, result = self._result_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            with self._lock:
+                self._free_slots[worker_id].append(slot)
+                self._slot_freed.notify_all()
+                session = self.sessions.get(result['session_id'])
+            if session is not None:
+                session.deliver(result)
+
+    def attach_source(self, session: RecognitionSession, source: Any, realtime: bool = False,
+                      close_when_done: bool = False) -> threading.Thread:
+        """为会话启动一个读帧线程；source 需提供 read() -> (ret, frame) 与 release()
+
+        source.live 为真时（如套接字流）帧按到达时间打时间戳、不再按帧率节流，来不及处理的帧被丢弃；
+        否则时间戳为 帧序号/源帧率，realtime 时按源帧率送帧以模拟实时摄像头。
+        """
+        live = getattr(source, 'live', False)
+
+        def feed():
+            frame_index = 0
+            start = time.monotonic()
+            fps = getattr(source, 'fps', 30.0) or 30.0
+            try:
+                while self.is_running:
+                    ret, frame = source.read()
+                    if not ret:
+                        break
+                    if live:
+                        timestamp = time.monotonic() - start
+                    else:
+                        timestamp = frame_index / fps
+                        if realtime:
+                            # 按源帧率送帧，模拟实时摄像头，来不及处理的帧被丢弃
+                            delay = start + timestamp - time.monotonic()
+                            if delay > 0:
+                                time.sleep(delay)
+                    self.submit(session.session_id, frame, frame_index, timestamp, block=not (realtime or live))
+                    frame_index += 1
+            finally:
+                if close_when_done:
+                    # 等待已提交的帧处理完，结果送回后再关闭会话
+                    deadline = time.monotonic() + 5.0
+                    while session.completed < session.submitted and time.monotonic() < deadline:
+                        time.sleep(0.01)
+                    self.close_session(session.session_id)
+                source.release()
+
+        feeder = threading.Thread(target=feed, name=f"Feeder-{session.session_id}", daemon=True)
+        feeder.start()
+        self._feeders.append(feeder)
+        return feeder
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """等待所有读帧线程结束且已提交的帧全部处理完"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for feeder in self._feeders:
+            feeder.join(None if deadline is None else max(0, deadline - time.monotonic()))
+        while any(s.completed < s.submitted for s in list(self.sessions.values())):
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self):
+        """停止工作进程并释放共享内存"""
+        with self._lock:
+            if not self.is_running:
+                return
+            # 先拒绝新的提交，再等待已取得槽位的提交写完
+            self.is_running = False
+            self._slot_freed.notify_all()
+            while self._submitting:
+                self._slot_freed.wait(0.1)
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5.0)
+            if worker.is_alive():
+                print(f"Warning: 工作进程 {worker.name} 未能按时退出，强制终止")
+                worker.terminate()
+                worker.join(timeout=1.0)
+        self._collecting = False
+        if self._collector is not None:
+            self._collector.join(timeout=1.0)
+        del self._slots
+        self._shm.close()
+        self._shm.unlink()
+        self._workers.clear()
+        self._task_queues.clear()
+        print("✅ 识别服务已停止")
+
+class VideoFileSource:
+    """本地视频文件帧源"""
+
+    def __init__(self, path: str):
+        self.cap = cv2.VideoCapture(path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def read(self):
+        return self.cap.read()
+
+    def release(self):
+        self.cap.release()
+
+class SocketSource:
+    """套接字帧源：每帧为4字节大端长度 + JPEG数据，代替真实摄像头
+
+    帧按到达时间打时间戳（live）。识别结果经每个连接自己的发送队列与发送线程写回，
+    慢客户端不会阻塞识别服务的结果收集线程；队列满时丢弃新结果。
+    """
+
+    live = True
+
+    def __init__(self, connection: socket.socket, send_queue_size: int = 256):
+        self.connection = connection
+        self._reader = connection.makefile('rb')
+        self._outbox: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(send_queue_size)
+        self.dropped_results = 0
+        self._writer = threading.Thread(target=self._write_results, name="SocketWriter", daemon=True)
+        self._writer.start()
+
+    def read(self):
+        header = self._reader.read(4)
+        if len(header) < 4:
+            return False, None
+        (length,) = struct.unpack('>I', header)
+        payload = self._reader.read(length)
+        if len(payload) < length:
+            return False, None
+        frame = cv2.imdecode(np.frombuffer(payload, dtype=np.uint8), cv2.IMREAD_COLOR)
+        return frame is not None, frame
+
+    def send_result(self, result: Dict[str, Any]):
+        """把识别结果放入发送队列（在结果收集线程中调用，不阻塞）"""
+        try:
+            self._outbox.put_nowait(result)
+        except queue.Full:
+            self.dropped_results += 1
+
+    def _write_results(self):
+        """发送线程：把识别结果以JSON行的形式写回客户端"""
+        while True:
+            result = self._outbox.get()
+            if result is None:
+                break
+            try:
+                self.connection.sendall((json.dumps(result, ensure_ascii=False) + "\n").encode('utf-8'))
+            except OSError:
+                break
+
+    def release(self):
+        # 先发完已排队的结果再关闭连接（发送队列满时不等待）
+        try:
+            self._outbox.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        self._writer.join(timeout=2.0)
+        self._reader.close()
+        self.connection.close()
+
+def serve_socket(server: RecognitionServer, port: int, host: str = '0.0.0.0'):
+    """监听端口，每个连接作为一个识别会话"""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen()
+    print(f"📡 正在监听 {host}:{port}")
+
+    try:
+        while True:
+            connection, address = listener.accept()
+            source = SocketSource(connection)
+            session = server.open_session(f"{address[0]}:{address[1]}", callback=source.send_result)
+            print(f"👋 新会话 {session.session_id} → 工作进程 {session.worker_id}")
+            server.attach_source(session, source, realtime=True, close_when_done=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="多路手势识别服务")
+    parser.add_argument('videos', nargs='*', help="作为独立会话处理的视频文件")
+    parser.add_argument('--listen', type=int, default=None, help="监听端口，接收套接字视频流")
+    parser.add_argument('--workers', type=int, default=None, help="工作进程数（默认CPU核数）")
+    parser.add_argument('--realtime', action='store_true', help="视频文件按原始帧率送帧")
+    parser.add_argument('--config', default='config.yaml', help="配置文件路径")
+    args = parser.parse_args()
+
+    server = RecognitionServer(utils.load_config(args.config), args.workers).start()
+    try:
+        if args.listen is not None:
+            serve_socket(server, args.listen)
+            return
+
+        start = time.time()
+        sessions = []
+        for path in args.videos:
+            session = server.open_session(path, callback=lambda result: None)
+            server.attach_source(session, VideoFileSource(path), realtime=args.realtime)
+            sessions.append(session)
+        server.wait_idle()
+
+        elapsed = time.time() - start
+        total = sum(session.completed for session in sessions)
+        for session in sessions:
+            print(f"🎬 {session.session_id}: {session.completed} 帧, {len(session.events)} 个事件, 丢弃 {session.dropped} 帧")
+        if elapsed > 0:
+            print(f"⏱️ 共 {total} 帧，用时 {elapsed:.1f}s（{total / elapsed:.1f} 帧/秒）")
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
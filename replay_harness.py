@@ -0,0 +1,261 @@
+"""关键点/视频帧录制与回放：不依赖实时摄像头即可复现整条识别流水线
+
+用法示例:
+    python replay_harness.py record session.npz --seconds 30 --frames
+    python replay_harness.py info session.npz
+"""
+import argparse
+import time
+import cv2
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from hand_frame import HandFrame, NUM_LANDMARKS, draw_hand_frame
+
+HANDEDNESS_LABELS = ('Left', 'Right')
+
+class SessionRecorder:
+    """录制关键点流（可选同时录制JPEG压缩的原始帧），保存为单个 .npz 文件
+
+    文件内容:
+        timestamps   (N,)          每帧时间戳（秒，相对第一帧）
+        hand_counts  (N,)          每帧手的数量
+        landmarks    (H, 21, 3)    所有帧的关键点按顺序拼接
+        handedness   (H,)          0=Left, 1=Right
+        scores       (H,)          检测置信度
+        frame_shape  (3,)          原始帧尺寸
+        frame_offsets/frame_data   可选，JPEG字节的偏移表与拼接数据
+    """
+
+    def __init__(self, record_frames: bool = False, jpeg_quality: int = 85):
+        self.record_frames = record_frames
+        self.jpeg_quality = jpeg_quality
+        self._timestamps: List[float] = []
+        self._hand_counts: List[int] = []
+        self._landmarks: List[np.ndarray] = []
+        self._handedness: List[int] = []
+        self._scores: List[np.ndarray] = []
+        self._frames: List[bytes] = []
+        self._frame_shape = (0, 0, 0)
+        self._start_time = None
+
+    def add(self, hand_frame: HandFrame, frame: np.ndarray = None):
+        """追加一帧"""
+        if self._start_time is None:
+            self._start_time = hand_frame.timestamp
+        self._timestamps.append(hand_frame.timestamp - self._start_time)
+        self._hand_counts.append(len(hand_frame))
+        self._landmarks.append(hand_frame.landmarks.copy())
+        self._handedness.extend(HANDEDNESS_LABELS.index(label) if label in HANDEDNESS_LABELS else 1
+                                for label in hand_frame.handedness)
+        self._scores.append(hand_frame.scores.copy())
+
+        if frame is not None:
+            self._frame_shape = frame.shape
+            if self.record_frames:
+                ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+                self._frames.append(encoded.tobytes() if ok else b'')
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def save(self, path: str):
+        """写出 .npz 文件"""
+        data = {
+            'timestamps': np.asarray(self._timestamps, dtype=np.float64),
+            'hand_counts': np.asarray(self._hand_counts, dtype=np.uint8),
+            'landmarks': (np.concatenate(self._landmarks) if self._landmarks
+                          else np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)),
+            'handedness': np.asarray(self._handedness, dtype=np.uint8),
+            'scores': (np.concatenate(self._scores) if self._scores
+                       else np.empty(0, dtype=np.float32)),
+            'frame_shape': np.asarray(self._frame_shape, dtype=np.int32)
+        }
+        if self._frames:
+            data['frame_offsets'] = np.cumsum([0] + [len(f) for f in self._frames]).astype(np.int64)
+            data['frame_data'] = np.frombuffer(b''.join(self._frames), dtype=np.uint8)
+        np.savez_compressed(path, **data)
+
+class Recording:
+    """已录制的会话，按帧索引提供 HandFrame 与原始帧"""
+
+    def __init__(self, path: str):
+        with np.load(path) as data:
+            self.timestamps = data['timestamps']
+            self.hand_counts = data['hand_counts'].astype(np.intp)
+            self.landmarks = data['landmarks']
+            self.handedness = data['handedness']
+            self.scores = data['scores']
+            self.frame_shape = tuple(int(v) for v in data['frame_shape'])
+            self.frame_offsets = data['frame_offsets'] if 'frame_offsets' in data else None
+            self.frame_data = data['frame_data'] if 'frame_data' in data else None
+        self._hand_offsets = np.concatenate([[0], np.cumsum(self.hand_counts)])
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def has_frames(self) -> bool:
+        """是否包含原始帧"""
+        return self.frame_offsets is not None
+
+    def hand_frame(self, index: int) -> HandFrame:
+        """第 index 帧的关键点"""
+        start, end = self._hand_offsets[index], self._hand_offsets[index + 1]
+        handedness = [HANDEDNESS_LABELS[v] for v in self.handedness[start:end]]
+        return HandFrame(self.landmarks[start:end], handedness, self.scores[start:end],
+                         float(self.timestamps[index]))
+
+    def frame(self, index: int) -> np.ndarray:
+        """第 index 帧的原始图像；未录制原始帧时返回同尺寸的黑色画面"""
+        if self.has_frames:
+            start, end = self.frame_offsets[index], self.frame_offsets[index + 1]
+            return cv2.imdecode(self.frame_data[start:end], cv2.IMREAD_COLOR)
+        height, width = self.frame_shape[:2] if self.frame_shape[0] else (480, 640)
+        return np.zeros((height, width, 3), dtype=np.uint8)
+
+class ReplayTracker:
+    """按顺序返回录制的关键点，替代 HandTracker（接口一致）"""
+
+    def __init__(self, recording: Recording, show_landmarks: bool = True):
+        self.recording = recording
+        self.show_landmarks = show_landmarks
+        self.index = 0
+
+    def track(self, image: np.ndarray, is_rgb: bool = False, timestamp: float = None) -> HandFrame:
+        """返回下一帧录制的关键点（忽略输入图像）"""
+        hand_frame = self.recording.hand_frame(self.index % len(self.recording))
+        self.index += 1
+        if timestamp is not None:
+            hand_frame.timestamp = timestamp
+        return hand_frame
+
+    def process_frame(self, image: np.ndarray, timestamp: float = None) -> Tuple[np.ndarray, HandFrame]:
+        hand_frame = self.track(image, timestamp=timestamp)
+        if self.show_landmarks:
+            draw_hand_frame(image, hand_frame)
+        return image, hand_frame
+
+    def draw_landmarks(self, image: np.ndarray, hand_frame: HandFrame) -> np.ndarray:
+        return draw_hand_frame(image, hand_frame)
+
+    def set_model_complexity(self, model_complexity: int):
+        pass
+
+    def release(self):
+        pass
+
+class ReplayDriver:
+    """把录制的会话按确定的顺序与时间戳送入 AirGuitarApp.process_frame
+
+    use_frames为False（或录制中没有原始帧）时用 ReplayTracker 替换应用的手部追踪器，
+    只回放关键点；否则解码原始帧并交给应用自己的追踪器。
+    """
+
+    def __init__(self, app: Any, recording: Recording, use_frames: bool = False):
+        self.app = app
+        self.recording = recording
+        self.use_frames = use_frames and recording.has_frames
+        if not self.use_frames:
+            show_landmarks = getattr(app.hand_tracker, 'show_landmarks', True)
+            app.hand_tracker = ReplayTracker(recording, show_landmarks)
+
+    def frames(self) -> Iterator[Tuple[int, np.ndarray, float]]:
+        """依次产出 (帧索引, 图像, 时间戳)"""
+        blank = None
+        for index in range(len(self.recording)):
+            if self.use_frames:
+                frame = self.recording.frame(index)
+            else:
+                if blank is None:
+                    blank = self.recording.frame(index)
+                frame = blank.copy()
+            yield index, frame, float(self.recording.timestamps[index])
+
+    def run(self) -> List[Dict[str, Any]]:
+        """完整回放一遍，返回每帧的处理结果"""
+        return [self.app.process_frame(frame, timestamp) for _, frame, timestamp in self.frames()]
+
+def record_from_video(output_path: str, video_path: str, record_frames: bool,
+                      config: Dict[str, Any] = None):
+    """逐帧录制视频文件（时间戳取 帧索引/帧率，不丢帧）"""
+    from hand_tracker import HandTracker
+    import utils
+
+    if config is None:
+        config = utils.load_config()
+    tracker = HandTracker(config['hand_tracking'], show_landmarks=False)
+    recorder = SessionRecorder(record_frames)
+    cap = cv2.VideoCapture(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            recorder.add(tracker.track(frame, timestamp=len(recorder) / fps), frame)
+    finally:
+        cap.release()
+        tracker.release()
+
+    recorder.save(output_path)
+    print(f"✅ 已录制 {len(recorder)} 帧 → {output_path}")
+
+def record_from_camera(output_path: str, seconds: float, record_frames: bool, source: Any = 0,
+                       config: Dict[str, Any] = None):
+    """从摄像头录制一段会话"""
+    from camera_capture import CameraCapture
+    from hand_tracker import HandTracker
+    import utils
+
+    if config is None:
+        config = utils.load_config()
+    tracker = HandTracker(config['hand_tracking'], show_landmarks=False)
+    recorder = SessionRecorder(record_frames)
+    cap = CameraCapture(source).start()
+    if not cap.is_opened():
+        print("❌ 无法访问摄像头")
+        return
+
+    print(f"🎥 开始录制 {seconds:.0f} 秒...")
+    end_time = time.monotonic() + seconds
+    try:
+        while time.monotonic() < end_time and cap.is_running():
+            ret, frame, timestamp = cap.read(timeout=0.1)
+            if ret:
+                recorder.add(tracker.track(frame, timestamp=timestamp), frame)
+    finally:
+        cap.release()
+        tracker.release()
+
+    recorder.save(output_path)
+    print(f"✅ 已录制 {len(recorder)} 帧 → {output_path}")
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="关键点/视频帧录制与回放")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="从摄像头或视频文件录制会话")
+    record_parser.add_argument('output', help="输出 .npz 文件")
+    record_parser.add_argument('--seconds', type=float, default=30.0, help="摄像头录制时长（秒）")
+    record_parser.add_argument('--frames', action='store_true', help="同时录制JPEG压缩的原始帧")
+    record_parser.add_argument('--source', default='0', help="摄像头编号或视频文件路径")
+
+    info_parser = subparsers.add_parser('info', help="查看录制文件信息")
+    info_parser.add_argument('recording', help="录制的 .npz 文件")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        if args.source.isdigit():
+            record_from_camera(args.output, args.seconds, args.frames, int(args.source))
+        else:
+            record_from_video(args.output, args.source, args.frames)
+    else:
+        recording = Recording(args.recording)
+        duration = recording.timestamps[-1] if len(recording) else 0.0
+        print(f"帧数: {len(recording)} | 时长: {duration:.1f}s | 手部帧: {int(recording.hand_counts.sum())} | "
+              f"原始帧: {'有' if recording.has_frames else '无'} | 画面尺寸: {recording.frame_shape}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import mmap
+import struct
+import threading
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence, Tuple
+
+def read_wav_header(path: str) -> Tuple[int, int, int, int, int]:
+    """解析WAV头，返回 (声道数, 采样率, 位深(字节), 数据起始偏移, 数据字节数)"""
+    with open(path, 'rb') as file:
+        header = file.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            raise ValueError(f"不是有效的WAV文件: {path}")
+
+        fmt = None
+        while True:
+            chunk = file.read(8)
+            if len(chunk) < 8:
+                raise ValueError(f"WAV文件缺少data块: {path}")
+            chunk_id, size = chunk[:4], struct.unpack('<I', chunk[4:])[0]
+            if chunk_id == b'fmt ':
+                audio_format, channels, rate, _, _, bits = struct.unpack('<HHIIHH', file.read(16))
+                if audio_format not in (1, 0xFFFE):
+                    raise ValueError(f"只支持PCM格式的WAV: {path}")
+                fmt = (channels, rate, bits // 8)
+                file.seek(size - 16 + (size & 1), 1)
+            elif chunk_id == b'data':
+                if fmt is None:
+                    raise ValueError(f"WAV文件的data块在fmt块之前: {path}")
+                return fmt + (file.tell(), size)
+            else:
+                file.seek(size + (size & 1), 1)
+
+def resample(data: np.ndarray, rate: int, target_rate: int) -> np.ndarray:
+    """线性插值重采样（(N,) 或 (N, C)）"""
+    if rate == target_rate or len(data) == 0:
+        return data
+    positions = np.arange(int(len(data) * target_rate / rate)) * (rate / target_rate)
+    source = np.arange(len(data))
+    if data.ndim == 1:
+        return np.interp(positions, source, data).astype(np.float32)
+    return np.stack([np.interp(positions, source, data[:, c]) for c in range(data.shape[1])],
+                    axis=1).astype(np.float32)
+
+def open_wav(path: str, sample_rate: int = None, header: Tuple[int, int, int, int, int] = None) -> np.ndarray:
+    """以内存映射方式打开WAV
+
+    16位且采样率与 sample_rate 一致时直接返回 int16 的只读映射（不解码、不占用进程内存，
+    由混音声部按块转换）；其他格式解码为 float32 并重采样。
+    header 为已知的 read_wav_header() 结果（来自样本清单），提供时不再解析文件头。
+    """
+    channels, rate, width, data_offset, size = header if header is not None else read_wav_header(path)
+    frames = size // (channels * width)
+    dtype = {1: np.uint8, 2: '<i2', 4: '<i4'}.get(width)
+    if dtype is None:
+        raise ValueError(f"不支持的WAV位深: {width * 8} bit")
+    if frames == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    with open(path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    data = np.frombuffer(mapped, dtype=dtype, count=frames * channels, offset=data_offset)
+    if channels > 1:
+        data = data.reshape(-1, channels)
+    if width == 2 and (sample_rate is None or rate == sample_rate):
+        return data
+
+    if width == 1:
+        decoded = (data.astype(np.float32) - 128) / 128
+    else:
+        decoded = data.astype(np.float32) / float(2 ** (8 * width - 1))
+    return resample(decoded, rate, sample_rate) if sample_rate else decoded
+
+class SampleCache:
+    """按需加载的音频样本缓存（LRU淘汰）
+
+    register() 只记录文件路径；第一次取用时才映射/解码文件。
+    常用样本保持驻留，超出条目数上限或内存上限时淘汰最久未使用的样本；
+    被淘汰的样本如仍在发声，由声部持有的引用保证播放完毕后再释放。
+    """
+
+    def __init__(self, sample_rate: int, max_entries: int = 32, max_bytes: int = 128 * 1024 * 1024):
+        self.sample_rate = sample_rate
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.paths: Dict[str, Tuple[str, Any]] = {}
+        self._entries: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, sample_rate: int, performance_config: Dict[str, Any] = None) -> 'SampleCache':
+        """按 performance.caching.audio_cache_size 与 performance.resources.max_memory_usage 创建"""
+        performance_config = performance_config or {}
+        caching = performance_config.get('caching', {})
+        max_memory = performance_config.get('resources', {}).get('max_memory_usage', 512)
+        share = caching.get('audio_memory_share', 0.25)
+        return cls(sample_rate, caching.get('audio_cache_size', 32), int(max_memory * share * 1024 * 1024))
+
+    def register(self, key: str, path: str, header: Tuple[int, int, int, int, int] = None):
+        """登记样本文件（不读取文件）"""
+        self.paths[key] = (path, header)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.paths
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        # 在锁外映射/解码，多个样本可以并发加载
+        path, header = self.paths[key]
+        data = open_wav(path, self.sample_rate, header)
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries:
+                self._entries[key] = data
+                self._bytes += data.nbytes
+                self._evict()
+            return data
+
+    def preload(self, keys: Sequence[str], workers: int = 4) -> List[Tuple[str, Exception]]:
+        """用线程池并发加载若干样本（最多加载到缓存容量），返回加载失败的 (名称, 异常)"""
+        keys = [key for key in keys if key in self.paths][:self.max_entries]
+
+        def load(key: str):
+            try:
+                self[key]
+            except Exception as e:
+                return key, e
+            return None
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return [failure for failure in executor.map(load, keys) if failure is not None]
+
+    def _evict(self):
+        # 最近取用的样本总是保留
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, data = self._entries.popitem(last=False)
+            self._bytes -= data.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'registered': len(self.paths),
+            'resident': len(self._entries),
+            'resident_mb': self._bytes / (1024 * 1024),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
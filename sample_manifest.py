@@ -0,0 +1,112 @@
+"""音源库样本清单
+
+清单 manifest.json 由音源库生成器写出，记录每个样本的逻辑名称、文件、
+数据偏移、采样率与校验和，AudioSystem 启动时只读取这一个文件，不再逐个探测样本文件。
+
+用法示例:
+    python sample_manifest.py build guitar_samples
+    python sample_manifest.py verify guitar_samples
+"""
+import argparse
+import json
+import os
+import zlib
+from typing import Any, Dict
+
+from sample_cache import read_wav_header
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# 子目录 → 逻辑名称前缀（单音与和弦直接用文件名，特效加 "effect/" 前缀）
+SAMPLE_GROUPS = {
+    'single_notes': '',
+    'chords': '',
+    'effects': 'effect/'
+}
+
+def file_checksum(path: str) -> str:
+    """文件的 CRC32 校验和（十六进制）"""
+    checksum = 0
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            checksum = zlib.crc32(chunk, checksum)
+    return f"{checksum:08x}"
+
+def build_manifest(base_path: str) -> Dict[str, Any]:
+    """扫描音源库目录生成清单"""
+    samples = {}
+    for group, prefix in SAMPLE_GROUPS.items():
+        group_path = os.path.join(base_path, group)
+        if not os.path.isdir(group_path):
+            continue
+        for name in sorted(os.listdir(group_path)):
+            stem, extension = os.path.splitext(name)
+            if extension.lower() != '.wav':
+                continue
+            path = os.path.join(group_path, name)
+            channels, rate, width, offset, size = read_wav_header(path)
+            samples[prefix + stem] = {
+                'file': f"{group}/{name}",
+                'offset': offset,
+                'size': size,
+                'channels': channels,
+                'sample_rate': rate,
+                'sample_width': width,
+                'checksum': file_checksum(path)
+            }
+    return {'version': MANIFEST_VERSION, 'samples': samples}
+
+def write_manifest(base_path: str) -> Dict[str, Any]:
+    """生成并写出 base_path/manifest.json"""
+    manifest = build_manifest(base_path)
+    with open(os.path.join(base_path, MANIFEST_NAME), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    return manifest
+
+def load_manifest(base_path: str) -> Dict[str, Any]:
+    """读取清单，不存在时返回None"""
+    path = os.path.join(base_path, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as file:
+        manifest = json.load(file)
+    if manifest.get('version') != MANIFEST_VERSION:
+        print(f"Warning: 样本清单版本不匹配 {path}，请重新生成")
+        return None
+    return manifest
+
+def verify_manifest(base_path: str, manifest: Dict[str, Any]) -> Dict[str, str]:
+    """校验清单中的每个文件，返回 {逻辑名称: 问题描述}"""
+    problems = {}
+    for key, entry in manifest['samples'].items():
+        path = os.path.join(base_path, entry['file'])
+        if not os.path.exists(path):
+            problems[key] = "文件不存在"
+        elif file_checksum(path) != entry['checksum']:
+            problems[key] = "校验和不一致"
+    return problems
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="音源库样本清单")
+    parser.add_argument('command', choices=['build', 'verify'], help="build 生成清单 / verify 校验文件")
+    parser.add_argument('base_path', nargs='?', default='guitar_samples', help="音源库目录")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        manifest = write_manifest(args.base_path)
+        print(f"✅ 已写入 {len(manifest['samples'])} 个样本 → {os.path.join(args.base_path, MANIFEST_NAME)}")
+        return
+
+    manifest = load_manifest(args.base_path)
+    if manifest is None:
+        print(f"❌ 未找到样本清单: {os.path.join(args.base_path, MANIFEST_NAME)}")
+        return
+    problems = verify_manifest(args.base_path, manifest)
+    for key, problem in problems.items():
+        print(f"❌ {key}: {problem}")
+    print(f"{'✅' if not problems else '⚠️'} 校验 {len(manifest['samples'])} 个样本，{len(problems)} 个有问题")
+
+if __name__ == "__main__":
+    main()
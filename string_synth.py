@@ -0,0 +1,139 @@
+import re
+import numpy as np
+from typing import Any, Dict, List
+
+from audio_mixer import Voice
+
+NOTE_OFFSETS = {'C': -9, 'D': -7, 'E': -5, 'F': -4, 'G': -2, 'A': 0, 'B': 2}
+
+def note_frequency(name: str, octave: int = 4) -> float:
+    """音名 → 频率（A4 = 440Hz），如 "E2"、"F#3"、"Bb"；未写八度时使用 octave"""
+    match = re.fullmatch(r'([A-Ga-g])([#b]?)(-?\d+)?', name.strip())
+    if match is None:
+        raise ValueError(f"无法解析的音名: {name}")
+    letter, accidental, octave_text = match.groups()
+    semitone = NOTE_OFFSETS[letter.upper()] + {'#': 1, 'b': -1, '': 0}[accidental]
+    octave = int(octave_text) if octave_text is not None else octave
+    return 440.0 * 2 ** ((semitone + 12 * (octave - 4)) / 12)
+
+def tuning_frequencies(tuning: List[str]) -> List[float]:
+    """从低音弦到高音弦的空弦频率
+
+    未写八度的音名（如配置中的 "A"、"D"）取高于前一根弦的最近八度，
+    第一根弦未写八度时按第2八度处理。
+    """
+    frequencies = []
+    for name in tuning:
+        if re.search(r'\d', name) or not frequencies:
+            frequency = note_frequency(name, 2)
+        else:
+            frequency = note_frequency(name, 0)
+            while frequency <= frequencies[-1]:
+                frequency *= 2
+        frequencies.append(frequency)
+    return frequencies
+
+class KarplusStrongVoice(Voice):
+    """Karplus–Strong 拨弦合成声部
+
+    反馈回路 = 长度 N 的延迟线 + 固定的两点平均低通（损耗滤波，延迟0.5个采样）
+    + 一阶全通滤波（补足小数延迟 d，不改变幅度）：
+        u[n] = g · (y[n-N] + y[n-N-1]) / 2
+        y[n] = C·u[n] + u[n-1] - C·y[n-1]，  C = (1-d)/(1+d)
+    N + 0.5 + d = 采样率/频率，d 取在 [0.1, 1.1) 以保持全通相位平稳。
+    每块最多 N 个样本：低通部分一次向量运算，全通的一阶递推用对数步前缀扫描求解，
+    按块渲染时只需 ⌈块大小/N⌉ 次循环；每个声部的状态只有 N+2 个采样点（几KB）。
+    """
+
+    silence_level = 1e-4
+
+    def __init__(self, frequency: float, sample_rate: int = 44100, velocity: float = 0.8,
+                 damping: float = 0.3, sustain: float = 4.0, seed: int = None):
+        super().__init__(velocity)
+        period = sample_rate / frequency
+        self.delay = max(2, int(period - 0.6))
+        fraction = max(period - 0.5 - self.delay, 0.1)
+        self.allpass = (1.0 - fraction) / (1.0 + fraction)
+
+        # 衰减到 -60dB 的时长：damping 越大越短（手掌制音）
+        decay_time = max(0.05, sustain * (1.0 - damping))
+        self.gain = 10 ** (-3.0 / (frequency * decay_time))
+
+        # 激励：白噪声，力度越小用越长的滑动平均使音色越暗
+        rng = np.random.default_rng(seed)
+        noise = rng.uniform(-1.0, 1.0, self.delay + 1 + 2 * self.delay).astype(np.float32)
+        width = 1 + int(round((1.0 - velocity) * self.delay / 4))
+        if width > 1:
+            cumulative = np.cumsum(noise, dtype=np.float64)
+            noise = ((cumulative[width:] - cumulative[:-width]) / width).astype(np.float32)
+        excitation = noise[:self.delay + 1]
+        excitation -= excitation.mean()
+        self.history = excitation / max(float(np.abs(excitation).max()), 1e-6)
+        # 全通滤波的上一个输入 u[n-1]（上一个输出即 history[-1]）
+        self.allpass_input = np.float32(0.0)
+
+    def render(self, frames: int) -> np.ndarray:
+        out = np.empty(frames, dtype=np.float32)
+        history = self.history
+        half_gain = np.float32(self.gain * 0.5)
+        coefficient = np.float32(self.allpass)
+        previous_input = self.allpass_input
+        position = 0
+        while position < frames:
+            count = min(self.delay, frames - position)
+            lowpass = half_gain * (history[1:count + 1] + history[:count])
+            # 全通：x[k] = C·u[k] + u[k-1]，再解 y[k] = x[k] - C·y[k-1]
+            chunk = coefficient * lowpass
+            chunk[0] += previous_input - coefficient * history[-1]
+            chunk[1:] += lowpass[:-1]
+            factor = -coefficient
+            step = 1
+            while step < count:
+                chunk[step:] += factor * chunk[:-step]
+                factor *= factor
+                step *= 2
+            previous_input = lowpass[-1]
+            out[position:position + count] = chunk
+            history = np.concatenate([history[count:], chunk])
+            position += count
+        self.history = history
+        self.allpass_input = previous_input
+
+        if np.abs(history).max() < self.silence_level:
+            # 弦已基本停止振动：返回空块，由基类标记结束
+            return out[:0]
+        return out
+
+class StringSynth:
+    """按 guitar.tuning / guitar.frets 生成拨弦合成声部
+
+    弦号沿用吉他习惯：1 为最细的高音弦（tuning 的最后一项），guitar.strings 为最粗的低音弦。
+    """
+
+    def __init__(self, guitar_config: Dict[str, Any], sample_rate: int = 44100,
+                 synth_config: Dict[str, Any] = None):
+        synth_config = synth_config or {}
+        self.sample_rate = sample_rate
+        self.open_frequencies = tuning_frequencies(guitar_config.get('tuning', ["E2", "A", "D", "G", "B", "E4"]))
+        self.frets = guitar_config.get('frets', 20)
+        self.velocity = synth_config.get('velocity', 0.8)
+        self.damping = synth_config.get('damping', 0.3)
+        self.sustain = synth_config.get('sustain', 4.0)
+
+    @property
+    def strings(self) -> int:
+        return len(self.open_frequencies)
+
+    def frequency(self, string_number: int, fret: int) -> float:
+        if not 1 <= string_number <= self.strings:
+            raise ValueError(f"弦号超出范围: {string_number}")
+        if not 0 <= fret <= self.frets:
+            raise ValueError(f"品位超出范围: {fret}")
+        return self.open_frequencies[self.strings - string_number] * 2 ** (fret / 12)
+
+    def voice(self, string_number: int, fret: int, velocity: float = None,
+              damping: float = None) -> KarplusStrongVoice:
+        """创建一个拨弦声部"""
+        return KarplusStrongVoice(self.frequency(string_number, fret), self.sample_rate,
+                                  self.velocity if velocity is None else velocity,
+                                  self.damping if damping is None else damping, self.sustain)
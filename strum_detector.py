@@ -0,0 +1,121 @@
+import numpy as np
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+class StrumBuffer:
+    """单只手的带时间戳位置环形缓冲（手腕 + 五个指尖，归一化坐标）"""
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.points = np.zeros((capacity, 6, 2), dtype=np.float32)
+        self.index = 0
+        self.count = 0
+        # 已触发但仍在继续的扫弦方向，运动停止或反向前不再重复触发
+        self.locked = 0
+        # 早于该时刻的样本属于已触发的扫弦，不再参与检测
+        self.start_time = -np.inf
+
+    def push(self, timestamp: float, points: np.ndarray):
+        self.times[self.index] = timestamp
+        self.points[self.index] = points
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def window(self, start_time: float) -> Tuple[np.ndarray, np.ndarray]:
+        """按时间顺序返回 start_time 之后的样本"""
+        order = (np.arange(self.count) + self.index - self.count) % self.capacity
+        times = self.times[order]
+        keep = times >= start_time
+        return times[keep], self.points[order[keep]]
+
+class StrumDetector:
+    """基于速度的扫弦检测
+
+    对每只手保存最近 time_window 秒内的手腕与指尖位置，按时间戳计算竖直方向的位移、
+    速度和方向一致性，与帧率无关。config 中 speed_threshold 的单位是"像素/帧"，
+    按 reference_fps 换算为像素/秒；像素由归一化坐标乘以画面高度得到。
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        strum_config = (config or {}).get('gesture_recognition', {}).get('strumming', {})
+        reference_fps = strum_config.get('reference_fps', 30)
+        self.speed_threshold = strum_config.get('speed_threshold', 20) * reference_fps
+        self.min_movement = strum_config.get('min_movement', 30)
+        self.direction_threshold = strum_config.get('direction_threshold', 0.7)
+        self.time_window = strum_config.get('time_window', 0.5)
+        self.buffers: Dict[Hashable, StrumBuffer] = {}
+
+    def update(self, key: Hashable, analysis: Dict[str, Any], timestamp: float,
+               image_shape: Sequence[int]) -> Optional[Dict[str, Any]]:
+        """加入一只手的新位置，检测到扫弦时返回事件"""
+        if not analysis or not analysis.get('detected', False):
+            self.buffers.pop(key, None)
+            return None
+
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            buffer = self.buffers[key] = StrumBuffer()
+        buffer.push(timestamp, np.vstack([analysis['wrist'], list(analysis['finger_tips'].values())]))
+
+        return self.detect(buffer, timestamp, image_shape[0])
+
+    def detect(self, buffer: StrumBuffer, timestamp: float, image_height: int) -> Optional[Dict[str, Any]]:
+        """在时间窗口内判断是否构成一次扫弦"""
+        times, points = buffer.window(max(timestamp - self.time_window, buffer.start_time))
+        if len(times) < 2:
+            return None
+
+        # 手腕与指尖的竖直位置取平均（像素）
+        heights = points[:, :, 1].mean(axis=1) * image_height
+        steps = np.diff(heights)
+        travel = np.abs(steps).sum()
+        if travel <= 0:
+            return None
+
+        # 取最近一段同方向的连续运动作为本次扫弦（小于1像素的抖动视为静止）
+        sign = np.sign(heights[-1] - heights[0])
+        if sign == 0:
+            return None
+        moving = np.sign(np.where(np.abs(steps) < 1.0, 0.0, steps)) == sign
+        if buffer.locked:
+            if buffer.locked == sign and moving[-1]:
+                return None
+            # 上一次扫弦已结束，从转折点开始重新检测
+            buffer.locked = 0
+            buffer.start_time = times[-2]
+            return self.detect(buffer, timestamp, image_height)
+        moving_steps = np.nonzero(moving)[0]
+        if len(moving_steps) == 0:
+            return None
+        end = moving_steps[-1] + 1
+        stopped = np.nonzero(~moving[:end])[0]
+        start = stopped[-1] + 1 if len(stopped) else 0
+
+        movement = abs(heights[end] - heights[start])
+        duration = times[end] - times[start]
+        consistency = abs(heights[-1] - heights[0]) / travel
+        if movement < self.min_movement or duration <= 0 or consistency < self.direction_threshold:
+            return None
+
+        speed = movement / duration
+        if speed < self.speed_threshold:
+            return None
+
+        # 一次扫弦只触发一次
+        buffer.locked = sign
+        buffer.start_time = times[end]
+        return {
+            'direction': "downstroke" if sign > 0 else "upstroke",
+            'speed': float(speed),
+            'movement': float(movement),
+            'onset': float(times[start]),
+            'time': float(timestamp)
+        }
+
+    def prune(self, keys: Sequence[Hashable]):
+        """清除给定手的状态（通常为 HandIdentityTracker.expired_ids）"""
+        for key in keys:
+            self.buffers.pop(key, None)
+
+    def reset(self):
+        self.buffers.clear()
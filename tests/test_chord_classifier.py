@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from chord_classifier import ChordClassifier, POSITION_BANDS
+
+HIGH, MIDDLE, LOW = range(len(POSITION_BANDS))
+
+def mask(*fingers):
+    return int(ChordClassifier.finger_mask([finger in fingers for finger in ('index', 'middle', 'ring', 'pinky')]))
+
+def test_exact_fingers_take_precedence_over_count():
+    """确切手指组合优先于按数量匹配，与在表中的先后顺序无关"""
+    classifier = ChordClassifier([
+        {'chord': 'C_major', 'count': 2, 'position': 'high'},
+        {'chord': 'Power', 'fingers': ['index', 'pinky'], 'position': 'high'},
+    ])
+    assert classifier.lookup(mask('index', 'pinky'), HIGH) == 'Power'
+    assert classifier.lookup(mask('index', 'middle'), HIGH) == 'C_major'
+    assert classifier.lookup(mask('ring', 'pinky'), HIGH) == 'C_major'
+
+def test_position_bands():
+    """默认和弦表：同样的手指数按位置档区分和弦，中间档没有规则"""
+    classifier = ChordClassifier()
+    two = mask('index', 'middle')
+    assert classifier.lookup(two, HIGH) == 'C_major'
+    assert classifier.lookup(two, LOW) == 'G_major'
+    assert classifier.lookup(two, MIDDLE) == 'unknown'
+    assert classifier.lookup(mask('index', 'middle', 'ring', 'pinky'), LOW) == 'F_major'
+    assert classifier.lookup(mask(), HIGH) == 'unknown'
+
+def test_handedness():
+    """指定左右手的规则只匹配该手，未知的手只匹配 hand 为 any 的规则"""
+    classifier = ChordClassifier([
+        {'chord': 'D_major', 'count': 3, 'position': 'high', 'hand': 'Left'},
+        {'chord': 'A_minor', 'count': 3, 'position': 'high', 'hand': 'Right'},
+        {'chord': 'E_minor', 'count': 4, 'position': 'any'},
+    ])
+    three = mask('index', 'middle', 'ring')
+    assert classifier.lookup(three, HIGH, 'Left') == 'D_major'
+    assert classifier.lookup(three, HIGH, 'Right') == 'A_minor'
+    assert classifier.lookup(three, HIGH, None) == 'unknown'
+    four = mask('index', 'middle', 'ring', 'pinky')
+    for hand in ('Left', 'Right', None):
+        for band in (HIGH, MIDDLE, LOW):
+            assert classifier.lookup(four, band, hand) == 'E_minor'
+
+def test_classify_matches_lookup():
+    """批量识别与逐只查表结果一致"""
+    classifier = ChordClassifier()
+    rng = np.random.default_rng(0)
+    states = rng.random((50, 4)) > 0.5
+    bands = rng.integers(0, len(POSITION_BANDS), 50)
+    hands = rng.choice(['Left', 'Right'], 50)
+    result = classifier.classify(states, bands, hands)
+    masks = ChordClassifier.finger_mask(states)
+    assert result.tolist() == [classifier.lookup(int(m), int(b), h) for m, b, h in zip(masks, bands, hands)]
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError):
+        ChordClassifier([{'chord': 'X', 'fingers': ['thumb']}])
+    with pytest.raises(ValueError):
+        ChordClassifier([{'chord': 'X', 'count': 2, 'position': 'top'}])
+    with pytest.raises(ValueError):
+        ChordClassifier([{'chord': 'X'}])
@@ -0,0 +1,58 @@
+from gesture_stability import HandStability, StabilityEngine
+
+C_FINGERS = [1, 1, 0, 0]
+D_FINGERS = [1, 1, 1, 0]
+
+def analysis(chord, x=0.5, y=0.3, fingers=C_FINGERS):
+    states = dict(zip(('index', 'middle', 'ring', 'pinky'), map(bool, fingers)))
+    return {
+        'detected': True,
+        'gesture': chord,
+        'bounding_box': {'x_min': x - 0.1, 'x_max': x + 0.1, 'y_min': y - 0.1, 'y_max': y + 0.1},
+        'hand_features': {'finger_states': states}
+    }
+
+def test_chord_confirmed_after_min_frames():
+    """候选和弦连续出现 min_frames 帧后才确认"""
+    hand = HandStability(min_frames=3, position_variance=0.1, finger_variance=0.15)
+    assert hand.update('C_major', (0.5, 0.3), C_FINGERS) == 'unknown'
+    assert hand.update('C_major', (0.5, 0.3), C_FINGERS) == 'unknown'
+    assert hand.update('C_major', (0.5, 0.3), C_FINGERS) == 'C_major'
+
+def test_single_frame_jitter_keeps_stable_chord():
+    """单帧误识别不会切换和弦，新和弦同样需要连续确认"""
+    hand = HandStability(min_frames=3, position_variance=0.1, finger_variance=0.15)
+    for _ in range(3):
+        hand.update('C_major', (0.5, 0.3), C_FINGERS)
+    assert hand.update('D_major', (0.5, 0.3), D_FINGERS) == 'C_major'
+    assert hand.update('C_major', (0.5, 0.3), C_FINGERS) == 'C_major'
+    for _ in range(2):
+        assert hand.update('D_major', (0.5, 0.3), D_FINGERS) == 'C_major'
+    assert hand.update('D_major', (0.5, 0.3), D_FINGERS) == 'D_major'
+
+def test_moving_hand_is_not_confirmed():
+    """手部位置方差超过阈值时不确认"""
+    hand = HandStability(min_frames=3, position_variance=0.001, finger_variance=0.15)
+    for x in (0.1, 0.5, 0.9, 0.1, 0.5):
+        assert hand.update('C_major', (x, 0.3), C_FINGERS) == 'unknown'
+
+def test_engine_tracks_hands_by_key_and_prunes():
+    """按手的ID维护状态：一只手的确认不影响另一只，prune 后重新计数"""
+    config = {'gesture_recognition': {'stability': {'min_frames': 2}}}
+    engine = StabilityEngine(config)
+    for _ in range(2):
+        frame = engine.apply([analysis('C_major'), analysis('D_major', x=0.8, fingers=D_FINGERS)], keys=[7, 9])
+    assert [hand['gesture'] for hand in frame] == ['C_major', 'D_major']
+    assert all(hand['stable'] for hand in frame)
+
+    engine.prune([7])
+    frame = engine.apply([analysis('C_major')], keys=[7])
+    assert frame[0]['gesture'] == 'unknown'
+    assert frame[0]['raw_gesture'] == 'C_major'
+    assert not frame[0]['stable']
+
+def test_disabled_engine_passes_results_through():
+    engine = StabilityEngine({'gesture_recognition': {'stability': {'enable': False}}})
+    frame = engine.apply([analysis('C_major')])
+    assert frame[0]['gesture'] == 'C_major'
+    assert 'raw_gesture' not in frame[0]
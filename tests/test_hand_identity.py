@@ -0,0 +1,49 @@
+import pytest
+
+import hand_identity
+from hand_identity import HandIdentityTracker
+
+def hand(x, y, hand_type):
+    return {
+        'detected': True,
+        'hand_type': hand_type,
+        'bounding_box': {'x_min': x - 0.05, 'x_max': x + 0.05, 'y_min': y - 0.05, 'y_max': y + 0.05}
+    }
+
+@pytest.fixture(params=['scipy', 'permutations'])
+def tracker(request, monkeypatch):
+    """分别用匈牙利算法与枚举排列求解配对"""
+    if request.param == 'permutations':
+        monkeypatch.setattr(hand_identity, 'linear_sum_assignment', None)
+    elif hand_identity.linear_sum_assignment is None:
+        pytest.skip("未安装 scipy")
+    return HandIdentityTracker()
+
+def test_ids_follow_hands_when_detection_order_swaps(tracker):
+    """检测结果的先后顺序互换时，ID 跟随手的位置而不是列表下标"""
+    first = tracker.assign([hand(0.2, 0.5, 'Right'), hand(0.8, 0.5, 'Left')], 0.0)
+    second = tracker.assign([hand(0.81, 0.5, 'Left'), hand(0.21, 0.5, 'Right')], 1 / 30)
+    assert second == first[::-1]
+
+def test_ids_survive_handedness_label_swap(tracker):
+    """左右手标签在一帧中互换（MediaPipe 常见误判）时，位置接近的配对仍然保留 ID"""
+    first = tracker.assign([hand(0.2, 0.5, 'Right'), hand(0.8, 0.5, 'Left')], 0.0)
+    second = tracker.assign([hand(0.2, 0.5, 'Left'), hand(0.8, 0.5, 'Right')], 1 / 30)
+    assert second == first
+
+def test_crossing_hands_keep_ids_with_velocity_prediction(tracker):
+    """两只手相向移动：按恒速预测配对，不会在靠近时交换 ID"""
+    step = 0.04
+    ids = tracker.assign([hand(0.3, 0.5, 'Right'), hand(0.7, 0.5, 'Left')], 0.0)
+    for frame in range(1, 5):
+        offset = step * frame
+        current = tracker.assign([hand(0.3 + offset, 0.5, 'Right'), hand(0.7 - offset, 0.5, 'Left')], frame / 30)
+        assert current == ids
+
+def test_far_detection_gets_new_id_and_old_track_expires(tracker):
+    """超过 max_distance 的检测是新手；超过 max_age 未出现的手记入 expired_ids"""
+    (old_id,) = tracker.assign([hand(0.1, 0.1, 'Right')], 0.0)
+    (new_id,) = tracker.assign([hand(0.9, 0.9, 'Right')], 0.3)
+    assert new_id != old_id
+    assert tracker.assign([hand(0.9, 0.9, 'Right')], 0.6) == [new_id]
+    assert tracker.expired_ids == [old_id]
@@ -0,0 +1,47 @@
+from strum_detector import StrumDetector
+
+IMAGE_SHAPE = (480, 640)
+FPS = 30.0
+
+def hand_at(y):
+    return {
+        'detected': True,
+        'wrist': (0.5, y),
+        'finger_tips': {finger: (0.5, y - 0.1) for finger in ('thumb', 'index', 'middle', 'ring', 'pinky')}
+    }
+
+def sweep(detector, start_y, end_y, frames, start_frame, key=0):
+    """以固定帧率把手从 start_y 移到 end_y，返回检测到的扫弦方向"""
+    events = []
+    for i in range(frames + 1):
+        y = start_y + (end_y - start_y) * i / frames
+        event = detector.update(key, hand_at(y), (start_frame + i) / FPS, IMAGE_SHAPE)
+        if event is not None:
+            events.append(event['direction'])
+    return events, start_frame + frames + 1
+
+def test_alternating_strokes_each_trigger_once():
+    """下扫、上扫、下扫交替：每一扫只触发一次，方向与运动一致"""
+    detector = StrumDetector()
+    events, frame = sweep(detector, 0.2, 0.7, 8, 0)
+    assert events == ['downstroke']
+    more, frame = sweep(detector, 0.7, 0.2, 8, frame)
+    events += more
+    more, frame = sweep(detector, 0.2, 0.7, 8, frame)
+    events += more
+    assert events == ['downstroke', 'upstroke', 'downstroke']
+
+def test_slow_movement_is_not_a_strum():
+    """速度低于阈值的移动不触发"""
+    detector = StrumDetector()
+    events, _ = sweep(detector, 0.2, 0.7, 120, 0)
+    assert events == []
+
+def test_hands_are_detected_independently_and_pruned():
+    """每只手独立检测，prune 清除对应的缓冲"""
+    detector = StrumDetector()
+    events, _ = sweep(detector, 0.2, 0.7, 8, 0, key='left')
+    assert events == ['downstroke']
+    assert 'left' in detector.buffers
+    detector.prune(['left'])
+    assert 'left' not in detector.buffers
@@ -0,0 +1,59 @@
+import numpy as np
+
+from audio_mixer import SampleVoice, VoicePool
+
+def tone(volume=1.0, group=None, frames=44100):
+    voice = SampleVoice(np.full(frames, 0.5, dtype=np.float32), volume)
+    voice.group = group
+    return voice
+
+def test_quietest_voice_is_stolen_when_full():
+    """槽位已满时抢占电平最低的声部，被抢占的声部淡出而不是立即结束"""
+    pool = VoicePool(max_voices=2, fade_frames=100)
+    loud, quiet, new = tone(1.0), tone(0.2), tone(1.0)
+    pool.add(loud, 0)
+    pool.add(quiet, 0)
+    pool.add(new, 10)
+    assert pool.stolen == 1
+    assert set(pool.slots) == {loud, new}
+    assert pool.releasing == [quiet]
+    assert quiet.releasing and not quiet.finished
+
+def test_oldest_voice_is_stolen_at_equal_level():
+    """电平相同时先抢占最老的声部"""
+    pool = VoicePool(max_voices=2, steal_age=1000)
+    old, young = tone(), tone()
+    pool.add(old, 0)
+    pool.add(young, 5000)
+    pool.add(tone(), 6000)
+    assert old not in pool.slots
+    assert young in pool.slots
+
+def test_same_group_chokes_previous_voice():
+    """同一根弦重新拨响时旧声部淡出，其他弦不受影响"""
+    pool = VoicePool(max_voices=4, fade_frames=100)
+    first, other, second = tone(group=1), tone(group=2), tone(group=1)
+    pool.add(first, 0)
+    pool.add(other, 0)
+    pool.add(second, 10)
+    assert pool.choked == 1
+    assert pool.stolen == 0
+    assert pool.active_count == 2
+    assert first in pool.releasing and first not in pool.slots
+    assert other in pool.slots and second in pool.slots
+
+def test_released_voices_finish_after_fade_and_are_collected():
+    """淡出结束后声部被回收；淡出列表不超过 max_voices"""
+    pool = VoicePool(max_voices=2, fade_frames=64)
+    for _ in range(6):
+        pool.add(tone(group=1), 0)
+    assert pool.choked == 5
+    assert len(pool.releasing) <= pool.max_voices
+
+    out = np.zeros((128, 1), dtype=np.float32)
+    for voice in list(pool):
+        voice.mix_into(out)
+    pool.collect()
+    assert pool.releasing == []
+    assert pool.active_count == 1
+    assert len(list(pool)) == 1